@@ -1,18 +1,97 @@
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from ..core.dependencies import get_db
-from ..services.ingestion_service import import_ado_dump
+from ..services.import_job_service import get_import_job, submit_import_job
+from ..services.ingestion_service import (
+    DEFAULT_IMPORT_ENGINE,
+    IMPORT_CHUNK_ROWS,
+    SUPPORTED_EXTENSIONS,
+    check_import_engine,
+    import_ado_stream,
+    preview_ado_import,
+)
 
 router = APIRouter(prefix="", tags=["import"])
 
+# Copy buffer used when spooling an upload to disk
+SPOOL_BLOCK_SIZE = 1024 * 1024
+
+
+def _spool_upload(file: UploadFile) -> str:
+    """Copy an upload to a named temp file in fixed-size blocks; return its path."""
+    suffix = os.path.splitext(file.filename or "")[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(file.file, tmp, SPOOL_BLOCK_SIZE)
+    return tmp.name
+
 
 @router.post("/import")
-async def import_ado(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    content = await file.read()
+async def import_ado(
+    file: UploadFile = File(...),
+    chunk_rows: int = Query(IMPORT_CHUNK_ROWS, ge=1),
+    wait: bool = Query(False, description="Ingest inside the request instead of as a background job"),
+    dry_run: bool = Query(False, description="Return the changes the import would make; write nothing"),
+    force: bool = Query(False, description="Re-import even if this exact file was imported before"),
+    engine: Optional[str] = Query(
+        None,
+        pattern="^(orm|copy)$",
+        description="Write engine; 'copy' uses PostgreSQL COPY + merge (defaults to IMPORT_ENGINE)",
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Spool an ADO export to disk and ingest it in chunks.
+
+    By default the import runs as a background job and this returns 202 with
+    the job to poll at GET /import/jobs/{job_id}.  ``wait=true`` ingests in a
+    worker thread and returns the final counts instead.  ``dry_run=true``
+    returns the diff preview and writes nothing.
+    """
+    engine = engine or DEFAULT_IMPORT_ENGINE
+    if not (file.filename or "").lower().endswith(SUPPORTED_EXTENSIONS):
+        raise HTTPException(
+            status_code=400, detail="Only CSV, JSON, Excel, Parquet or Arrow IPC supported"
+        )
     try:
-        ingested = import_ado_dump(content, file.filename, db)
+        check_import_engine(db, engine)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    path = await run_in_threadpool(_spool_upload, file)
+    if dry_run:
+        try:
+            return await run_in_threadpool(preview_ado_import, path, file.filename, db)
+        except Exception as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        finally:
+            os.unlink(path)
+
+    if not wait:
+        job = submit_import_job(path, file.filename, chunk_rows, force, engine)
+        return JSONResponse(status_code=202, content=job)
+
+    try:
+        return await run_in_threadpool(
+            import_ado_stream, path, file.filename, db, chunk_rows, None, force, engine
+        )
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc))
+    finally:
+        os.unlink(path)
+
 
-    return {"ingested": ingested}
+@router.get("/import/jobs/{job_id}")
+def import_job_status(job_id: str):
+    """Return state, rows processed, counts, errors and duration of an import job."""
+    job = get_import_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
@@ -19,6 +19,7 @@ from ..services.project_service import (
     list_projects, create_project, get_project_detail, update_project, delete_project,
     list_sprints, create_sprint, update_sprint, activate_sprint, complete_sprint, delete_sprint,
 )
+from ..services.flow_service import get_sprint_burndown
 
 router = APIRouter(prefix="", tags=["projects"])
 
@@ -162,6 +163,18 @@ def del_sprint(sprint_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail=str(exc))
 
 
+@router.get("/sprints/{sprint_id}/burndown")
+def get_burndown(sprint_id: int, db: Session = Depends(get_db)):
+    """Daily ideal / remaining / completed / scope series rebuilt from task history."""
+    try:
+        burndown = get_sprint_burndown(db, sprint_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if burndown is None:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    return burndown
+
+
 # ── Roles ─────────────────────────────────────────────────────────────────────
 from ..models.user import ProjectRole as ProjectRoleModel
 
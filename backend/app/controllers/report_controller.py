@@ -1,28 +1,172 @@
-from datetime import date
+from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ..core.dependencies import get_db
+from ..core.responses import FastJSONResponse
+from ..schemas.report import DashboardRead, ReportScope
 from ..services.report_service import (
+    MAX_SUMMARY_PAGE_SIZE,
+    SUMMARY_PAGE_SIZE,
+    get_cumulative_flow,
     get_daily_report,
+    get_dashboard,
     get_weekly_report,
+    get_weekly_task_summaries,
     get_monthly_report,
+    get_report_cache_stats,
 )
+from ..services.export_service import stream_report_csv
+from ..services.forecast_service import (
+    FORECAST_TRIALS,
+    HISTORY_DAYS,
+    MAX_FORECAST_TRIALS,
+    get_delivery_forecast,
+)
+from ..services.snapshot_service import get_board_snapshots
 
-router = APIRouter(prefix="/reports", tags=["reports"])
+# Reports are plain dicts built by report_service; FastJSONResponse writes
+# them with orjson instead of running them through jsonable_encoder.
+router = APIRouter(prefix="/reports", tags=["reports"], default_response_class=FastJSONResponse)
 
 
 @router.get("/daily")
-def daily(report_date: date | None = None, db: Session = Depends(get_db)):
-    return get_daily_report(db, report_date)
+def daily(
+    report_date: date | None = None,
+    scope: ReportScope = Depends(),
+    db: Session = Depends(get_db),
+):
+    return FastJSONResponse(get_daily_report(db, report_date, scope))
 
 
 @router.get("/weekly")
-def weekly(week_start: date | None = None, db: Session = Depends(get_db)):
-    return get_weekly_report(db, week_start)
+def weekly(
+    week_start: date | None = None,
+    include_summaries: bool = True,
+    scope: ReportScope = Depends(),
+    db: Session = Depends(get_db),
+):
+    return FastJSONResponse(get_weekly_report(db, week_start, include_summaries, scope))
+
+
+@router.get("/weekly/tasks")
+def weekly_tasks(
+    week_start: date | None = None,
+    cursor: int | None = None,
+    limit: int = Query(SUMMARY_PAGE_SIZE, ge=1, le=MAX_SUMMARY_PAGE_SIZE),
+    fields: str | None = Query(None, description="comma-separated summary keys"),
+    scope: ReportScope = Depends(),
+    db: Session = Depends(get_db),
+):
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    try:
+        page = get_weekly_task_summaries(db, week_start, cursor, limit, field_list, scope)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return FastJSONResponse(page)
 
 
 @router.get("/monthly")
-def monthly(month_start: date | None = None, db: Session = Depends(get_db)):
-    return get_monthly_report(db, month_start)
+def monthly(
+    month_start: date | None = None,
+    scope: ReportScope = Depends(),
+    db: Session = Depends(get_db),
+):
+    return FastJSONResponse(get_monthly_report(db, month_start, scope))
+
+
+@router.get("/dashboard", response_model=DashboardRead)
+def dashboard(
+    parts: str | None = Query(None, description="comma-separated: daily,weekly,monthly,tasks"),
+    report_date: date | None = None,
+    week_start: date | None = None,
+    month_start: date | None = None,
+    include_summaries: bool = False,
+    scope: ReportScope = Depends(),
+    db: Session = Depends(get_db),
+):
+    part_list = [p.strip() for p in parts.split(",") if p.strip()] if parts else None
+    try:
+        return FastJSONResponse(get_dashboard(
+            db, part_list, report_date, week_start, month_start, include_summaries, scope
+        ))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.get("/cfd")
+def cfd(
+    start: date | None = None,
+    end: date | None = None,
+    bucket: str = "day",
+    scope: ReportScope = Depends(),
+    db: Session = Depends(get_db),
+):
+    try:
+        return FastJSONResponse(get_cumulative_flow(db, start, end, bucket, scope))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.get("/forecast")
+def forecast(
+    backlog: float | None = None,
+    epic_id: str | None = None,
+    unit: str = "tasks",
+    history_days: int = Query(HISTORY_DAYS, ge=7, le=730),
+    trials: int = Query(FORECAST_TRIALS, ge=1000, le=MAX_FORECAST_TRIALS),
+    start: date | None = None,
+    scope: ReportScope = Depends(),
+    db: Session = Depends(get_db),
+):
+    try:
+        result = get_delivery_forecast(
+            db, backlog, epic_id, unit, history_days, trials, start, scope
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if result is None:
+        raise HTTPException(status_code=404, detail="Epic not found")
+    return FastJSONResponse(result)
+
+
+@router.get("/cache/stats")
+def cache_stats():
+    return get_report_cache_stats()
+
+
+@router.get("/snapshots")
+def snapshots(
+    start: date | None = None,
+    end: date | None = None,
+    project_id: int | None = None,
+    sprint_id: int | None = None,
+    db: Session = Depends(get_db),
+):
+    end = end or date.today()
+    start = start or end - timedelta(days=29)
+    try:
+        return FastJSONResponse(get_board_snapshots(db, start, end, project_id, sprint_id))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.get("/{report}/csv")
+def report_csv(
+    report: str,
+    section: str,
+    report_date: date | None = Query(None, description="the report's day, week start or month start"),
+    scope: ReportScope = Depends(),
+    db: Session = Depends(get_db),
+):
+    try:
+        chunks = stream_report_csv(db, report, section, report_date, scope)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={report}_{section}.csv"},
+    )
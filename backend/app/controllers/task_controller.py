@@ -3,16 +3,22 @@ from typing import Optional
 
 import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from ..core.dependencies import get_db
-from ..repositories.task_repository import get_all_tasks, get_work_items
+from ..core.responses import FastJSONResponse
+from ..repositories.task_repository import get_all_tasks, work_item_filters
 from ..schemas.task import TaskRead, WorkItemCreate, WorkItemUpdate
 from ..schemas.task_update import TaskUpdateRequest, TaskUpdateRead
+from ..services.export_service import columnar_media_type, export_columnar, stream_csv
 from ..services.task_service import (
+    MAX_TASK_PAGE_SIZE,
+    list_task_page,
+    task_list_fields,
     update_task_status,
     get_task_updates,
+    get_work_item,
     create_work_item,
     delete_work_item,
     update_work_item,
@@ -20,11 +26,45 @@ from ..services.task_service import (
 
 router = APIRouter(prefix="", tags=["tasks"])
 
+_FIELDS_HELP = "comma-separated TaskRead fields and/or a preset: board, backlog, mobile"
+
+
+def _task_list_response(
+    db: Session,
+    filters: list,
+    fields: Optional[str],
+    sort: Optional[str],
+    cursor: Optional[str],
+    limit: Optional[int],
+    search: Optional[str] = None,
+) -> Response:
+    """
+    List body plus the next page's cursor in X-Next-Cursor (absent on the
+    last page).  Only the requested columns are selected and serialised,
+    skipping model validation.
+    """
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    try:
+        columns = task_list_fields(field_list)
+        rows, next_cursor = list_task_page(db, columns, filters, sort, cursor, limit, search)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return FastJSONResponse(rows, headers=headers)
+
 
 # ── Legacy / import-compatible list ──────────────────────────────────────────
 @router.get("/tasks", response_model=list[TaskRead])
-def list_tasks(db: Session = Depends(get_db)):
-    return get_all_tasks(db)
+def list_tasks(
+    fields: Optional[str] = Query(None, description=_FIELDS_HELP),
+    sort: Optional[str] = Query(
+        None, description="id (default), priority or updated_at; prefix - for descending"
+    ),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_TASK_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    return _task_list_response(db, [], fields, sort, cursor, limit)
 
 
 # ── Filtered work items list (used by new UI) ─────────────────────────────────
@@ -35,9 +75,27 @@ def list_work_items(
     assigned_to: Optional[str] = Query(None),
     sprint: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description=_FIELDS_HELP),
+    sort: Optional[str] = Query(
+        None,
+        description="id, priority or updated_at (prefix - for descending) or relevance; "
+                    "defaults to relevance with a search, id otherwise",
+    ),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_TASK_PAGE_SIZE),
     db: Session = Depends(get_db),
 ):
-    return get_work_items(db, work_item_type, state, assigned_to, sprint, search)
+    filters = work_item_filters(work_item_type, state, assigned_to, sprint, search)
+    return _task_list_response(db, filters, fields, sort, cursor, limit, search)
+
+
+# ── Get work item ─────────────────────────────────────────────────────────────
+@router.get("/workitems/{task_id}", response_model=TaskRead)
+def get_item(task_id: str, db: Session = Depends(get_db)):
+    item = get_work_item(db, task_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Work item not found")
+    return item
 
 
 # ── Create work item ──────────────────────────────────────────────────────────
@@ -76,6 +134,51 @@ def list_task_updates(task_id: str, db: Session = Depends(get_db)):
     return get_task_updates(db, task_id)
 
 
+# ── Columnar exports (Parquet / Arrow IPC) ────────────────────────────────────
+def _columnar_response(db: Session, dataset: str, fmt: str) -> Response:
+    content = export_columnar(db, dataset, fmt)
+    media = columnar_media_type(fmt)
+    return Response(
+        content,
+        media_type=media["media_type"],
+        headers={"Content-Disposition": f"attachment; filename={dataset}.{media['extension']}"},
+    )
+
+
+@router.get("/export/parquet")
+def export_parquet(
+    dataset: str = Query("tasks", pattern="^(tasks|updates)$"),
+    db: Session = Depends(get_db),
+):
+    return _columnar_response(db, dataset, "parquet")
+
+
+@router.get("/export/arrow")
+def export_arrow(
+    dataset: str = Query("tasks", pattern="^(tasks|updates)$"),
+    db: Session = Depends(get_db),
+):
+    return _columnar_response(db, dataset, "arrow")
+
+
+# ── Streaming CSV export (constant memory, same filters as /workitems) ───────
+@router.get("/export/csv")
+def export_csv(
+    dataset: str = Query("tasks", pattern="^(tasks|updates)$"),
+    work_item_type: Optional[str] = Query(None),
+    state: Optional[str] = Query(None),
+    assigned_to: Optional[str] = Query(None),
+    sprint: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+):
+    filters = work_item_filters(work_item_type, state, assigned_to, sprint, search)
+    return StreamingResponse(
+        stream_csv(dataset, filters),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={dataset}.csv"},
+    )
+
+
 # ── Excel export ──────────────────────────────────────────────────────────────
 @router.get("/export/excel")
 def export_excel(db: Session = Depends(get_db)):
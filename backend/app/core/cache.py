@@ -0,0 +1,75 @@
+"""
+In-process result caching.
+
+LRUCache is a small thread-safe, size-bounded cache with hit/miss counters.
+The task write counter is bumped by every path that writes tasks or task
+history in this process; cache keys include it (together with a database
+check for writes made by other processes) so stale entries are never served
+and simply age out of the LRU.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class LRUCache:
+    """Least-recently-used cache holding at most ``maxsize`` entries."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        value = compute()   # outside the lock: a slow report must not block hits
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_task_writes = 0
+_task_writes_lock = threading.Lock()
+
+
+def bump_task_writes() -> None:
+    """Record that tasks or task history changed; call after the commit."""
+    global _task_writes
+    with _task_writes_lock:
+        _task_writes += 1
+
+
+def task_writes() -> int:
+    """Number of task writes committed by this process."""
+    return _task_writes
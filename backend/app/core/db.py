@@ -78,8 +78,71 @@ def run_migrations() -> None:
         "area_path":   "ALTER TABLE tasks ADD COLUMN area_path VARCHAR",
         "project_id":  "ALTER TABLE tasks ADD COLUMN project_id INTEGER",
         "sprint_id":   "ALTER TABLE tasks ADD COLUMN sprint_id INTEGER",
+        "content_hash": "ALTER TABLE tasks ADD COLUMN content_hash VARCHAR",
     }
     with engine.begin() as conn:
         for col, sql in new_columns.items():
             if col not in existing:
                 conn.execute(text(sql))
+
+    # Report windows filter on these dates; max(updated_at) versions the report
+    # cache through ix_tasks_updated_at_id.
+    # (sort column, id) pairs back the keyset-paginated work item lists.
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("tasks")}
+    new_indexes = {
+        "ix_tasks_activated_date": "CREATE INDEX ix_tasks_activated_date ON tasks (activated_date)",
+        "ix_tasks_closed_date":    "CREATE INDEX ix_tasks_closed_date ON tasks (closed_date)",
+        "ix_tasks_update_date":    "CREATE INDEX ix_tasks_update_date ON tasks (update_date)",
+        "ix_tasks_priority_id":    "CREATE INDEX ix_tasks_priority_id ON tasks (priority, id)",
+        "ix_tasks_updated_at_id":  "CREATE INDEX ix_tasks_updated_at_id ON tasks (updated_at, id)",
+    }
+    with engine.begin() as conn:
+        for name, sql in new_indexes.items():
+            if name not in existing_indexes:
+                conn.execute(text(sql))
+        # Redundant with the leading column of ix_tasks_updated_at_id
+        if "ix_tasks_updated_at" in existing_indexes:
+            conn.execute(text("DROP INDEX ix_tasks_updated_at"))
+
+    # Work item search: a generated, weighted tsvector column and pg_trgm for
+    # partial task ids.  PostgreSQL only; without pg_trgm the id match still
+    # works, unindexed.
+    if engine.dialect.name == "postgresql":
+        from ..repositories.task_repository import SEARCH_DOCUMENT_SQL
+
+        # The column comment records the document it was generated from, so a
+        # changed SEARCH_DOCUMENT_SQL rebuilds the column (and its index)
+        built_from = None
+        if "search_vector" in existing:
+            with engine.connect() as conn:
+                built_from = conn.execute(text(
+                    "SELECT col_description('tasks'::regclass, attnum) FROM pg_attribute "
+                    "WHERE attrelid = 'tasks'::regclass AND attname = 'search_vector'"
+                )).scalar()
+        if built_from != SEARCH_DOCUMENT_SQL:
+            print("Adding column search_vector to tasks table...")
+            with engine.begin() as conn:
+                conn.execute(text("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector"))
+                conn.execute(text(
+                    f"ALTER TABLE tasks ADD COLUMN search_vector tsvector "
+                    f"GENERATED ALWAYS AS ({SEARCH_DOCUMENT_SQL}) STORED"
+                ))
+                quoted = SEARCH_DOCUMENT_SQL.replace("'", "''")
+                conn.execute(text(f"COMMENT ON COLUMN tasks.search_vector IS '{quoted}'"))
+            existing_indexes.discard("ix_tasks_search")
+        search_indexes = {
+            "ix_tasks_search": "CREATE INDEX ix_tasks_search ON tasks USING gin (search_vector)",
+            "ix_tasks_task_id_trgm": (
+                "CREATE INDEX ix_tasks_task_id_trgm ON tasks USING gin (task_id gin_trgm_ops)"
+            ),
+        }
+        for name, sql in search_indexes.items():
+            if name in existing_indexes:
+                continue
+            try:
+                with engine.begin() as conn:
+                    if name == "ix_tasks_task_id_trgm":
+                        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                    conn.execute(text(sql))
+            except Exception as exc:
+                print(f"Skipping index {name}: {exc}")
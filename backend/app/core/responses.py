@@ -0,0 +1,39 @@
+"""
+Fast JSON responses.
+
+Returning FastJSONResponse(content) from an endpoint skips FastAPI's
+response_model validation and jsonable_encoder pass; orjson writes the plain
+dicts / lists directly.  Dates and datetimes are written in ISO format, numpy
+arrays and scalars are supported and NaN becomes null.  Keep response_model
+on the route for the OpenAPI schema.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types orjson does not write natively (pandas / numpy scalars, Decimal)."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialise ``content`` the way FastJSONResponse does."""
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -11,8 +11,8 @@ from .controllers.retrospective_controller import router as retrospective_router
 from .controllers.team_controller import router as team_router
 from .controllers.user_controller import router as user_router
 
-run_migrations()                        # add any new columns to existing DB
 Base.metadata.create_all(bind=engine)  # create tables if they don't exist yet
+run_migrations()                        # add new columns / indexes (also to freshly created tables)
 
 app = FastAPI(title="Scrum Update Tracking System")
 
@@ -34,7 +34,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PATCH", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization", "X-Requested-With"],
-    expose_headers=["Content-Range", "X-Content-Range"],
+    expose_headers=["Content-Range", "X-Content-Range", "X-Next-Cursor"],
     max_age=3600,
 )
 
@@ -3,5 +3,8 @@ from .team_member import TeamMember
 from .retrospective import Retrospective
 from .user import User, ProjectRole
 from .task import Task, TaskUpdate
+from .import_file import ImportFile
+from .import_job import ImportJob
+from .board_snapshot import BoardSnapshot
 from .config import AppConfig
 from .team import Team, TeamMembership, ProjectTeam
@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Date, Float, DateTime
+from ..core.base import Base
+
+
+class BoardSnapshot(Base):
+    """
+    End-of-day board totals: one row per (day, project, sprint, state).
+    Filled by scripts/snapshot_board.py; read by historical reports so they
+    do not rescan tasks / task_updates.
+    """
+    __tablename__ = "board_snapshots"
+
+    id            = Column(Integer, primary_key=True, index=True)
+    snapshot_date = Column(Date, index=True, nullable=False)
+    project_id    = Column(Integer, index=True, nullable=True)   # NULL = tasks without a project
+    sprint_id     = Column(Integer, index=True, nullable=True)   # NULL = backlog / no sprint
+    state         = Column(String, nullable=False)               # "Unknown" when the task has none
+    task_count    = Column(Integer, nullable=False, default=0)
+    story_points  = Column(Float, nullable=False, default=0.0)
+    created_at    = Column(DateTime, default=datetime.utcnow)
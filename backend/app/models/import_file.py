@@ -0,0 +1,17 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+from ..core.base import Base
+
+
+class ImportFile(Base):
+    """
+    Fingerprint of an ADO export that has been imported successfully.
+    A byte-identical re-upload matches on sha256 and is skipped.
+    """
+    __tablename__ = "import_files"
+
+    id          = Column(Integer, primary_key=True, index=True)
+    fingerprint = Column(String, unique=True, index=True, nullable=False)  # sha256 hex of the file bytes
+    filename    = Column(String, nullable=True)
+    row_count   = Column(Integer, nullable=True)
+    imported_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, Text
+from ..core.base import Base
+
+
+class ImportJob(Base):
+    """
+    A background ADO import and its progress.  Kept in the database so any
+    API worker can answer GET /import/jobs/{job_id} for it.
+    """
+    __tablename__ = "import_jobs"
+
+    id               = Column(Integer, primary_key=True, index=True)
+    job_id           = Column(String, unique=True, index=True, nullable=False)  # uuid4 hex
+    filename         = Column(String, nullable=True)
+    engine           = Column(String, nullable=True)                 # "orm" / "copy"
+    state            = Column(String, index=True, nullable=False)    # queued, running, completed, failed
+    rows_processed   = Column(Integer, nullable=False, default=0)
+    chunks_processed = Column(Integer, nullable=False, default=0)
+    inserted         = Column(Integer, nullable=False, default=0)
+    updated          = Column(Integer, nullable=False, default=0)
+    unchanged        = Column(Integer, nullable=False, default=0)
+    skipped          = Column(Integer, nullable=False, default=0)
+    file_unchanged   = Column(Boolean, nullable=False, default=False)
+    errors           = Column(Text, nullable=True)                   # JSON array of messages
+    created_at       = Column(DateTime, default=datetime.utcnow)
+    started_at       = Column(DateTime, nullable=True)
+    finished_at      = Column(DateTime, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
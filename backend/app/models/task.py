@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Date, Float, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Date, Float, Boolean, DateTime, Text, Index
 from ..core.base import Base
 
 
@@ -24,26 +24,33 @@ class Task(Base):
     tags = Column(String, nullable=True)
     area_path = Column(String, nullable=True)
     iteration_path = Column(String, index=True, nullable=True)
-    activated_date = Column(Date, nullable=True)
+    activated_date = Column(Date, index=True, nullable=True)
     target_date = Column(Date, nullable=True)
     committed_date = Column(Date, nullable=True)
     release_date = Column(Date, nullable=True)
-    closed_date = Column(Date, nullable=True)
+    closed_date = Column(Date, index=True, nullable=True)
     cycle_time = Column(Float, nullable=True)
     current_status = Column(String, nullable=True)
     current_update = Column(String, nullable=True)
-    update_date = Column(Date, nullable=True)
+    update_date = Column(Date, index=True, nullable=True)
     risk_item = Column(String, nullable=True)
     carry_forward_reason = Column(String, nullable=True)
     criticality = Column(String, index=True, nullable=True)
     expected_timeline_min = Column(Integer, nullable=True)
     expected_timeline_max = Column(Integer, nullable=True)
     delayed = Column(Boolean, default=False)
+    content_hash = Column(String, nullable=True)  # hash of the last imported row; cleared by UI edits
     project_id = Column(Integer, nullable=True, index=True)   # FK to projects.id (soft)
     sprint_id  = Column(Integer, nullable=True, index=True)   # FK to sprints.id (soft)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Keyset pagination of the work item lists (sort column, then id)
+    __table_args__ = (
+        Index("ix_tasks_priority_id", "priority", "id"),
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
+    )
+
 
 class TaskUpdate(Base):
     __tablename__ = "task_updates"
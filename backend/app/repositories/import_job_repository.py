@@ -0,0 +1,63 @@
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from ..models.import_job import ImportJob
+
+# States after which a job's row no longer changes
+FINISHED_STATES = ("completed", "failed")
+
+# Per-chunk counts summed into a job as it runs
+COUNT_FIELDS = ("inserted", "updated", "unchanged", "skipped")
+
+
+def create_import_job(db: Session, job_id: str, filename: str, engine: str) -> ImportJob:
+    """Insert a queued job and commit."""
+    job = ImportJob(job_id=job_id, filename=filename, engine=engine, state="queued", errors="[]")
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_import_job_by_id(db: Session, job_id: str) -> ImportJob | None:
+    return db.execute(select(ImportJob).where(ImportJob.job_id == job_id)).scalar_one_or_none()
+
+
+def update_import_job(db: Session, job_id: str, **fields) -> None:
+    """Set columns of one job and commit."""
+    db.execute(update(ImportJob).where(ImportJob.job_id == job_id).values(**fields))
+    db.commit()
+
+
+def add_import_job_progress(
+    db: Session, job_id: str, counts: dict[str, int], rows_processed: int,
+    chunks_processed: int, duration_seconds: float,
+) -> None:
+    """Add one chunk's inserted / updated / unchanged / skipped counts to a job and commit."""
+    db.execute(
+        update(ImportJob)
+        .where(ImportJob.job_id == job_id)
+        .values(
+            rows_processed=rows_processed,
+            chunks_processed=chunks_processed,
+            duration_seconds=duration_seconds,
+            **{k: getattr(ImportJob, k) + counts[k] for k in COUNT_FIELDS},
+        )
+    )
+    db.commit()
+
+
+def prune_finished_import_jobs(db: Session, keep: int) -> None:
+    """Delete all but the ``keep`` most recently finished jobs and commit."""
+    newest = (
+        select(ImportJob.id)
+        .where(ImportJob.state.in_(FINISHED_STATES))
+        .order_by(ImportJob.finished_at.desc(), ImportJob.id.desc())
+        .limit(keep)
+    )
+    db.execute(
+        delete(ImportJob)
+        .where(ImportJob.state.in_(FINISHED_STATES), ImportJob.id.not_in(newest.scalar_subquery()))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
@@ -0,0 +1,192 @@
+from datetime import date, datetime
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, Row, case, func, or_, select
+from sqlalchemy.orm import Session
+
+from ..models.board_snapshot import BoardSnapshot
+from ..models.task import Task
+from ..models.team import ProjectTeam
+from ..schemas.report import ReportScope
+
+# Extra WHERE clauses ANDed into every report query
+Filters = Sequence[ColumnElement[bool]]
+
+
+def scope_filters(scope: ReportScope | None) -> list[ColumnElement[bool]]:
+    """WHERE clauses for a report scope (indexed project_id / sprint_id / assigned_to)."""
+    if scope is None:
+        return []
+    filters = []
+    if scope.project_id is not None:
+        filters.append(Task.project_id == scope.project_id)
+    if scope.sprint_id is not None:
+        filters.append(Task.sprint_id == scope.sprint_id)
+    if scope.team_id is not None:
+        team_projects = select(ProjectTeam.project_id).where(ProjectTeam.team_id == scope.team_id)
+        filters.append(Task.project_id.in_(team_projects))
+    if scope.assigned_to:
+        filters.append(Task.assigned_to == scope.assigned_to)
+    return filters
+
+
+def snapshot_scope_filters(scope: ReportScope | None) -> list[ColumnElement[bool]] | None:
+    """
+    scope_filters() for board_snapshots rows, or None when the scope cannot be
+    read from snapshots (they are not kept per assignee).
+    """
+    if scope is None:
+        return []
+    if scope.assigned_to:
+        return None
+    filters = []
+    if scope.project_id is not None:
+        filters.append(BoardSnapshot.project_id == scope.project_id)
+    if scope.sprint_id is not None:
+        filters.append(BoardSnapshot.sprint_id == scope.sprint_id)
+    if scope.team_id is not None:
+        team_projects = select(ProjectTeam.project_id).where(ProjectTeam.team_id == scope.team_id)
+        filters.append(BoardSnapshot.project_id.in_(team_projects))
+    return filters
+
+
+def active_since(day: date) -> ColumnElement[bool]:
+    """Window used by the weekly/monthly reports: activated or closed on/after ``day``."""
+    return or_(Task.activated_date >= day, Task.closed_date >= day)
+
+
+def tasks_last_modified(db: Session) -> datetime | None:
+    """Latest ``tasks.updated_at`` (indexed), used to version cached reports."""
+    return db.execute(select(func.max(Task.updated_at))).scalar()
+
+
+def _count_if(condition: ColumnElement[bool]):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def count_by_state(db: Session, filters: Filters = ()) -> list[Row]:
+    """Return (state, count) rows, most common first; NULL states are counted as "Unknown"."""
+    state = func.coalesce(Task.state, "Unknown").label("state")
+    count = func.count().label("count")
+    stmt = select(state, count).where(*filters).group_by(state).order_by(count.desc(), state)
+    return db.execute(stmt).all()
+
+
+def count_by_sprint_and_state(db: Session, filters: Filters = ()) -> list[Row]:
+    """Return (sprint, state, count) rows; NULL states are counted as "Unknown"."""
+    state = func.coalesce(Task.state, "Unknown").label("state")
+    stmt = (
+        select(Task.sprint, state, func.count().label("count"))
+        .where(*filters)
+        .group_by(Task.sprint, state)
+    )
+    return db.execute(stmt).all()
+
+
+def tasks_on_date(db: Session, column: str, day: date, filters: Filters = ()) -> list[Row]:
+    """Return (task_id, title, assigned_to) for tasks whose ``column`` date equals ``day``."""
+    stmt = (
+        select(Task.task_id, Task.title, Task.assigned_to)
+        .where(getattr(Task, column) == day, *filters)
+        .order_by(Task.id)
+    )
+    return db.execute(stmt).all()
+
+
+def risk_items(db: Session, filters: Filters = ()) -> list[Row]:
+    """Return (task_id, risk_item) for every task that has a risk recorded."""
+    stmt = (
+        select(Task.task_id, Task.risk_item)
+        .where(Task.risk_item.is_not(None), *filters)
+        .order_by(Task.id)
+    )
+    return db.execute(stmt).all()
+
+
+def update_compliance_by_assignee(db: Session, day: date, filters: Filters = ()) -> list[Row]:
+    """Return (assigned_to, total, updated, has_update) rows, one per assignee (NULL included)."""
+    stmt = (
+        select(
+            Task.assigned_to,
+            func.count(Task.task_id).label("total"),
+            _count_if(Task.update_date == day).label("updated"),
+            func.count(Task.current_update).label("has_update"),
+        )
+        .where(*filters)
+        .group_by(Task.assigned_to)
+    )
+    return db.execute(stmt).all()
+
+
+def velocity_counts(db: Session, filters: Filters = ()) -> Row:
+    """Return (committed, completed): tasks with a committed / closed date."""
+    stmt = select(
+        func.count(Task.committed_date).label("committed"),
+        func.count(Task.closed_date).label("completed"),
+    ).where(*filters)
+    return db.execute(stmt).one()
+
+
+def carry_forward_counts(db: Session, filters: Filters = ()) -> list[Row]:
+    """Return (carry_forward_reason, count) rows for tasks with a reason."""
+    stmt = (
+        select(Task.carry_forward_reason, func.count().label("count"))
+        .where(Task.carry_forward_reason.is_not(None), *filters)
+        .group_by(Task.carry_forward_reason)
+    )
+    return db.execute(stmt).all()
+
+
+def risk_counts_by_iteration(db: Session, filters: Filters = ()) -> list[Row]:
+    """Return (iteration_path, risk_count) rows for tasks with a risk and an iteration."""
+    stmt = (
+        select(Task.iteration_path, func.count().label("risk_count"))
+        .where(Task.risk_item.is_not(None), Task.iteration_path.is_not(None), *filters)
+        .group_by(Task.iteration_path)
+    )
+    return db.execute(stmt).all()
+
+
+def performance_by_assignee(db: Session, filters: Filters = ()) -> list[Row]:
+    """Return (assigned_to, avg_cycle_time, completed, delayed_count) rows per assignee."""
+    stmt = (
+        select(
+            Task.assigned_to,
+            func.avg(Task.cycle_time).label("avg_cycle_time"),
+            func.count(Task.closed_date).label("completed"),
+            _count_if(Task.delayed.is_(True)).label("delayed_count"),
+        )
+        .where(*filters)
+        .group_by(Task.assigned_to)
+    )
+    return db.execute(stmt).all()
+
+
+def closed_per_day(
+    db: Session, start: date, end: date, points: bool = False, filters: Filters = ()
+) -> list[Row]:
+    """Return (closed_date, amount) rows for ``start``..``end``: tasks closed, or their story points."""
+    amount = func.coalesce(func.sum(Task.story_points), 0.0) if points else func.count()
+    stmt = (
+        select(Task.closed_date, amount.label("amount"))
+        .where(Task.closed_date.between(start, end), *filters)
+        .group_by(Task.closed_date)
+    )
+    return db.execute(stmt).all()
+
+
+def open_descendant_totals(db: Session, task_id: str, done_states: Sequence[str]) -> Row:
+    """
+    Return (count, story_points) of every item below ``task_id`` in the
+    parent_task_id tree (recursive CTE) that is not in one of ``done_states``.
+    """
+    tree = select(Task.task_id).where(Task.parent_task_id == task_id).cte("tree", recursive=True)
+    tree = tree.union(select(Task.task_id).where(Task.parent_task_id == tree.c.task_id))
+    stmt = select(
+        func.count().label("count"),
+        func.coalesce(func.sum(Task.story_points), 0.0).label("story_points"),
+    ).where(
+        Task.task_id.in_(select(tree.c.task_id)),
+        or_(Task.state.is_(None), Task.state.not_in(done_states)),
+    )
+    return db.execute(stmt).one()
@@ -0,0 +1,128 @@
+from datetime import date, datetime, time, timedelta
+from typing import Sequence
+
+import pandas as pd
+from sqlalchemy import ColumnElement, Row, delete, exists, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from ..models.board_snapshot import BoardSnapshot
+from ..models.task import Task, TaskUpdate
+
+
+def board_totals(db: Session) -> list[Row]:
+    """Current (project_id, sprint_id, state, task_count, story_points) totals from tasks."""
+    state = func.coalesce(Task.state, "Unknown").label("state")
+    stmt = (
+        select(
+            Task.project_id,
+            Task.sprint_id,
+            state,
+            func.count().label("task_count"),
+            func.coalesce(func.sum(Task.story_points), 0.0).label("story_points"),
+        )
+        .group_by(Task.project_id, Task.sprint_id, state)
+    )
+    return db.execute(stmt).all()
+
+
+def board_history_frames(
+    db: Session, filters: Sequence[ColumnElement[bool]] = (), until: date | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Return (tasks, state_changes) frames for rebuilding past board states.
+
+    ``tasks`` has one row per task matching ``filters`` with its current
+    project, sprint, state, story points and creation time, and whether it
+    has any recorded state change at all (``has_history``, regardless of
+    ``until``); ``state_changes`` has every TaskUpdate of those tasks that
+    recorded a state (up to ``until``), in the order it was written.
+    """
+    has_history = exists().where(
+        TaskUpdate.task_id == Task.task_id, TaskUpdate.state.is_not(None)
+    )
+    tasks = pd.read_sql(
+        select(
+            Task.task_id, Task.project_id, Task.sprint_id, Task.state,
+            Task.story_points, Task.created_at, has_history.label("has_history"),
+        ).where(*filters),
+        db.connection(),
+    )
+    stmt = (
+        select(TaskUpdate.task_id, TaskUpdate.update_date, TaskUpdate.state)
+        .where(TaskUpdate.state.is_not(None))
+        .order_by(TaskUpdate.update_date, TaskUpdate.id)
+    )
+    if filters:
+        stmt = stmt.where(TaskUpdate.task_id.in_(select(Task.task_id).where(*filters)))
+    if until is not None:
+        stmt = stmt.where(TaskUpdate.update_date <= until)
+    state_changes = pd.read_sql(stmt, db.connection())
+    return tasks, state_changes
+
+
+def replace_snapshots(db: Session, start: date, end: date, rows: list[dict]) -> None:
+    """Delete the snapshot rows for ``start``..``end`` and insert ``rows`` in their place."""
+    db.execute(
+        delete(BoardSnapshot).where(BoardSnapshot.snapshot_date.between(start, end))
+    )
+    if rows:
+        db.execute(insert(BoardSnapshot), rows)
+    db.commit()
+
+
+def get_snapshots(
+    db: Session,
+    start: date,
+    end: date,
+    project_id: int | None = None,
+    sprint_id: int | None = None,
+) -> list[BoardSnapshot]:
+    """Return snapshot rows for a date range, optionally for one project / sprint."""
+    q = db.query(BoardSnapshot).filter(BoardSnapshot.snapshot_date.between(start, end))
+    if project_id is not None:
+        q = q.filter(BoardSnapshot.project_id == project_id)
+    if sprint_id is not None:
+        q = q.filter(BoardSnapshot.sprint_id == sprint_id)
+    return q.order_by(
+        BoardSnapshot.snapshot_date, BoardSnapshot.project_id,
+        BoardSnapshot.sprint_id, BoardSnapshot.state,
+    ).all()
+
+
+def latest_snapshot_before(db: Session, day: date) -> Row | None:
+    """(snapshot_date, written_at) of the newest snapshot day before ``day``, or None."""
+    stmt = (
+        select(
+            BoardSnapshot.snapshot_date,
+            func.max(BoardSnapshot.created_at).label("written_at"),
+        )
+        .where(BoardSnapshot.snapshot_date < day)
+        .group_by(BoardSnapshot.snapshot_date)
+        .order_by(BoardSnapshot.snapshot_date.desc())
+        .limit(1)
+    )
+    return db.execute(stmt).first()
+
+
+def snapshot_state_counts(
+    db: Session, day: date, filters: Sequence[ColumnElement[bool]] = ()
+) -> dict[str, int]:
+    """Task count per state in the snapshot for ``day``, summed over the matching rows."""
+    stmt = (
+        select(BoardSnapshot.state, func.sum(BoardSnapshot.task_count))
+        .where(BoardSnapshot.snapshot_date == day, *filters)
+        .group_by(BoardSnapshot.state)
+    )
+    return {state: int(count) for state, count in db.execute(stmt)}
+
+
+def changed_since(day: date) -> ColumnElement[bool]:
+    """Tasks created after ``day`` or with a state change recorded after it."""
+    return or_(
+        Task.created_at >= datetime.combine(day + timedelta(days=1), time()),
+        exists().where(
+            TaskUpdate.task_id == Task.task_id,
+            TaskUpdate.state.is_not(None),
+            TaskUpdate.update_date > day,
+        ),
+    )
@@ -1,6 +1,34 @@
-from sqlalchemy import func
+import re
+from datetime import datetime
+from io import StringIO
+
+import pandas as pd
+from typing import Sequence
+
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    Float,
+    Integer,
+    Row,
+    and_,
+    case,
+    cast,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Session
 
+from ..core.cache import bump_task_writes
+from ..models.import_file import ImportFile
 from ..models.task import Task, TaskUpdate
 
 
@@ -9,6 +37,91 @@ def get_all_tasks(db: Session):
     return db.query(Task).order_by(Task.id).all()
 
 
+def get_task_rows(
+    db: Session, columns: list[str], filters: Sequence[ColumnElement[bool]] = ()
+) -> list[dict]:
+    """
+    Return the given task columns as plain dicts, in id order.  Rows are
+    zipped straight from the selected column tuples (no ORM objects).
+    """
+    stmt = (
+        select(*(Task.__table__.columns[c] for c in columns))
+        .where(*filters)
+        .order_by(Task.id)
+    )
+    return [dict(zip(columns, row)) for row in db.execute(stmt)]
+
+
+# Columns a task list can be sorted by; each has a (column, id) index
+TASK_SORT_COLUMNS = ("id", "priority", "updated_at")
+
+
+def get_task_page(
+    db: Session,
+    columns: list[str],
+    filters: Sequence[ColumnElement[bool]] = (),
+    sort: str = "id",
+    descending: bool = False,
+    after: tuple | None = None,
+    limit: int | None = None,
+    order: ColumnElement | None = None,
+) -> list[dict]:
+    """
+    Return up to ``limit`` task rows (as get_task_rows; all rows for None)
+    ordered by ``sort`` then id, starting after the row whose (sort value, id)
+    is ``after``.  With ``order`` the rows are sorted by that (never NULL)
+    expression instead, returned under the name ``sort``.
+
+    NULL sort values come last ascending and first descending, as in a
+    PostgreSQL index scan.  The non-NULL and NULL rows are read with
+    separate queries so each page is a range scan on the (sort, id) index,
+    whatever its depth.  The id and sort columns are always included.
+    """
+    names = list(dict.fromkeys([*columns, "id"] + ([sort] if order is None else [])))
+    selected = [Task.__table__.columns[c] for c in names]
+    if order is not None:
+        selected.append(order.label(sort))
+        names.append(sort)
+    column = order if order is not None else Task.__table__.columns[sort]
+    ids = Task.id.desc() if descending else Task.id
+    keyset = (lambda a, b: a < b) if descending else (lambda a, b: a > b)
+
+    if sort == "id":
+        segments = [([], [ids])]
+    elif order is not None:
+        segments = [([], [column.desc() if descending else column, ids])]
+    else:
+        values = ([column.is_not(None)], [column.desc() if descending else column, ids])
+        nulls = ([column.is_(None)], [ids])
+        segments = [nulls, values] if descending else [values, nulls]
+
+    if after is not None:
+        value, row_id = after
+        if sort == "id":
+            segments[0][0].append(keyset(Task.id, row_id))
+        elif order is not None:
+            segments[0][0].append(keyset(tuple_(column, Task.id), tuple_(value, row_id)))
+        elif value is None:     # resume inside the NULL rows
+            nulls[0].append(keyset(Task.id, row_id))
+            segments = [nulls, values] if descending else [nulls]
+        else:                   # resume inside the non-NULL rows
+            values[0].append(keyset(tuple_(column, Task.id), tuple_(value, row_id)))
+            segments = [values] if descending else [values, nulls]
+
+    rows: list[dict] = []
+    for where, order_by in segments:
+        if limit is not None and len(rows) >= limit:
+            break
+        stmt = (
+            select(*selected)
+            .where(*filters, *where)
+            .order_by(*order_by)
+            .limit(None if limit is None else limit - len(rows))
+        )
+        rows.extend(dict(zip(names, row)) for row in db.execute(stmt))
+    return rows
+
+
 def get_task_by_id(db: Session, task_id: str) -> Task | None:
     """Return a single task by its string task_id, or None."""
     return db.query(Task).filter(Task.task_id == task_id).first()
@@ -27,6 +140,7 @@ def get_task_updates_by_task_id(db: Session, task_id: str) -> list[TaskUpdate]:
 def save_task(db: Session, task: Task) -> Task:
     """Persist pending changes on an already-tracked task and refresh it."""
     db.commit()
+    bump_task_writes()
     db.refresh(task)
     return task
 
@@ -35,32 +149,358 @@ def add_task_update(db: Session, update_entry: TaskUpdate) -> None:
     """Persist a new TaskUpdate history record."""
     db.add(update_entry)
     db.commit()
+    bump_task_writes()
 
 
-def get_work_items(
+# Task fields whose changes are recorded as TaskUpdate history
+TRACKED_FIELDS = ("state", "sub_state", "current_status", "current_update")
+
+
+def get_task_keys(db: Session, task_ids: list[str], batch_size: int = 5000) -> dict[str, Row]:
+    """
+    Return {task_id: row} for the given task_ids, resolved in batched IN lookups.
+
+    Each row carries ``id``, ``content_hash`` and the TRACKED_FIELDS values.
+    """
+    columns = [Task.id, Task.content_hash] + [getattr(Task, f) for f in TRACKED_FIELDS]
+    keys: dict[str, Row] = {}
+    for start in range(0, len(task_ids), batch_size):
+        chunk = task_ids[start:start + batch_size]
+        rows = db.execute(select(Task.task_id, *columns).where(Task.task_id.in_(chunk)))
+        keys.update({row.task_id: row for row in rows})
+    return keys
+
+
+def bulk_upsert_tasks(
     db: Session,
+    inserts: list[dict],
+    updates: list[dict],
+    batch_size: int = 5000,
+) -> None:
+    """
+    Write imported task rows in batches without committing.
+
+    On PostgreSQL every row goes through one INSERT ... ON CONFLICT (task_id)
+    DO UPDATE statement per batch.  Other databases get a bulk INSERT for new
+    rows and a bulk UPDATE by primary key for existing ones (``updates`` rows
+    must then carry ``id``).
+    """
+    now = datetime.utcnow()
+    if db.get_bind().dialect.name == "postgresql":
+        rows = inserts + [{k: v for k, v in row.items() if k != "id"} for row in updates]
+        if not rows:
+            return
+        stmt = pg_insert(Task)
+        columns = [c for c in rows[0] if c != "task_id"]
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Task.task_id],
+            set_={**{c: stmt.excluded[c] for c in columns}, "updated_at": now},
+            where=Task.content_hash.is_distinct_from(stmt.excluded.content_hash),
+        )
+        for start in range(0, len(rows), batch_size):
+            db.execute(stmt, rows[start:start + batch_size])
+        return
+
+    # render_nulls keeps rows with different NULL columns in one executemany batch
+    stmt = insert(Task).execution_options(render_nulls=True)
+    for start in range(0, len(inserts), batch_size):
+        db.execute(stmt, inserts[start:start + batch_size])
+    for start in range(0, len(updates), batch_size):
+        batch = [{**row, "updated_at": now} for row in updates[start:start + batch_size]]
+        db.execute(update(Task), batch)
+
+
+def bulk_insert_task_updates(db: Session, rows: list[dict], batch_size: int = 5000) -> None:
+    """Insert TaskUpdate history rows in batches without committing."""
+    stmt = insert(TaskUpdate).execution_options(render_nulls=True)
+    for start in range(0, len(rows), batch_size):
+        db.execute(stmt, rows[start:start + batch_size])
+
+
+# Database drivers whose raw cursors can stream COPY ... FROM STDIN
+COPY_DRIVERS = ("psycopg2", "psycopg")
+
+# Backslash escapes for COPY's text format
+_COPY_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def supports_copy(db: Session) -> bool:
+    """True if the session's database and driver can run ``copy_merge_tasks``."""
+    dialect = db.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver in COPY_DRIVERS
+
+
+def _copy_text(batch: pd.DataFrame) -> str:
+    """
+    Render ``batch`` in COPY's text format.  NULL is written as \\N, so an
+    empty string is stored as an empty string, as on the ORM path.
+    """
+    columns = []
+    for name in batch.columns:
+        values = batch[name].astype(str)
+        for char, escaped in _COPY_ESCAPES:
+            values = values.str.replace(char, escaped, regex=False)
+        columns.append(values.where(batch[name].notna(), "\\N"))
+    return "".join("\t".join(row) + "\n" for row in zip(*columns))
+
+
+def _copy_from(cursor, sql: str, data: str) -> None:
+    """Stream ``data`` to a COPY ... FROM STDIN on a psycopg2 or psycopg 3 cursor."""
+    if hasattr(cursor, "copy_expert"):
+        cursor.copy_expert(sql, StringIO(data))
+    else:
+        with cursor.copy(sql) as copy:
+            copy.write(data)
+
+
+def copy_merge_tasks(db: Session, frame: pd.DataFrame, batch_rows: int = 50000) -> dict[str, int]:
+    """
+    PostgreSQL-only import path: COPY ``frame`` into a temporary staging table
+    and merge it into ``tasks`` with one INSERT ... SELECT ... ON CONFLICT.
+
+    ``frame`` must hold one row per task_id, columns named after Task columns
+    (including ``content_hash``).  Rows whose content_hash already matches are
+    left untouched.  A TaskUpdate row is written for every new task and for
+    every task whose TRACKED_FIELDS change.  Runs in the session's transaction;
+    the caller commits, which also drops the staging table.  Needs one of the
+    COPY_DRIVERS (see ``supports_copy``).
+    """
+    columns = list(frame.columns)
+    col_list = ", ".join(columns)
+    db.execute(text(
+        f"CREATE TEMP TABLE tasks_stage ON COMMIT DROP AS "
+        f"SELECT {col_list} FROM tasks WITH NO DATA"
+    ))
+
+    # Integer columns arrive as floats when the source column had blanks
+    int_columns = [
+        c for c in columns if isinstance(Task.__table__.columns[c].type, Integer)
+    ]
+    copy_sql = f"COPY tasks_stage ({col_list}) FROM STDIN"
+    cursor = db.connection().connection.cursor()
+    try:
+        for start in range(0, len(frame), batch_rows):
+            batch = frame.iloc[start:start + batch_rows]
+            if int_columns:
+                batch = batch.assign(**{
+                    c: pd.to_numeric(batch[c], errors="coerce").round().astype("Int64")
+                    for c in int_columns
+                })
+            _copy_from(cursor, copy_sql, _copy_text(batch))
+    finally:
+        cursor.close()
+
+    new, unchanged = db.execute(text(
+        "SELECT count(*) FILTER (WHERE t.id IS NULL), "
+        "       count(*) FILTER (WHERE t.content_hash = s.content_hash) "
+        "FROM tasks_stage s LEFT JOIN tasks t ON t.task_id = s.task_id"
+    )).one()
+
+    now = datetime.utcnow()
+    tracked = [f for f in TRACKED_FIELDS if f in columns]
+    if tracked:
+        values = ", ".join(
+            f"s.{f}" if f in tracked else f"t.{f}" for f in TRACKED_FIELDS
+        )
+        present = " OR ".join(f"s.{f} IS NOT NULL" for f in tracked)
+        changed = " OR ".join(f"s.{f} IS DISTINCT FROM t.{f}" for f in tracked)
+        update_date = "CURRENT_DATE"
+        if "update_date" in columns:
+            update_date = "COALESCE(s.update_date, CURRENT_DATE)"
+        db.execute(text(
+            f"INSERT INTO task_updates "
+            f"(task_id, update_date, {', '.join(TRACKED_FIELDS)}, created_at) "
+            f"SELECT s.task_id, {update_date}, {values}, :now "
+            f"FROM tasks_stage s LEFT JOIN tasks t ON t.task_id = s.task_id "
+            f"WHERE (t.id IS NULL AND ({present})) OR (t.id IS NOT NULL AND ({changed}))"
+        ), {"now": now})
+
+    # New rows get the same column defaults an ORM insert would apply
+    defaults = {
+        c.name: c.default.arg for c in Task.__table__.columns
+        if c.name not in columns and c.default is not None and c.default.is_scalar
+    }
+    insert_list = ", ".join([*columns, *defaults])
+    select_list = ", ".join([*columns, *(f":{c}" for c in defaults)])
+    assignments = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c != "task_id")
+    db.execute(text(
+        f"INSERT INTO tasks ({insert_list}, created_at, updated_at) "
+        f"SELECT {select_list}, :now, :now FROM tasks_stage "
+        f"ON CONFLICT (task_id) DO UPDATE SET {assignments}, updated_at = EXCLUDED.updated_at "
+        f"WHERE tasks.content_hash IS DISTINCT FROM EXCLUDED.content_hash"
+    ), {**defaults, "now": now})
+    return {"inserted": new, "updated": len(frame) - new - unchanged, "unchanged": unchanged}
+
+
+def get_tasks_snapshot(db: Session, columns: list[str]) -> pd.DataFrame:
+    """Return task_id plus the named Task columns for every task, as a DataFrame."""
+    names = ["task_id"] + [c for c in columns if c != "task_id"]
+    stmt = select(*(Task.__table__.columns[c] for c in names))
+    return pd.read_sql(stmt, db.connection())
+
+
+def get_import_file(db: Session, fingerprint: str) -> ImportFile | None:
+    """Return the import record for a file fingerprint, or None."""
+    return db.query(ImportFile).filter(ImportFile.fingerprint == fingerprint).first()
+
+
+def record_import_file(db: Session, fingerprint: str, filename: str, row_count: int) -> None:
+    """Remember a successfully imported file (or refresh it on a forced re-import)."""
+    entry = get_import_file(db, fingerprint)
+    if entry is None:
+        entry = ImportFile(fingerprint=fingerprint)
+        db.add(entry)
+    entry.filename = filename
+    entry.row_count = row_count
+    entry.imported_at = datetime.utcnow()
+    db.commit()
+
+
+# ── Work item search ─────────────────────────────────────────────────────────
+# On PostgreSQL the search box matches the weighted tsvector column
+# tasks.search_vector (generated from SEARCH_DOCUMENT_SQL, GIN index
+# ix_tasks_search; both added by run_migrations, not part of the model) and,
+# for id-like input, partial task ids through pg_trgm (ix_tasks_task_id_trgm).
+# Other databases keep the plain ILIKE on title / task_id / assignee.
+SEARCH_DOCUMENT_SQL = (
+    "setweight(to_tsvector('simple', coalesce(task_id, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(assigned_to, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(tags, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(current_update, '')), 'D')"
+)
+_search_vector = literal_column("tasks.search_vector")
+
+
+def _search_tsquery(search: str) -> ColumnElement | None:
+    """Prefix query over the words of ``search`` ("log fai" -> log:* & fai:*), None without words."""
+    words = re.findall(r"\w+", search)
+    if not words:
+        return None
+    return func.to_tsquery(
+        literal_column("'english'::regconfig"), " & ".join(f"{w}:*" for w in words)
+    )
+
+
+def _is_id_fragment(search: str) -> bool:
+    """True for input such as "1042" or "US-10" that may be part of a task id."""
+    return re.fullmatch(r"[\w-]*\d[\w-]*", search.strip()) is not None
+
+
+class _TaskSearch(ColumnElement):
+    """WHERE clause for the work item search box; SQL depends on the dialect."""
+
+    type = Boolean()
+    inherit_cache = False
+
+    def __init__(self, search: str):
+        self.search = search
+
+
+class _TaskSearchRank(ColumnElement):
+    """Relevance of a task to ``search`` (higher is better, never NULL)."""
+
+    type = Float()
+    inherit_cache = False
+
+    def __init__(self, search: str):
+        self.search = search
+
+
+def _ilike_search(like: str) -> ColumnElement[bool]:
+    """Unindexed match of title, task id or assignee against a LIKE pattern."""
+    clauses = [Task.title.ilike(like), Task.task_id.ilike(like), Task.assigned_to.ilike(like)]
+    return or_(*clauses).self_group()
+
+
+@compiles(_TaskSearch)
+def _compile_search(element, compiler, **kw):
+    return compiler.process(_ilike_search(f"%{element.search}%"), **kw)
+
+
+@compiles(_TaskSearch, "postgresql")
+def _compile_search_pg(element, compiler, **kw):
+    like = f"%{element.search.strip()}%"
+    clauses = []
+    query = _search_tsquery(element.search)
+    if query is not None:
+        clauses.append(_search_vector.op("@@")(query))
+        # Only stop words ("the", "a"): the tsquery is empty and matches nothing,
+        # so fall back to the ILIKE.  numnode() of the constant query is folded
+        # when the statement is planned, leaving just the tsvector match otherwise.
+        clauses.append(and_(func.numnode(query) == 0, _ilike_search(like)))
+    if query is None or _is_id_fragment(element.search):
+        clauses.append(Task.task_id.ilike(like))
+    return compiler.process(or_(*clauses).self_group(), **kw)
+
+
+@compiles(_TaskSearchRank)
+def _compile_search_rank(element, compiler, **kw):
+    rank = case(
+        (func.lower(Task.task_id) == element.search.lower(), 3.0),
+        (Task.task_id.ilike(f"%{element.search}%"), 2.0),
+        (Task.title.ilike(f"{element.search}%"), 1.0),
+        else_=0.0,
+    )
+    return compiler.process(rank, **kw)
+
+
+@compiles(_TaskSearchRank, "postgresql")
+def _compile_search_rank_pg(element, compiler, **kw):
+    # Task id hits first, then text rank scaled into 0..1 (normalisation 32).
+    # float8 so the value survives the round trip through a page cursor.
+    rank = case((Task.task_id.ilike(f"%{element.search.strip()}%"), 1.0), else_=0.0)
+    query = _search_tsquery(element.search)
+    if query is not None:
+        rank = rank + func.ts_rank_cd(_search_vector, query, 32)
+    return compiler.process(cast(rank, Float(53)), **kw)
+
+
+def search_rank(search: str) -> ColumnElement[float]:
+    """Relevance expression for ordering search results (see work_item_filters)."""
+    return _TaskSearchRank(search)
+
+
+# Work items without a state are shown (and filtered) as new
+NEW_STATE = "New"
+
+
+def work_item_filters(
     work_item_type: str | None = None,
     state: str | None = None,
     assigned_to: str | None = None,
     sprint: str | None = None,
     search: str | None = None,
-) -> list[Task]:
-    """Return tasks with optional filters."""
-    q = db.query(Task)
+) -> list[ColumnElement[bool]]:
+    """WHERE clauses for the optional work item list filters."""
+    filters = []
     if work_item_type:
-        q = q.filter(Task.work_item_type == work_item_type)
-    if state:
-        q = q.filter(Task.state == state)
+        filters.append(Task.work_item_type == work_item_type)
+    if state == NEW_STATE:
+        filters.append(or_(Task.state == state, Task.state.is_(None)))
+    elif state:
+        filters.append(Task.state == state)
     if assigned_to:
-        q = q.filter(Task.assigned_to == assigned_to)
+        filters.append(Task.assigned_to == assigned_to)
     if sprint:
-        q = q.filter(Task.sprint == sprint)
+        filters.append(Task.sprint == sprint)
     if search:
-        like = f"%{search}%"
-        q = q.filter(
-            Task.title.ilike(like) | Task.task_id.ilike(like)
-        )
-    return q.order_by(Task.id).all()
+        filters.append(_TaskSearch(search))
+    return filters
+
+
+def get_work_items(
+    db: Session,
+    work_item_type: str | None = None,
+    state: str | None = None,
+    assigned_to: str | None = None,
+    sprint: str | None = None,
+    search: str | None = None,
+) -> list[Task]:
+    """Return tasks with optional filters."""
+    filters = work_item_filters(work_item_type, state, assigned_to, sprint, search)
+    return db.query(Task).filter(*filters).order_by(Task.id).all()
 
 
 def get_children(db: Session, parent_task_id: str) -> list[Task]:
@@ -88,6 +528,7 @@ def create_work_item(db: Session, data: dict) -> Task:
             setattr(task, field, value)
     db.add(task)
     db.commit()
+    bump_task_writes()
     db.refresh(task)
     return task
 
@@ -99,4 +540,5 @@ def delete_work_item(db: Session, task_id: str) -> bool:
         return False
     db.delete(task)
     db.commit()
+    bump_task_writes()
     return True
@@ -0,0 +1,23 @@
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+from .task import TaskRead
+
+
+class ReportScope(BaseModel):
+    """Optional query filters that narrow a report to part of the board."""
+    project_id: Optional[int] = None
+    sprint_id: Optional[int] = None
+    team_id: Optional[int] = None       # tasks of every project the team is assigned to
+    assigned_to: Optional[str] = None
+
+    class Config:
+        frozen = True   # hashable, so it can be part of a report cache key
+
+
+class DashboardRead(BaseModel):
+    """GET /reports/dashboard: only the requested parts are set."""
+    daily: Optional[Dict[str, Any]] = None
+    weekly: Optional[Dict[str, Any]] = None
+    monthly: Optional[Dict[str, Any]] = None
+    tasks: Optional[List[TaskRead]] = None
@@ -41,6 +41,7 @@ class TaskCreate(TaskBase):
 
 class TaskRead(TaskBase):
     id: int
+    sprint_id: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -0,0 +1,241 @@
+"""
+Exports of the tasks and task_updates tables and of report sections.
+
+Columnar (Parquet / Arrow IPC): rows are read in batches straight from
+column tuples and appended to the writer batch by batch; the Arrow schema is
+derived from the SQLAlchemy column types so empty or all-NULL columns keep
+their type.
+
+CSV: generators for StreamingResponse.  Table rows come from a server-side
+cursor (yield_per) and every batch is encoded and handed out as soon as it
+is read, so memory stays flat however many rows are exported.  The
+generators open their own session: the request's session is closed before
+a streaming body is sent.
+"""
+from __future__ import annotations
+
+import csv
+import io
+from datetime import date
+from typing import Dict, Iterable, Iterator, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, ColumnElement, Date, DateTime, Float, Integer, select
+from sqlalchemy.orm import Session
+
+from ..core.db import SessionLocal
+from ..models.task import Task, TaskUpdate
+from ..schemas.report import ReportScope
+from .report_service import (
+    MAX_SUMMARY_PAGE_SIZE,
+    get_daily_report,
+    get_monthly_report,
+    get_weekly_report,
+    get_weekly_task_summaries,
+)
+
+EXPORT_DATASETS = {"tasks": Task, "updates": TaskUpdate}
+
+# Rows fetched and written per record batch / row group
+EXPORT_BATCH_ROWS = 50000
+
+# Rows fetched and encoded per streamed CSV chunk
+CSV_BATCH_ROWS = 5000
+
+REPORT_EXPORTS = ["daily", "weekly", "monthly"]
+
+_ARROW_TYPES = [
+    (Boolean, pa.bool_()),
+    (Integer, pa.int64()),
+    (Float, pa.float64()),
+    (DateTime, pa.timestamp("us")),
+    (Date, pa.date32()),
+]
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+def _arrow_type(column) -> pa.DataType:
+    for sql_type, arrow_type in _ARROW_TYPES:
+        if isinstance(column.type, sql_type):
+            return arrow_type
+    return pa.string()
+
+
+def _schema(model) -> pa.Schema:
+    return pa.schema([pa.field(c.name, _arrow_type(c)) for c in model.__table__.columns])
+
+
+def _record_batches(db: Session, model, schema: pa.Schema):
+    columns = list(model.__table__.columns)
+    result = db.execute(
+        select(*columns).order_by(model.id).execution_options(yield_per=EXPORT_BATCH_ROWS)
+    )
+    for rows in result.partitions():
+        data = list(zip(*rows))
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(data, schema)],
+            schema=schema,
+        )
+
+
+def _csv_encode(rows: Iterable[Sequence]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _table_csv(model, filters: Sequence[ColumnElement[bool]]) -> Iterator[bytes]:
+    columns = list(model.__table__.columns)
+    if filters and model is TaskUpdate:
+        filters = [TaskUpdate.task_id.in_(select(Task.task_id).where(*filters))]
+    yield _csv_encode([[c.name for c in columns]])
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            select(*columns).where(*filters).order_by(model.id)
+            .execution_options(yield_per=CSV_BATCH_ROWS)
+        )
+        for rows in result.partitions():
+            yield _csv_encode(rows)
+    finally:
+        db.close()
+
+
+def _flatten(record: Dict) -> Dict:
+    """Lift nested dicts (the line1 / line2 of task summaries) into the row."""
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(value)
+        else:
+            flat[key] = value
+    return flat
+
+
+def _records_csv(records: Iterable[Dict]) -> Iterator[bytes]:
+    """CSV chunks for dict records; the header comes from the first record."""
+    header = None
+    batch = []
+    for record in records:
+        row = _flatten(record)
+        if header is None:
+            header = list(row)
+            batch.append(header)
+        batch.append([row.get(key) for key in header])
+        if len(batch) >= CSV_BATCH_ROWS:
+            yield _csv_encode(batch)
+            batch = []
+    if batch:
+        yield _csv_encode(batch)
+
+
+def _weekly_summary_records(
+    week_start: date | None, scope: ReportScope | None
+) -> Iterator[Dict]:
+    db = SessionLocal()
+    try:
+        cursor = None
+        while True:
+            page = get_weekly_task_summaries(
+                db, week_start, cursor, MAX_SUMMARY_PAGE_SIZE, scope=scope
+            )
+            yield from page["items"]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+    finally:
+        db.close()
+
+
+# ---------------------------------------------------------------------------
+# Public service API
+# ---------------------------------------------------------------------------
+
+def export_columnar(db: Session, dataset: str, fmt: str) -> bytes:
+    """
+    Serialise ``dataset`` ("tasks" or "updates") as Parquet or Arrow IPC bytes.
+
+    ``fmt`` is "parquet" or "arrow".  Raises ValueError for unknown values.
+    """
+    model = EXPORT_DATASETS.get(dataset)
+    if model is None:
+        raise ValueError(f"Unknown export dataset: {dataset}")
+    schema = _schema(model)
+    sink = pa.BufferOutputStream()
+    if fmt == "parquet":
+        with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+            for batch in _record_batches(db, model, schema):
+                writer.write_batch(batch)
+    elif fmt == "arrow":
+        with pa.ipc.new_file(sink, schema) as writer:
+            for batch in _record_batches(db, model, schema):
+                writer.write_batch(batch)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+    return sink.getvalue().to_pybytes()
+
+
+def columnar_media_type(fmt: str) -> Dict[str, str]:
+    """Return the response media type and file extension for a columnar format."""
+    if fmt == "parquet":
+        return {"media_type": "application/vnd.apache.parquet", "extension": "parquet"}
+    return {"media_type": "application/vnd.apache.arrow.file", "extension": "arrow"}
+
+
+def stream_csv(
+    dataset: str, filters: Sequence[ColumnElement[bool]] = ()
+) -> Iterator[bytes]:
+    """
+    CSV chunks of ``dataset`` ("tasks" or "updates"), in id order.
+
+    ``filters`` are task WHERE clauses (see work_item_filters); for
+    "updates" they select the history of the matching tasks.  Raises
+    ValueError for an unknown dataset before anything is streamed.
+    """
+    model = EXPORT_DATASETS.get(dataset)
+    if model is None:
+        raise ValueError(f"Unknown export dataset: {dataset}")
+    return _table_csv(model, list(filters))
+
+
+def stream_report_csv(
+    db: Session,
+    report: str,
+    section: str,
+    report_date: date | None = None,
+    scope: ReportScope | None = None,
+) -> Iterator[bytes]:
+    """
+    CSV chunks of one section of the daily, weekly or monthly report.
+
+    ``report_date`` is the report's day, week start or month start (default
+    the current one).  List sections give one row per entry, dict sections a
+    single row.  Weekly ``task_summaries`` are read page by page through the
+    summaries cursor instead of being built in one piece.  Raises ValueError
+    for an unknown report or section.
+    """
+    if report not in REPORT_EXPORTS:
+        raise ValueError(f"Unknown report: {report}. Choose from: {', '.join(REPORT_EXPORTS)}")
+    if report == "weekly" and section == "task_summaries":
+        return _records_csv(_weekly_summary_records(report_date, scope))
+
+    if report == "daily":
+        data = get_daily_report(db, report_date, scope)
+    elif report == "weekly":
+        data = get_weekly_report(db, report_date, include_summaries=False, scope=scope)
+    else:
+        data = get_monthly_report(db, report_date, scope)
+    sections = {k: v for k, v in data.items() if isinstance(v, (list, dict))}
+    if report == "weekly":
+        sections["task_summaries"] = None
+    if section not in sections:
+        raise ValueError(
+            f"Unknown {report} report section: {section}. "
+            f"Choose from: {', '.join(sections)}"
+        )
+    value = sections[section]
+    return _records_csv([value] if isinstance(value, dict) else value)
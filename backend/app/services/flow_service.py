@@ -0,0 +1,199 @@
+"""
+Flow metrics rebuilt from the task state history.
+
+get_sprint_burndown() replays the task_updates state changes of a sprint's
+tasks in one ordered scan and turns them into daily series with cumulative
+sums.  daily_state_counts() does the same for every state of a set of
+tasks and feeds the cumulative flow report, starting from a board snapshot
+when one is available.  Sprint membership and story
+points are the tasks' current values, since the history does not record them.
+"""
+from __future__ import annotations
+
+import os
+from datetime import date
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ..core.cache import LRUCache
+from ..core.config_defaults import DEFAULTS
+from ..models.task import Task
+from ..repositories.project_repository import get_sprint
+from ..repositories.snapshot_repository import board_history_frames
+from .snapshot_service import state_events
+
+# States in which a task's points count as burned (work_item_states defaults)
+DONE_STATES = ("Resolved", "Closed")
+
+# Burndowns of completed sprints never change, so they are kept until evicted
+BURNDOWN_CACHE_SIZE = int(os.getenv("BURNDOWN_CACHE_SIZE", "128"))
+_burndown_cache = LRUCache(BURNDOWN_CACHE_SIZE)
+
+# Cumulative flow bucket sizes; "sprint" counts the current board per sprint
+CFD_BUCKETS = ["day", "week", "month", "sprint"]
+_PERIODS = {"week": "W", "month": "M"}
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+def _cumulative(days: pd.Series, amounts: pd.Series, index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Running total over ``index`` of ``amounts`` booked on ``days``.  Amounts
+    booked before the first day form the opening balance; later ones are dropped.
+    """
+    days = days.clip(lower=index[0])
+    keep = days <= index[-1]
+    daily = amounts[keep].groupby(days[keep]).sum()
+    return daily.reindex(index, fill_value=0.0).cumsum().to_numpy(dtype=float)
+
+
+def _series(values: np.ndarray, known: int) -> List[Optional[float]]:
+    """Round ``values`` for the payload; days after the first ``known`` are None."""
+    out = np.round(values, 2).tolist()
+    return out[:known] + [None] * (len(out) - known)
+
+
+def _burndown_series(
+    tasks: pd.DataFrame, state_changes: pd.DataFrame, start: date, end: date
+) -> Dict:
+    """
+    Daily ideal / remaining / completed / scope / scope_change series for
+    ``start``..``end``.
+
+    A task joins the scope on the day it was created; its points are burned
+    when it enters a done state and restored if it is reopened.
+    """
+    index = pd.date_range(start, end, freq="D")
+    known = int((index <= pd.Timestamp(date.today())).sum())
+
+    events = state_events(tasks, state_changes)
+    points = pd.to_numeric(tasks.set_index("task_id")["story_points"]).fillna(0.0)
+    events["points"] = events["task_id"].map(points).fillna(0.0).to_numpy()
+
+    first = ~events["task_id"].duplicated()
+    scope = _cumulative(events.loc[first, "day"], events.loc[first, "points"], index)
+
+    done = events["state"].isin(DONE_STATES)
+    was_done = done.groupby(events["task_id"]).shift(fill_value=False).astype(bool)
+    change = done.astype(int) - was_done.astype(int)      # +1 done, -1 reopened
+    moved = change != 0
+    completed = _cumulative(
+        events.loc[moved, "day"], (change * events["points"])[moved], index
+    )
+
+    n = len(index)
+    ideal = scope[0] * (1 - np.arange(n) / (n - 1)) if n > 1 else scope[:1].copy()
+    scope_change = np.diff(scope, prepend=scope[0])
+
+    return {
+        "days": [d.date().isoformat() for d in index],
+        "ideal": np.round(ideal, 2).tolist(),
+        "remaining": _series(scope - completed, known),
+        "completed": _series(completed, known),
+        "scope": _series(scope, known),
+        "scope_change": _series(scope_change, known),
+    }
+
+
+def ordered_states(states) -> List[str]:
+    """Workflow states first, in their configured order, then any others by name."""
+    workflow = DEFAULTS["work_item_states"]
+    return [s for s in workflow if s in states] + sorted(set(states) - set(workflow))
+
+
+def daily_state_counts(
+    tasks: pd.DataFrame,
+    state_changes: pd.DataFrame,
+    start: date,
+    end: date,
+    opening: Optional[Mapping[str, int]] = None,
+    opening_day: Optional[date] = None,
+) -> pd.DataFrame:
+    """
+    End-of-day number of tasks in each state (columns) for every day in
+    ``start``..``end`` (index).  Each state change adds one to the new state
+    and takes one from the previous state; the deltas are cumulated by day.
+
+    ``opening`` gives the counts at the end of ``opening_day`` (before
+    ``start``), e.g. from a board snapshot.  Only changes after that day are
+    then replayed, so ``tasks`` need only hold the tasks created or moved since.
+    """
+    index = pd.date_range(start, end, freq="D")
+    events = state_events(tasks, state_changes)
+    previous = events.groupby("task_id")["state"].shift()
+    moved = previous.notna()
+    deltas = pd.concat([
+        pd.DataFrame({"day": events["day"], "state": events["state"], "n": 1}),
+        pd.DataFrame({"day": events.loc[moved, "day"], "state": previous[moved], "n": -1}),
+    ], ignore_index=True)
+    deltas = deltas[deltas["day"] <= index[-1]]
+    if opening is not None:
+        balance = pd.DataFrame({"day": index[0], "state": list(opening), "n": list(opening.values())})
+        deltas = pd.concat(
+            [deltas[deltas["day"] > pd.Timestamp(opening_day)], balance], ignore_index=True
+        )
+    counts = (
+        deltas.assign(day=deltas["day"].clip(lower=index[0]))
+        .pivot_table(index="day", columns="state", values="n", aggfunc="sum", fill_value=0)
+        .reindex(index, fill_value=0)
+        .cumsum()
+    )
+    counts = counts.loc[:, counts.any()]
+    return counts[ordered_states(counts.columns)].astype(int)
+
+
+def bucket_state_counts(daily: pd.DataFrame, bucket: str) -> pd.DataFrame:
+    """
+    Reduce daily_state_counts() to one row per week or month: the counts at
+    the end of the bucket, labelled with its first day in range.
+    """
+    if bucket == "day":
+        return daily
+    periods = daily.index.to_period(_PERIODS[bucket])
+    counts = daily.groupby(periods).last()
+    counts.index = daily.index.to_series().groupby(periods).min().to_numpy()
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Public service API
+# ---------------------------------------------------------------------------
+
+def get_sprint_burndown(db: Session, sprint_id: int) -> Optional[Dict]:
+    """
+    Burndown / burnup series for a sprint, or None if the sprint does not
+    exist.  Raises ValueError when the sprint has no usable date range.
+    """
+    sprint = get_sprint(db, sprint_id)
+    if sprint is None:
+        return None
+    start, end = sprint.start_date, sprint.end_date
+    if start is None or end is None:
+        raise ValueError("Sprint has no start_date / end_date")
+    if start > end:
+        raise ValueError("Sprint start_date is after its end_date")
+
+    header = {
+        "sprint_id": sprint.id,
+        "name": sprint.name,
+        "state": sprint.state,
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+    }
+
+    def build() -> Dict:
+        tasks, state_changes = board_history_frames(
+            db, [Task.sprint_id == sprint.id], until=end
+        )
+        return _burndown_series(tasks, state_changes, start, end)
+
+    if sprint.state == "completed" and end < date.today():
+        series = _burndown_cache.get_or_compute((sprint.id, start, end), build)
+    else:
+        series = build()
+    return {**header, **series}
@@ -0,0 +1,180 @@
+"""
+Monte Carlo delivery forecasts.
+
+The daily throughput of a history window (tasks closed per day, or their
+story points; zero days included) is resampled for every simulated day of
+every trial, all trials at once with NumPy, until each trial has burned
+through the remaining work.  Percentiles of the finishing day give the
+completion dates.
+"""
+from __future__ import annotations
+
+import os
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ..core.cache import LRUCache
+from ..repositories.report_repository import (
+    closed_per_day,
+    open_descendant_totals,
+    scope_filters,
+)
+from ..repositories.task_repository import get_task_by_id
+from ..schemas.report import ReportScope
+from .flow_service import DONE_STATES
+from .report_service import data_version
+
+FORECAST_UNITS = ["tasks", "points"]
+PERCENTILES = [50, 70, 85, 95]
+FORECAST_TRIALS = 50_000
+MAX_FORECAST_TRIALS = 200_000
+HISTORY_DAYS = 90
+
+# Trials still running after this many days are reported as unfinished
+MAX_FORECAST_DAYS = 3650
+# Most days simulated per vectorised step (bounds memory to trials x block draws)
+_BLOCK_DAYS = 30
+
+FORECAST_CACHE_SIZE = int(os.getenv("FORECAST_CACHE_SIZE", "128"))
+_forecast_cache = LRUCache(FORECAST_CACHE_SIZE)
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+def _daily_throughput(
+    db: Session, start: date, end: date, unit: str, scope: ReportScope | None = None
+) -> np.ndarray:
+    """Throughput of every day in ``start``..``end``, days without closures as 0."""
+    rows = closed_per_day(db, start, end, unit == "points", scope_filters(scope))
+    per_day = pd.Series({pd.Timestamp(day): amount for day, amount in rows}, dtype=float)
+    return per_day.reindex(pd.date_range(start, end, freq="D"), fill_value=0.0).to_numpy()
+
+
+def simulate_completion_days(
+    samples: np.ndarray,
+    remaining: float,
+    trials: int,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    Number of days each of ``trials`` runs needs to deliver ``remaining``,
+    drawing every day's throughput from ``samples``.  Runs that have not
+    finished after MAX_FORECAST_DAYS are ``inf``.
+    """
+    rng = rng or np.random.default_rng()
+    days = np.full(trials, np.inf)
+    if remaining <= 0:
+        days[:] = 0
+        return days
+    if remaining > samples.max() * MAX_FORECAST_DAYS:
+        return days         # out of reach even at the best day's pace
+    # Small backlogs finish in a few days; do not draw a full block for them
+    block = int(np.clip(np.ceil(1.5 * remaining / samples.mean()), 1, _BLOCK_DAYS))
+    delivered = np.zeros(trials)
+    pending = np.arange(trials)
+    offset = 0
+    while pending.size and offset < MAX_FORECAST_DAYS:
+        draws = rng.choice(samples, size=(pending.size, block))
+        totals = delivered[pending, None] + np.cumsum(draws, axis=1)
+        finished = totals[:, -1] >= remaining
+        first = np.argmax(totals[finished] >= remaining, axis=1)
+        days[pending[finished]] = offset + first + 1
+        delivered[pending] = totals[:, -1]
+        pending = pending[~finished]
+        offset += block
+    return days
+
+
+def _forecast(
+    samples: np.ndarray, remaining: float, trials: int, start: date
+) -> Dict:
+    days = simulate_completion_days(samples, remaining, trials)
+    finished = np.isfinite(days)
+    percentiles = []
+    for p, value in zip(PERCENTILES, np.percentile(days, PERCENTILES, method="higher")):
+        if np.isfinite(value):
+            n = int(value)
+            percentiles.append({
+                "percentile": p,
+                "days": n,
+                "date": (start + timedelta(days=max(n - 1, 0))).isoformat(),
+            })
+        else:
+            percentiles.append({"percentile": p, "days": None, "date": None})
+    return {
+        "percentiles": percentiles,
+        "unfinished_trials": int((~finished).sum()),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Public service API
+# ---------------------------------------------------------------------------
+
+def get_delivery_forecast(
+    db: Session,
+    backlog: float | None = None,
+    epic_id: str | None = None,
+    unit: str = "tasks",
+    history_days: int = HISTORY_DAYS,
+    trials: int = FORECAST_TRIALS,
+    start: date | None = None,
+    scope: ReportScope | None = None,
+) -> Optional[Dict]:
+    """
+    Forecast when ``backlog`` tasks (or points) -- or the open items under
+    epic ``epic_id`` -- will be done, working from ``start`` (default today).
+
+    Throughput comes from the ``history_days`` before ``start``, scoped to a
+    project / team / sprint / assignee.  Returns None when the epic does not
+    exist; raises ValueError for bad input or a window without closures.
+    Results are cached per input window until task data changes.
+    """
+    if unit not in FORECAST_UNITS:
+        raise ValueError(f"Unknown unit: {unit}. Choose from: {', '.join(FORECAST_UNITS)}")
+    if (backlog is None) == (epic_id is None):
+        raise ValueError("Give exactly one of backlog or epic_id")
+    if backlog is not None and backlog < 0:
+        raise ValueError("backlog must not be negative")
+
+    start = start or date.today()
+    history_end = start - timedelta(days=1)
+    history_start = start - timedelta(days=history_days)
+
+    if epic_id is not None:
+        if get_task_by_id(db, epic_id) is None:
+            return None
+        count, points = open_descendant_totals(db, epic_id, DONE_STATES)
+        backlog = points if unit == "points" else count
+
+    def build() -> Dict:
+        samples = _daily_throughput(db, history_start, history_end, unit, scope)
+        if not samples.any():
+            raise ValueError(
+                f"Nothing was closed between {history_start} and {history_end}; "
+                "widen history_days or the scope"
+            )
+        return {
+            "unit": unit,
+            "remaining": float(backlog),
+            "epic_id": epic_id,
+            "start": start.isoformat(),
+            "trials": trials,
+            "history": {
+                "start": history_start.isoformat(),
+                "end": history_end.isoformat(),
+                "days": history_days,
+                "total": float(samples.sum()),
+                "mean_per_day": round(float(samples.mean()), 3),
+            },
+            **_forecast(samples, float(backlog), trials, start),
+        }
+
+    key = (unit, float(backlog), epic_id, history_start, history_end, trials, scope, data_version(db))
+    return dict(_forecast_cache.get_or_compute(key, build))
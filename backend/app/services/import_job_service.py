@@ -0,0 +1,140 @@
+"""
+Background ADO import jobs.
+
+POST /import hands a spooled upload to a small thread pool so parsing and
+ingestion never run on the event loop.  Job state is kept in the import_jobs
+table, so clients can poll GET /import/jobs/{job_id} on any API worker.  A
+job runs in the worker that accepted the upload (the spooled file is local to
+it); if that process exits mid-import the job is left "running".
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import uuid4
+
+from ..core.db import SessionLocal
+from ..models.import_job import ImportJob
+from ..repositories.import_job_repository import (
+    add_import_job_progress,
+    create_import_job,
+    get_import_job_by_id,
+    prune_finished_import_jobs,
+    update_import_job,
+)
+from .ingestion_service import DEFAULT_IMPORT_ENGINE, IMPORT_CHUNK_ROWS, import_ado_stream
+
+# Concurrent imports per API process
+IMPORT_WORKERS = 2
+
+# Finished jobs kept for polling before the oldest are dropped
+MAX_FINISHED_JOBS = 200
+
+_executor = ThreadPoolExecutor(max_workers=IMPORT_WORKERS, thread_name_prefix="import-job")
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return None if value is None else value.isoformat()
+
+
+def _job_status(job: ImportJob) -> Dict:
+    return {
+        "job_id": job.job_id,
+        "filename": job.filename,
+        "engine": job.engine,
+        "state": job.state,
+        "rows_processed": job.rows_processed,
+        "chunks_processed": job.chunks_processed,
+        "inserted": job.inserted,
+        "updated": job.updated,
+        "unchanged": job.unchanged,
+        "skipped": job.skipped,
+        "file_unchanged": job.file_unchanged,
+        "errors": json.loads(job.errors or "[]"),
+        "created_at": _isoformat(job.created_at),
+        "started_at": _isoformat(job.started_at),
+        "finished_at": _isoformat(job.finished_at),
+        "duration_seconds": job.duration_seconds,
+    }
+
+
+def _run_job(
+    job_id: str, path: str, filename: str, chunk_rows: int, force: bool, engine: str
+) -> None:
+    started = time.perf_counter()
+    # Job rows are written through their own session, so progress commits
+    # never touch the import's transaction
+    jobs_db = SessionLocal()
+    db = SessionLocal()
+    try:
+        update_import_job(jobs_db, job_id, state="running", started_at=datetime.utcnow())
+
+        def on_progress(progress: Dict) -> None:
+            add_import_job_progress(
+                jobs_db, job_id, progress, progress["rows_processed"], progress["chunk"],
+                round(time.perf_counter() - started, 3),
+            )
+
+        file_unchanged = False
+        try:
+            result = import_ado_stream(
+                path, filename, db, chunk_rows, on_progress=on_progress, force=force, engine=engine
+            )
+            state, errors, file_unchanged = "completed", [], result["file_unchanged"]
+        except Exception as exc:
+            db.rollback()
+            jobs_db.rollback()
+            state, errors = "failed", [str(exc)]
+
+        update_import_job(
+            jobs_db,
+            job_id,
+            state=state,
+            errors=json.dumps(errors),
+            file_unchanged=file_unchanged,
+            finished_at=datetime.utcnow(),
+            duration_seconds=round(time.perf_counter() - started, 3),
+        )
+        prune_finished_import_jobs(jobs_db, MAX_FINISHED_JOBS)
+    finally:
+        db.close()
+        jobs_db.close()
+        os.unlink(path)
+
+
+# ---------------------------------------------------------------------------
+# Public service API
+# ---------------------------------------------------------------------------
+
+def submit_import_job(
+    path: str,
+    filename: str,
+    chunk_rows: int = IMPORT_CHUNK_ROWS,
+    force: bool = False,
+    engine: str = DEFAULT_IMPORT_ENGINE,
+) -> Dict:
+    """
+    Queue a spooled upload for background ingestion and return the new job.
+
+    The job takes ownership of ``path`` and deletes it when it finishes.
+    """
+    with SessionLocal() as db:
+        job = create_import_job(db, uuid4().hex, filename, engine)
+        status = _job_status(job)
+    _executor.submit(_run_job, status["job_id"], path, filename, chunk_rows, force, engine)
+    return status
+
+
+def get_import_job(job_id: str) -> Optional[Dict]:
+    """Return a job's current status, or None if unknown."""
+    with SessionLocal() as db:
+        job = get_import_job_by_id(db, job_id)
+        return None if job is None else _job_status(job)
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
-from datetime import datetime
+import hashlib
+import os
+from datetime import date
 from io import BytesIO
-from typing import Dict, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+from sqlalchemy import Boolean, Date, Float, Integer
 from sqlalchemy.orm import Session
 
+from ..core.cache import bump_task_writes
 from ..models.task import Task
+from ..repositories.task_repository import (
+    TRACKED_FIELDS,
+    bulk_insert_task_updates,
+    bulk_upsert_tasks,
+    copy_merge_tasks,
+    get_import_file,
+    get_task_keys,
+    get_tasks_snapshot,
+    record_import_file,
+    supports_copy,
+)
 
 # ---------------------------------------------------------------------------
 # Column normalisation map
@@ -49,6 +67,37 @@ CRITICALITY_TIMELINES: Dict[str, Tuple[int, int]] = {
     "very low": (1, 3),
 }
 
+_TIMELINE_MIN = {crit: bounds[0] for crit, bounds in CRITICALITY_TIMELINES.items()}
+_TIMELINE_MAX = {crit: bounds[1] for crit, bounds in CRITICALITY_TIMELINES.items()}
+
+# File types accepted by the parsers below
+SUPPORTED_EXTENSIONS = (
+    ".csv", ".json", ".jsonl", ".ndjson", ".xlsx", ".xls", ".parquet", ".arrow", ".feather",
+)
+
+# Arrow IPC file extensions (".feather" is Feather v2, i.e. the IPC file format)
+ARROW_EXTENSIONS = (".arrow", ".feather")
+
+# Rows per lookup / write batch when upserting imported tasks
+IMPORT_BATCH_SIZE = 5000
+
+# Write engine used when a request does not choose one: "orm" (batched
+# INSERT ... ON CONFLICT / bulk ORM writes) or "copy" (PostgreSQL COPY into a
+# staging table plus one merge statement; other databases fall back to "orm")
+DEFAULT_IMPORT_ENGINE = os.getenv("IMPORT_ENGINE", "orm")
+
+# Rows per chunk when streaming an upload from disk
+IMPORT_CHUNK_ROWS = 20000
+
+# Task columns an import is allowed to write
+IMPORT_TASK_FIELDS = {
+    c.name for c in Task.__table__.columns
+    if c.name not in {"id", "created_at", "updated_at", "content_hash"}
+}
+
+# Block size for hashing spooled uploads
+FINGERPRINT_BLOCK_SIZE = 1024 * 1024
+
 DATE_COLUMNS = {
     "activated_date",
     "target_date",
@@ -73,10 +122,29 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df.rename(columns=renamed)
 
 
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a column that may mix date formats.  pandas infers one format from
+    the first value and turns the rest into NaT, so the values that failed
+    are parsed again with the format of the first of them, until none are
+    left; whatever no single format covers is parsed value by value.
+    """
+    parsed = pd.to_datetime(values, errors="coerce")
+    pending = parsed.isna() & values.notna()
+    while pending.any():
+        retry = pd.to_datetime(values[pending], errors="coerce")
+        if retry.isna().all():
+            parsed[pending] = pd.to_datetime(values[pending], errors="coerce", format="mixed")
+            break
+        parsed[pending] = retry
+        pending = parsed.isna() & values.notna()
+    return parsed
+
+
 def _coerce_dates(df: pd.DataFrame) -> pd.DataFrame:
     for col in DATE_COLUMNS:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
+            df[col] = _parse_dates(df[col]).dt.date
     return df
 
 
@@ -93,18 +161,11 @@ def _compute_cycle_time(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def _apply_criticality(df: pd.DataFrame) -> pd.DataFrame:
-    def timeline(row):
-        crit = str(row.get("criticality") or "").strip().lower()
-        return CRITICALITY_TIMELINES.get(crit)
-
     if "criticality" in df.columns:
-        timeline_values = df.apply(timeline, axis=1)
-        df["expected_timeline_min"] = timeline_values.apply(
-            lambda x: x[0] if isinstance(x, tuple) else np.nan
-        )
-        df["expected_timeline_max"] = timeline_values.apply(
-            lambda x: x[1] if isinstance(x, tuple) else np.nan
-        )
+        # Non-string cells stringify to "nan"/"None"/..., which miss the lookup like blanks do
+        crit = df["criticality"].astype(str).str.strip().str.lower()
+        df["expected_timeline_min"] = crit.map(_TIMELINE_MIN)
+        df["expected_timeline_max"] = crit.map(_TIMELINE_MAX)
     else:
         df["expected_timeline_min"] = np.nan
         df["expected_timeline_max"] = np.nan
@@ -112,29 +173,95 @@ def _apply_criticality(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def _apply_delay_flag(df: pd.DataFrame) -> pd.DataFrame:
-    def is_delayed(row):
-        cycle = row.get("cycle_time")
-        max_days = row.get("expected_timeline_max")
-        if pd.isna(cycle) or pd.isna(max_days):
-            return False
-        return float(cycle) > float(max_days)
-
-    df["delayed"] = df.apply(is_delayed, axis=1)
+    cycle = pd.to_numeric(df["cycle_time"], errors="coerce")
+    max_days = pd.to_numeric(df["expected_timeline_max"], errors="coerce")
+    # Comparisons against NaN are False, so missing values are never delayed
+    df["delayed"] = cycle > max_days
     return df
 
 
+def _open_arrow(source) -> Iterator[pa.RecordBatch]:
+    """Yield record batches from an Arrow IPC source in file or stream format."""
+    try:
+        reader = pa.ipc.open_file(source)
+    except pa.ArrowInvalid:
+        source.seek(0)
+        yield from pa.ipc.open_stream(source)
+        return
+    for i in range(reader.num_record_batches):
+        yield reader.get_batch(i)
+
+
 def _parse_file(content: bytes, filename: str) -> pd.DataFrame:
     name = filename.lower()
     if name.endswith(".csv"):
         return pd.read_csv(BytesIO(content))
+    if name.endswith(".jsonl") or name.endswith(".ndjson"):
+        return pd.read_json(BytesIO(content), lines=True)
     if name.endswith(".json"):
         return pd.read_json(BytesIO(content))
     if name.endswith(".xlsx") or name.endswith(".xls"):
         return pd.read_excel(BytesIO(content))
-    raise ValueError("Only CSV, JSON, or Excel supported")
+    if name.endswith(".parquet"):
+        return pd.read_parquet(BytesIO(content))
+    if name.endswith(ARROW_EXTENSIONS):
+        return pa.Table.from_batches(list(_open_arrow(pa.BufferReader(content)))).to_pandas()
+    raise ValueError("Only CSV, JSON, Excel, Parquet or Arrow IPC supported")
+
+
+def _iter_excel_chunks(path: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Yield the first worksheet in frames of ``chunk_rows`` via openpyxl's read-only mode."""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [
+            name if name is not None else f"Unnamed: {i}" for i, name in enumerate(header)
+        ]
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_rows:
+                yield pd.DataFrame(batch, columns=columns)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _iter_file_chunks(path: str, filename: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Yield an on-disk upload as DataFrames of at most ``chunk_rows`` rows.
+
+    Plain JSON arrays and legacy .xls files have no incremental reader and are
+    parsed in one piece.
+    """
+    name = filename.lower()
+    if name.endswith(".csv"):
+        yield from pd.read_csv(path, chunksize=chunk_rows)
+    elif name.endswith(".jsonl") or name.endswith(".ndjson"):
+        yield from pd.read_json(path, lines=True, chunksize=chunk_rows)
+    elif name.endswith(".xlsx"):
+        yield from _iter_excel_chunks(path, chunk_rows)
+    elif name.endswith(".parquet"):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    elif name.endswith(ARROW_EXTENSIONS):
+        with pa.memory_map(path) as source:
+            for batch in _open_arrow(source):
+                for start in range(0, batch.num_rows, chunk_rows):
+                    yield batch.slice(start, chunk_rows).to_pandas()
+    elif name.endswith(".json") or name.endswith(".xls"):
+        with open(path, "rb") as fh:
+            yield _parse_file(fh.read(), filename)
+    else:
+        raise ValueError("Only CSV, JSON, Excel, Parquet or Arrow IPC supported")
 
 
-def _ingest_dataframe(db: Session, df: pd.DataFrame) -> int:
+def _prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     df = _normalize_columns(df)
     df = _coerce_dates(df)
     df = _compute_cycle_time(df)
@@ -143,35 +270,273 @@ def _ingest_dataframe(db: Session, df: pd.DataFrame) -> int:
 
     if "task_id" not in df.columns:
         raise ValueError("Input data must include TaskID or equivalent column.")
+    return df
 
-    ingested = 0
-    for _, row in df.iterrows():
-        task_id = str(row.get("task_id")).strip()
-        if not task_id or task_id.lower() == "nan":
-            continue
-
-        task = db.query(Task).filter(Task.task_id == task_id).first()
-        payload = {k: (None if pd.isna(v) else v) for k, v in row.to_dict().items()}
-
-        if task is None:
-            task = Task(task_id=task_id)
-            db.add(task)
-
-        for field, value in payload.items():
-            if hasattr(task, field):
-                setattr(task, field, value)
-
-        ingested += 1
 
+def _task_frame(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    """
+    Project the prepared frame onto Task columns; return (frame, skipped).
+
+    The result holds one row per task_id with missing values as None, plus a
+    ``content_hash`` of the imported values so unchanged rows can be
+    recognised on the next import.
+    """
+    df = df.loc[:, ~df.columns.duplicated(keep="last")]
+    frame = df[[c for c in df.columns if c in IMPORT_TASK_FIELDS]]
+
+    task_ids = frame["task_id"]
+    # Numeric IDs read as float (because of blanks) would otherwise become "123.0"
+    # and differ between chunks of the same file
+    if pd.api.types.is_float_dtype(task_ids) and (task_ids.dropna() % 1 == 0).all():
+        task_ids = task_ids.astype("Int64")
+    valid = task_ids.notna()
+    task_ids = task_ids.astype(str).str.strip()
+    valid &= (task_ids != "") & (task_ids.str.lower() != "nan")
+    frame = frame[valid].assign(task_id=task_ids[valid])
+    # Later rows win when an export repeats a task_id, as the row-by-row path did
+    frame = frame.drop_duplicates(subset="task_id", keep="last")
+
+    frame = frame.astype(object).where(frame.notna(), None)
+    typed = pd.DataFrame({c: _hash_text(frame[c], c) for c in sorted(frame.columns)})
+    hashes = pd.util.hash_pandas_object(typed, index=False)
+    frame = frame.assign(content_hash=hashes.map("{:016x}".format))
+    return frame, len(df) - len(frame)
+
+
+def _hash_text(series: pd.Series, column: str) -> pd.Series:
+    """
+    Text form of a column for the content hash, fixed by the Task column type
+    rather than the dtype pandas inferred for this file or chunk: an Integer
+    7 is "7" whether the column held 7, 7.0 or "7".  Present values carry a
+    leading "=" and missing values are "", so an empty string and a missing
+    value hash differently (pandas' string hash stops at a NUL byte, so a NUL
+    marker would not).
+    """
+    kind = Task.__table__.columns[column].type
+    if isinstance(kind, Integer):
+        values = pd.to_numeric(series, errors="coerce").round().astype("Int64")
+    elif isinstance(kind, Float):
+        values = pd.to_numeric(series, errors="coerce").astype(float)
+    elif isinstance(kind, Date):
+        values = pd.to_datetime(series, errors="coerce").dt.strftime("%Y-%m-%d")
+    elif isinstance(kind, Boolean):
+        values = series.map(lambda v: None if v is None else bool(v))
+    else:
+        values = series
+    return ("=" + values.astype(str)).where(values.notna(), "")
+
+
+def _history_row(record: Dict, current, today: date) -> Dict:
+    """TaskUpdate values after an import: imported fields over the current ones."""
+    row = {"task_id": record["task_id"], "update_date": record.get("update_date") or today}
+    for field in TRACKED_FIELDS:
+        row[field] = record[field] if field in record else getattr(current, field, None)
+    return row
+
+
+def _write_tasks(db: Session, df: pd.DataFrame, engine: str = "orm") -> Dict[str, int]:
+    """Upsert a frame that has been through ``_prepare_dataframe`` and commit."""
+    frame, skipped = _task_frame(df)
+
+    check_import_engine(db, engine)
+    if engine == "copy" and db.get_bind().dialect.name == "postgresql":
+        counts = copy_merge_tasks(db, frame)
+        db.commit()
+        bump_task_writes()
+        return {**counts, "skipped": skipped}
+
+    records = frame.to_dict(orient="records")
+    tracked = [f for f in TRACKED_FIELDS if f in frame.columns]
+    existing = get_task_keys(db, [r["task_id"] for r in records], IMPORT_BATCH_SIZE)
+    inserts, updates, history = [], [], []
+    unchanged = 0
+    today = date.today()
+    for record in records:
+        current = existing.get(record["task_id"])
+        if current is None:
+            inserts.append(record)
+            if any(record[f] is not None for f in tracked):
+                history.append(_history_row(record, None, today))
+        elif current.content_hash == record["content_hash"]:
+            unchanged += 1
+        else:
+            updates.append({**record, "id": current.id})
+            if any(record[f] != getattr(current, f) for f in tracked):
+                history.append(_history_row(record, current, today))
+
+    bulk_upsert_tasks(db, inserts, updates, IMPORT_BATCH_SIZE)
+    bulk_insert_task_updates(db, history, IMPORT_BATCH_SIZE)
     db.commit()
-    return ingested
+    bump_task_writes()
+    return {
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "unchanged": unchanged,
+        "skipped": skipped,
+    }
+
+
+def _ingest_dataframe(db: Session, df: pd.DataFrame, engine: str = "orm") -> Dict[str, int]:
+    return _write_tasks(db, _prepare_dataframe(df), engine)
+
+
+def _comparable(series: pd.Series, column: str) -> pd.Series:
+    """Normalise a column so file and database values compare by meaning, not dtype."""
+    kind = Task.__table__.columns[column].type
+    if isinstance(kind, Date):
+        return pd.to_datetime(series, errors="coerce")
+    if isinstance(kind, (Float, Integer)):
+        return pd.to_numeric(series, errors="coerce")
+    if isinstance(kind, Boolean):
+        return series.astype(object).where(series.notna(), None).map(
+            lambda v: None if v is None else bool(v)
+        )
+    return series.where(series.isna(), series.astype(str))
+
+
+def _json_values(series: pd.Series) -> pd.Series:
+    return series.astype(object).where(series.notna(), None)
+
+
+def _diff_against_snapshot(frame: pd.DataFrame, snapshot: pd.DataFrame) -> Dict:
+    merged = frame.merge(
+        snapshot, on="task_id", how="outer", suffixes=("_new", "_old"), indicator=True
+    )
+    new_ids = merged.loc[merged["_merge"] == "left_only", "task_id"].tolist()
+    missing_ids = merged.loc[merged["_merge"] == "right_only", "task_id"].tolist()
+    both = merged[merged["_merge"] == "both"]
+
+    changes = []
+    for column in (c for c in frame.columns if c != "task_id"):
+        old = _comparable(both[f"{column}_old"], column)
+        new = _comparable(both[f"{column}_new"], column)
+        differs = ~((old == new) | (old.isna() & new.isna()))
+        if differs.any():
+            changes.append(pd.DataFrame({
+                "task_id": both.loc[differs, "task_id"],
+                "field": column,
+                "old": _json_values(both.loc[differs, f"{column}_old"]),
+                "new": _json_values(both.loc[differs, f"{column}_new"]),
+            }))
+
+    updated = []
+    if changes:
+        long = pd.concat(changes, ignore_index=True).sort_values(["task_id", "field"], kind="stable")
+        for task_id, group in long.groupby("task_id", sort=False):
+            updated.append({
+                "task_id": task_id,
+                "changes": {
+                    field: {"old": old, "new": new}
+                    for field, old, new in zip(group["field"], group["old"], group["new"])
+                },
+            })
+
+    return {
+        "new": new_ids,
+        "updated": updated,
+        "missing": missing_ids,
+        "unchanged": len(both) - len(updated),
+    }
+
+
+def _file_fingerprint(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(FINGERPRINT_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _unchanged_file_result() -> Dict:
+    return {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0, "file_unchanged": True}
 
 
 # ---------------------------------------------------------------------------
 # Public service API
 # ---------------------------------------------------------------------------
 
-def import_ado_dump(content: bytes, filename: str, db: Session) -> int:
-    """Parse an uploaded ADO export file and upsert tasks into the database."""
-    df = _parse_file(content, filename)
-    return _ingest_dataframe(db, df)
+def check_import_engine(db: Session, engine: str) -> None:
+    """
+    Raise ValueError if ``engine`` cannot run on this database: "copy" on
+    PostgreSQL needs a driver that supports COPY FROM STDIN.
+    """
+    if engine == "copy" and db.get_bind().dialect.name == "postgresql" and not supports_copy(db):
+        raise ValueError(
+            f"engine=copy needs the psycopg2 or psycopg driver, "
+            f"not {db.get_bind().dialect.driver}"
+        )
+
+
+def import_ado_stream(
+    path: str,
+    filename: str,
+    db: Session,
+    chunk_rows: int = IMPORT_CHUNK_ROWS,
+    on_progress: Optional[Callable[[Dict], None]] = None,
+    force: bool = False,
+    engine: str = DEFAULT_IMPORT_ENGINE,
+) -> Dict:
+    """
+    Import an ADO export that has been spooled to ``path``, one chunk at a time.
+
+    Each chunk is parsed, upserted and committed before the next one is read,
+    so memory stays bounded by ``chunk_rows`` rather than by file size.
+    ``on_progress`` is called after every chunk with that chunk's counts and
+    the running ``rows_processed`` total.
+
+    Returns inserted / updated / unchanged / skipped row counts.  Rows whose
+    content hash matches the stored one are left untouched, and rows without a
+    task_id or earlier duplicates of a repeated task_id are skipped.  A file
+    that was already imported byte-for-byte is not parsed at all unless
+    ``force`` is set (``file_unchanged`` is then True).  ``engine`` picks the
+    write path, see ``DEFAULT_IMPORT_ENGINE``.
+    """
+    fingerprint = _file_fingerprint(path)
+    if not force and get_import_file(db, fingerprint) is not None:
+        return {**_unchanged_file_result(), "chunks": []}
+
+    totals = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+    chunks: List[Dict] = []
+    rows_processed = 0
+    for index, chunk in enumerate(_iter_file_chunks(path, filename, chunk_rows), start=1):
+        counts = _ingest_dataframe(db, chunk, engine)
+        rows_processed += len(chunk)
+        for key, value in counts.items():
+            totals[key] += value
+        progress = {"chunk": index, "rows": len(chunk), **counts, "rows_processed": rows_processed}
+        chunks.append(progress)
+        if on_progress is not None:
+            on_progress(progress)
+
+    record_import_file(db, fingerprint, filename, rows_processed)
+    return {**totals, "file_unchanged": False, "chunks": chunks}
+
+
+def preview_ado_import(path: str, filename: str, db: Session) -> Dict:
+    """
+    Dry-run an import of the ADO export at ``path`` without writing anything.
+
+    Runs the normal pipeline stages, then diffs the result against a snapshot
+    of only the affected ``tasks`` columns with a single outer join.  Returns
+    new task_ids, updated tasks with per-field old/new values, task_ids that
+    exist in the database but not in the file, and summary counts.
+    """
+    df = pd.concat(list(_iter_file_chunks(path, filename, IMPORT_CHUNK_ROWS)), ignore_index=True)
+    frame, skipped = _task_frame(_prepare_dataframe(df))
+    frame = frame.drop(columns="content_hash")
+
+    snapshot = get_tasks_snapshot(db, list(frame.columns))
+    diff = _diff_against_snapshot(frame, snapshot)
+    return {
+        "dry_run": True,
+        "summary": {
+            "new": len(diff["new"]),
+            "updated": len(diff["updated"]),
+            "unchanged": diff["unchanged"],
+            "missing": len(diff["missing"]),
+            "skipped": skipped,
+        },
+        "new": diff["new"],
+        "updated": diff["updated"],
+        "missing": diff["missing"],
+    }
@@ -1,12 +1,52 @@
 from __future__ import annotations
 
+import os
+import re
 from datetime import date, timedelta
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from ..core.cache import LRUCache, task_writes
 from ..models.task import Task
+from ..schemas.report import ReportScope
+from ..schemas.task import TaskRead
+from ..repositories.report_repository import (
+    active_since as _active_since,
+    carry_forward_counts,
+    count_by_sprint_and_state,
+    count_by_state,
+    performance_by_assignee,
+    risk_counts_by_iteration,
+    risk_items,
+    scope_filters,
+    snapshot_scope_filters,
+    tasks_last_modified,
+    tasks_on_date,
+    update_compliance_by_assignee,
+    velocity_counts,
+)
+from ..repositories.snapshot_repository import (
+    board_history_frames,
+    changed_since,
+    latest_snapshot_before,
+    snapshot_state_counts,
+)
+from ..repositories.task_repository import get_task_rows
+from .flow_service import (
+    CFD_BUCKETS,
+    bucket_state_counts,
+    daily_state_counts,
+    ordered_states,
+)
+
+# Computed reports kept in memory, keyed by report, parameters and data version
+REPORT_CACHE_SIZE = int(os.getenv("REPORT_CACHE_SIZE", "256"))
+
+_report_cache = LRUCache(REPORT_CACHE_SIZE)
 
 
 # ---------------------------------------------------------------------------
@@ -18,82 +58,155 @@ _DATE_COLS = [
     "release_date", "closed_date", "update_date",
 ]
 
+_REPORT_COLUMNS = [
+    "task_id", "title", "assigned_to", "state", "sub_state",
+    "iteration_path", "activated_date", "target_date", "committed_date",
+    "release_date", "closed_date", "cycle_time", "current_status",
+    "current_update", "update_date", "risk_item", "carry_forward_reason",
+    "criticality", "expected_timeline_min", "expected_timeline_max", "delayed",
+]
 
-def _tasks_dataframe(db: Session) -> pd.DataFrame:
-    rows = db.query(Task).all()
-    data = [
-        {
-            "task_id": t.task_id,
-            "title": t.title,
-            "assigned_to": t.assigned_to,
-            "state": t.state,
-            "sub_state": t.sub_state,
-            "iteration_path": t.iteration_path,
-            "activated_date": t.activated_date,
-            "target_date": t.target_date,
-            "committed_date": t.committed_date,
-            "release_date": t.release_date,
-            "closed_date": t.closed_date,
-            "cycle_time": t.cycle_time,
-            "current_status": t.current_status,
-            "current_update": t.current_update,
-            "update_date": t.update_date,
-            "risk_item": t.risk_item,
-            "carry_forward_reason": t.carry_forward_reason,
-            "criticality": t.criticality,
-            "expected_timeline_min": t.expected_timeline_min,
-            "expected_timeline_max": t.expected_timeline_max,
-            "delayed": t.delayed,
-        }
-        for t in rows
-    ]
-    df = pd.DataFrame(data) if data else pd.DataFrame(
-        columns=[
-            "task_id", "title", "assigned_to", "state", "sub_state",
-            "iteration_path", "activated_date", "target_date", "committed_date",
-            "release_date", "closed_date", "cycle_time", "current_status",
-            "current_update", "update_date", "risk_item", "carry_forward_reason",
-            "criticality", "expected_timeline_min", "expected_timeline_max", "delayed",
-        ]
-    )
-    # Convert all date columns to datetime64 so NaT is used instead of None/NaN
-    # This makes comparisons with date/Timestamp objects work correctly.
+
+# Weekly task summary fields, per line, and the task column each is built from
+_SUMMARY_LINE1 = {
+    "task_id": "task_id",
+    "title": "title",
+    "assigned_to": "assigned_to",
+    "state": "state",
+    "sub_state": "sub_state",
+    "iteration_path": "iteration_path",
+    "activated_date": "activated_date",
+    "target_date": "target_date",
+    "cycle_time": "cycle_time",
+    "current_status": "current_status",
+}
+_SUMMARY_LINE2 = {
+    "weekly_update": "current_update",
+    "risk_item": "risk_item",
+    "carry_forward_reason": "carry_forward_reason",
+    "timeline_compliance": "delayed",
+}
+SUMMARY_FIELDS = [*_SUMMARY_LINE1, *_SUMMARY_LINE2]
+
+# Sections GET /reports/dashboard can return
+DASHBOARD_PARTS = ["daily", "weekly", "monthly", "tasks"]
+
+# Default / maximum page size of GET /reports/weekly/tasks
+SUMMARY_PAGE_SIZE = 200
+MAX_SUMMARY_PAGE_SIZE = 1000
+
+_MONTHLY_ROW_COLUMNS = [
+    "task_id", "activated_date", "cycle_time", "delayed",
+    "committed_date", "release_date",
+]
+
+
+def _tasks_dataframe(
+    db: Session,
+    active_since: date | None = None,
+    columns: List[str] | None = None,
+    after_id: int | None = None,
+    limit: int | None = None,
+    filters: List | None = None,
+) -> pd.DataFrame:
+    """
+    Load report columns straight from ``tasks`` into a DataFrame.
+
+    Only ``columns`` (default _REPORT_COLUMNS) are selected, no ORM objects
+    are built, and date columns come back as datetime64 so NaT is used
+    instead of None/NaN.  ``active_since`` keeps only tasks activated or
+    closed on/after that day, the window the weekly and monthly reports use.
+    Rows come in ``tasks.id`` order; ``after_id`` / ``limit`` page through them.
+    ``filters`` are extra WHERE clauses, e.g. scope_filters() of a ReportScope.
+    """
+    columns = columns or _REPORT_COLUMNS
+    stmt = select(*(Task.__table__.columns[c] for c in columns)).order_by(Task.id)
+    if active_since is not None:
+        stmt = stmt.where(_active_since(active_since))
+    if filters:
+        stmt = stmt.where(*filters)
+    if after_id is not None:
+        stmt = stmt.where(Task.id > after_id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    df = pd.read_sql(stmt, db.connection())
     for col in _DATE_COLS:
         if col in df.columns:
             df[col] = pd.to_datetime(df[col], errors="coerce")
     return df
 
 
-def _date_to_str(value) -> str | None:
-    if value is None:
-        return None
-    try:
-        if pd.isna(value):   # catches NaN, NaT, None
-            return None
-    except (TypeError, ValueError):
-        pass
-    if isinstance(value, str):
-        return value
-    if isinstance(value, pd.Timestamp):
-        return value.date().isoformat()
-    return value.isoformat()
+def _row_records(df: pd.DataFrame, columns: List[str]) -> List[Dict]:
+    """``df[columns]`` as records with NaN/NaT turned into None (JSON null)."""
+    frame = df[columns]
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
+def _group_records(rows, fill: str | None = None) -> List[Dict]:
+    """
+    Turn GROUP BY rows into records the way the pandas helpers did: keys
+    sorted with the NULL group last, and ``fill`` standing in for NULLs.
+    """
+    records = [row._asdict() for row in rows]
+    if not records:
+        return []
+    key = rows[0]._fields[0]
+    records.sort(key=lambda r: (r[key] is None, r[key] or ""))
+    if fill is not None:
+        records = [{k: fill if v is None else v for k, v in r.items()} for r in records]
+    return records
+
+
+def _summary_fields(fields: List[str] | None) -> List[str]:
+    if not fields:
+        return SUMMARY_FIELDS
+    unknown = sorted(set(fields) - set(SUMMARY_FIELDS))
+    if unknown:
+        raise ValueError(
+            f"Unknown summary fields: {', '.join(unknown)}. "
+            f"Choose from: {', '.join(SUMMARY_FIELDS)}"
+        )
+    return [f for f in SUMMARY_FIELDS if f in fields]
+
+
+def _summary_columns(fields: List[str]) -> List[str]:
+    mapping = {**_SUMMARY_LINE1, **_SUMMARY_LINE2}
+    return list(dict.fromkeys(mapping[f] for f in fields))
+
+
+def _task_summaries(df: pd.DataFrame, fields: List[str] | None = None) -> List[Dict]:
+    """
+    Build the two-line weekly summaries column by column.
+
+    Dates become ISO strings, missing values (NaN/NaT) become None and
+    ``timeline_compliance`` is "Delayed" or "On-Time".  ``fields`` limits
+    which keys appear in each line.
+    """
+    fields = fields or SUMMARY_FIELDS
+    lines = {}
+    for line, mapping in (("line1", _SUMMARY_LINE1), ("line2", _SUMMARY_LINE2)):
+        columns = {}
+        for key, source in mapping.items():
+            if key not in fields:
+                continue
+            values = df[source]
+            if source in _DATE_COLS:
+                values = values.dt.strftime("%Y-%m-%d")
+            elif key == "timeline_compliance":
+                values = pd.Series(
+                    np.where(values.astype(bool), "Delayed", "On-Time"), index=df.index
+                )
+            columns[key] = values.astype(object).where(values.notna(), None).tolist()
+        keys = list(columns)
+        rows = zip(*columns.values()) if keys else [()] * len(df)
+        lines[line] = [dict(zip(keys, row)) for row in rows]
+    return [{"line1": one, "line2": two} for one, two in zip(lines["line1"], lines["line2"])]
 
 
 # ---------------------------------------------------------------------------
 # Private analytics helpers
 # ---------------------------------------------------------------------------
 
-def _resource_performance(df: pd.DataFrame) -> List[Dict]:
-    if df.empty:
-        return []
-    grouped = df.groupby("assigned_to", dropna=False).agg(
-        avg_cycle_time=("cycle_time", "mean"),
-        completed=("closed_date", "count"),
-        delayed_count=("delayed", "sum"),
-    )
-    return grouped.reset_index().fillna("Unassigned").to_dict(orient="records")
-
-
 def _task_completion_rate(df: pd.DataFrame) -> float:
     if df.empty:
         return 0.0
@@ -102,20 +215,6 @@ def _task_completion_rate(df: pd.DataFrame) -> float:
     return float(completed) / float(total)
 
 
-def _risk_frequency(df: pd.DataFrame) -> List[Dict]:
-    if df.empty:
-        return []
-    grouped = df[df["risk_item"].notna()].groupby("iteration_path").size()
-    return grouped.reset_index(name="risk_count").to_dict(orient="records")
-
-
-def _carry_forward_reasons(df: pd.DataFrame) -> List[Dict]:
-    if df.empty:
-        return []
-    grouped = df[df["carry_forward_reason"].notna()].groupby("carry_forward_reason").size()
-    return grouped.reset_index(name="count").to_dict(orient="records")
-
-
 def _timeline_accuracy(df: pd.DataFrame) -> List[Dict]:
     if df.empty:
         return []
@@ -139,129 +238,315 @@ def _release_reliability(df: pd.DataFrame) -> List[Dict]:
     return result[["task_id", "release_delta"]].to_dict(orient="records")
 
 
-def _daily_update_compliance(df: pd.DataFrame, as_of: date) -> List[Dict]:
-    if df.empty:
-        return []
-    df = df.copy()
-    df["has_update"] = df["current_update"].notna()
-    if "update_date" in df.columns:
-        df["on_date"] = df["update_date"].dt.normalize() == pd.Timestamp(as_of)
-    else:
-        df["on_date"] = False
-    grouped = df.groupby("assigned_to", dropna=False).agg(
-        total=("task_id", "count"),
-        updated=("on_date", "sum"),
-        has_update=("has_update", "sum"),
-    )
-    return grouped.reset_index().fillna("Unassigned").to_dict(orient="records")
+def data_version(db: Session) -> tuple:
+    """
+    Changes whenever task data may have changed: the in-process write counter
+    catches every write made here (deletes included), the latest updated_at
+    catches writes made by other API processes.
+    """
+    return task_writes(), tasks_last_modified(db)
 
 
-# ---------------------------------------------------------------------------
-# Public service API
-# ---------------------------------------------------------------------------
+def _cached(
+    db: Session,
+    report: str,
+    params: tuple,
+    scope: ReportScope | None,
+    build: Callable[[], Dict],
+    version: tuple | None = None,
+) -> Dict:
+    key = (report, params, scope, version or data_version(db))
+    # Shallow copy so callers can add or drop sections without touching the cache
+    return dict(_report_cache.get_or_compute(key, build))
 
-def get_daily_report(db: Session, report_date: date | None = None) -> Dict:
-    """Return a daily snapshot of task activity and compliance."""
-    day = report_date or date.today()
-    ts_day = pd.Timestamp(day)
-    df = _tasks_dataframe(db)
 
-    activated_today = df[df["activated_date"].dt.normalize() == ts_day]
-    closed_today = df[df["closed_date"].dt.normalize() == ts_day]
-    risks_last_24h = df[df["risk_item"].notna()]
+# ---------------------------------------------------------------------------
+# Report builders (uncached)
+# ---------------------------------------------------------------------------
 
+def _daily_report(db: Session, day: date, scope: ReportScope | None = None) -> Dict:
+    scoped = scope_filters(scope)
     return {
         "date": day.isoformat(),
-        "status_distribution": df["state"].fillna("Unknown").value_counts().to_dict(),
-        "activated_today": activated_today[["task_id", "title", "assigned_to"]].to_dict(
-            orient="records"
-        ),
-        "closed_today": closed_today[["task_id", "title", "assigned_to"]].to_dict(
-            orient="records"
+        "status_distribution": {state: count for state, count in count_by_state(db, scoped)},
+        "activated_today": [
+            r._asdict() for r in tasks_on_date(db, "activated_date", day, scoped)
+        ],
+        "closed_today": [r._asdict() for r in tasks_on_date(db, "closed_date", day, scoped)],
+        "risks_last_24h": [r._asdict() for r in risk_items(db, scoped)],
+        "compliance": _group_records(
+            update_compliance_by_assignee(db, day, scoped), fill="Unassigned"
         ),
-        "risks_last_24h": risks_last_24h[["task_id", "risk_item"]].to_dict(orient="records"),
-        "compliance": _daily_update_compliance(df, day),
     }
 
 
-def get_weekly_report(db: Session, week_start: date | None = None) -> Dict:
-    """Return a weekly velocity and summary report."""
-    df = _tasks_dataframe(db)
-    week_start = week_start or (date.today() - timedelta(days=date.today().weekday()))
+def _weekly_report(
+    db: Session,
+    week_start: date,
+    include_summaries: bool = True,
+    scope: ReportScope | None = None,
+) -> Dict:
     week_end = week_start + timedelta(days=6)
-    ts_week_start = pd.Timestamp(week_start)
+    scoped = scope_filters(scope)
+    window = [_active_since(week_start), *scoped]
+    columns = ["assigned_to", "cycle_time"]
+    if include_summaries:
+        columns = list(dict.fromkeys(columns + _summary_columns(SUMMARY_FIELDS)))
+    in_week = _tasks_dataframe(db, active_since=week_start, columns=columns, filters=scoped)
+
+    report = {
+        "week_start": week_start.isoformat(),
+        "week_end": week_end.isoformat(),
+        "velocity": velocity_counts(db, window)._asdict(),
+        "cycle_time_by_resource": _row_records(in_week, ["assigned_to", "cycle_time"]),
+        "carry_forward_reasons": _group_records(carry_forward_counts(db, window)),
+        "risk_heatmap": _group_records(risk_counts_by_iteration(db, window)),
+    }
+    if include_summaries:
+        report["task_summaries"] = _task_summaries(in_week)
+    return report
+
 
-    in_week = df[
-        (df["activated_date"] >= ts_week_start) |
-        (df["closed_date"] >= ts_week_start)
-    ]
+def _monthly_report(db: Session, month_start: date, scope: ReportScope | None = None) -> Dict:
+    next_month = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    month_end = next_month - timedelta(days=1)
+    scoped = scope_filters(scope)
+    window = [_active_since(month_start), *scoped]
+    in_month = _tasks_dataframe(
+        db, active_since=month_start, columns=_MONTHLY_ROW_COLUMNS, filters=scoped
+    )
 
-    velocity = {
-        "committed": int(in_week["committed_date"].notna().sum()),
-        "completed": int(in_week["closed_date"].notna().sum()),
+    return {
+        "month_start": month_start.isoformat(),
+        "month_end": month_end.isoformat(),
+        "cycle_time_trend": _row_records(in_month, ["activated_date", "cycle_time"]),
+        "velocity_trend": velocity_counts(db, window)._asdict(),
+        "delay_trend": _row_records(in_month, ["task_id", "delayed"]),
+        "risk_register": _group_records(risk_counts_by_iteration(db, window)),
+        "carry_forward_trend": _group_records(carry_forward_counts(db, window)),
+        "release_reliability": _release_reliability(in_month),
+        "team_performance": _group_records(performance_by_assignee(db, window), fill="Unassigned"),
+    }
+
+
+def _task_list(db: Session, scope: ReportScope | None = None) -> Dict:
+    return {"items": get_task_rows(db, list(TaskRead.model_fields), scope_filters(scope))}
+
+
+def _cfd_by_sprint(db: Session, scope: ReportScope | None = None) -> Dict:
+    rows = count_by_sprint_and_state(db, scope_filters(scope))
+    sprints = sorted({r.sprint for r in rows}, key=_sprint_sort_key)
+    states = ordered_states({r.state for r in rows})
+    position = {sprint: i for i, sprint in enumerate(sprints)}
+    counts = {state: [0] * len(sprints) for state in states}
+    for sprint, state, count in rows:
+        counts[state][position[sprint]] += count
+    return {"bucket": "sprint", "labels": sprints, "states": states, "counts": counts}
+
+
+def _cfd_by_date(
+    db: Session,
+    start: date,
+    end: date,
+    bucket: str,
+    scope: ReportScope | None = None,
+    snapshot_day: date | None = None,
+) -> Dict:
+    filters, opening = scope_filters(scope), None
+    if snapshot_day is not None:
+        # Open with the snapshot's counts; replay only tasks touched since
+        opening = snapshot_state_counts(db, snapshot_day, snapshot_scope_filters(scope))
+        filters = [*filters, changed_since(snapshot_day)]
+    tasks, state_changes = board_history_frames(db, filters, until=end)
+    daily = daily_state_counts(tasks, state_changes, start, end, opening, snapshot_day)
+    counts = bucket_state_counts(daily, bucket)
+    return {
+        "bucket": bucket,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "labels": [d.date().isoformat() for d in pd.to_datetime(counts.index)],
+        "states": list(counts.columns),
+        "counts": {state: counts[state].tolist() for state in counts.columns},
     }
 
-    summaries = []
-    for _, row in in_week.iterrows():
-        line1 = {
-            "task_id": row.get("task_id"),
-            "title": row.get("title"),
-            "assigned_to": row.get("assigned_to"),
-            "state": row.get("state"),
-            "sub_state": row.get("sub_state"),
-            "iteration_path": row.get("iteration_path"),
-            "activated_date": _date_to_str(row.get("activated_date")),
-            "target_date": _date_to_str(row.get("target_date")),
-            "cycle_time": row.get("cycle_time"),
-            "current_status": row.get("current_status"),
-        }
-        line2 = {
-            "weekly_update": row.get("current_update"),
-            "risk_item": row.get("risk_item"),
-            "carry_forward_reason": row.get("carry_forward_reason"),
-            "timeline_compliance": "Delayed" if row.get("delayed") else "On-Time",
-        }
-        summaries.append({"line1": line1, "line2": line2})
 
+def _sprint_sort_key(sprint: str | None) -> tuple:
+    """Sprints in number order ("Sprint 2" before "Sprint 10"); no sprint last."""
+    number = re.search(r"\d+", sprint or "")
+    return (sprint is None, int(number.group()) if number else 0, sprint or "")
+
+
+def _default_week_start() -> date:
+    return date.today() - timedelta(days=date.today().weekday())
+
+
+def _default_month_start() -> date:
+    return date.today().replace(day=1)
+
+
+# ---------------------------------------------------------------------------
+# Public service API
+# ---------------------------------------------------------------------------
+#
+# Every report takes an optional ReportScope (project / sprint / team /
+# assignee); it is applied in SQL before any DataFrame is built.
+
+def get_daily_report(
+    db: Session, report_date: date | None = None, scope: ReportScope | None = None
+) -> Dict:
+    """Return a daily snapshot of task activity and compliance."""
+    day = report_date or date.today()
+    return _cached(db, "daily", (day,), scope, lambda: _daily_report(db, day, scope))
+
+
+def get_weekly_report(
+    db: Session,
+    week_start: date | None = None,
+    include_summaries: bool = True,
+    scope: ReportScope | None = None,
+) -> Dict:
+    """
+    Return a weekly velocity and summary report.
+
+    With ``include_summaries=False`` the per-task ``task_summaries`` are left
+    out; page through them with get_weekly_task_summaries instead.
+    """
+    week_start = week_start or _default_week_start()
+    return _cached(
+        db, "weekly", (week_start, include_summaries), scope,
+        lambda: _weekly_report(db, week_start, include_summaries, scope),
+    )
+
+
+def get_weekly_task_summaries(
+    db: Session,
+    week_start: date | None = None,
+    cursor: int | None = None,
+    limit: int = SUMMARY_PAGE_SIZE,
+    fields: List[str] | None = None,
+    scope: ReportScope | None = None,
+) -> Dict:
+    """
+    Return one page of the weekly task summaries, in task order.
+
+    ``cursor`` is the ``next_cursor`` of the previous page (None for the
+    first); ``next_cursor`` is None on the last page.  ``fields`` keeps only
+    the named summary keys and selects only the columns they need.
+    """
+    week_start = week_start or _default_week_start()
+    fields = _summary_fields(fields)
+    page = _tasks_dataframe(
+        db,
+        active_since=week_start,
+        columns=["id", *_summary_columns(fields)],
+        after_id=cursor,
+        limit=limit + 1,
+        filters=scope_filters(scope),
+    )
+    has_more = len(page) > limit
+    page = page.iloc[:limit]
     return {
         "week_start": week_start.isoformat(),
-        "week_end": week_end.isoformat(),
-        "velocity": velocity,
-        "cycle_time_by_resource": in_week[["assigned_to", "cycle_time"]].to_dict(
-            orient="records"
-        ),
-        "carry_forward_reasons": _carry_forward_reasons(in_week),
-        "risk_heatmap": _risk_frequency(in_week),
-        "task_summaries": summaries,
+        "items": _task_summaries(page, fields),
+        "next_cursor": int(page["id"].iloc[-1]) if has_more else None,
     }
 
 
-def get_monthly_report(db: Session, month_start: date | None = None) -> Dict:
+def get_monthly_report(
+    db: Session, month_start: date | None = None, scope: ReportScope | None = None
+) -> Dict:
     """Return a monthly trend and team performance report."""
-    df = _tasks_dataframe(db)
-    month_start = month_start or date(date.today().year, date.today().month, 1)
-    next_month = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
-    month_end = next_month - timedelta(days=1)
-    ts_month_start = pd.Timestamp(month_start)
+    month_start = month_start or _default_month_start()
+    return _cached(
+        db, "monthly", (month_start,), scope, lambda: _monthly_report(db, month_start, scope)
+    )
 
-    in_month = df[
-        (df["activated_date"] >= ts_month_start) |
-        (df["closed_date"] >= ts_month_start)
-    ]
 
-    return {
-        "month_start": month_start.isoformat(),
-        "month_end": month_end.isoformat(),
-        "cycle_time_trend": in_month[["activated_date", "cycle_time"]].to_dict(
-            orient="records"
+def get_cumulative_flow(
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+    bucket: str = "day",
+    scope: ReportScope | None = None,
+) -> Dict:
+    """
+    Return task counts per state for each bucket of a cumulative flow diagram.
+
+    ``day`` / ``week`` / ``month`` buckets replay the task_updates state
+    history over ``start``..``end`` (default the 30 days up to today) and give
+    the counts at the end of each bucket; ``sprint`` counts the current board
+    per sprint label.  The payload grows with buckets x states, not with tasks.
+
+    The replay opens from the latest board snapshot before ``start`` when
+    there is one (not for an assignee scope, which snapshots do not keep).
+    """
+    if bucket not in CFD_BUCKETS:
+        raise ValueError(f"Unknown bucket: {bucket}. Choose from: {', '.join(CFD_BUCKETS)}")
+    if bucket == "sprint":
+        return _cached(db, "cfd", ("sprint",), scope, lambda: _cfd_by_sprint(db, scope))
+    end = end or date.today()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise ValueError("start must be on or before end")
+    snapshot = None
+    if snapshot_scope_filters(scope) is not None:
+        snapshot = latest_snapshot_before(db, start)
+    snapshot_day = snapshot.snapshot_date if snapshot else None
+    return _cached(
+        db, "cfd", (start, end, bucket), scope,
+        lambda: _cfd_by_date(db, start, end, bucket, scope, snapshot_day),
+        version=(*data_version(db), snapshot and tuple(snapshot)),
+    )
+
+
+def get_dashboard(
+    db: Session,
+    parts: List[str] | None = None,
+    report_date: date | None = None,
+    week_start: date | None = None,
+    month_start: date | None = None,
+    include_summaries: bool = False,
+    scope: ReportScope | None = None,
+) -> Dict:
+    """
+    Return the daily, weekly and monthly reports and the task list in one
+    response; ``parts`` (default all of DASHBOARD_PARTS) picks the sections.
+
+    The data version is read once for the whole response and every section
+    goes through the report cache under the same key the individual report
+    endpoints use, so a refresh after no writes is served from memory.
+    """
+    parts = parts or DASHBOARD_PARTS
+    unknown = sorted(set(parts) - set(DASHBOARD_PARTS))
+    if unknown:
+        raise ValueError(
+            f"Unknown dashboard parts: {', '.join(unknown)}. "
+            f"Choose from: {', '.join(DASHBOARD_PARTS)}"
+        )
+    day = report_date or date.today()
+    week_start = week_start or _default_week_start()
+    month_start = month_start or _default_month_start()
+    sections = {
+        "daily": ((day,), lambda: _daily_report(db, day, scope)),
+        "weekly": (
+            (week_start, include_summaries),
+            lambda: _weekly_report(db, week_start, include_summaries, scope),
         ),
-        "velocity_trend": {
-            "committed": int(in_month["committed_date"].notna().sum()),
-            "completed": int(in_month["closed_date"].notna().sum()),
-        },
-        "delay_trend": in_month[["task_id", "delayed"]].to_dict(orient="records"),
-        "risk_register": _risk_frequency(in_month),
-        "carry_forward_trend": _carry_forward_reasons(in_month),
-        "release_reliability": _release_reliability(in_month),
-        "team_performance": _resource_performance(in_month),
+        "monthly": ((month_start,), lambda: _monthly_report(db, month_start, scope)),
+        "tasks": ((), lambda: _task_list(db, scope)),
     }
+
+    version = data_version(db)
+    dashboard = {}
+    for part in DASHBOARD_PARTS:
+        if part in parts:
+            params, build = sections[part]
+            dashboard[part] = _cached(db, part, params, scope, build, version)
+    if "tasks" in dashboard:
+        dashboard["tasks"] = dashboard["tasks"]["items"]
+    return dashboard
+
+
+def get_report_cache_stats() -> Dict:
+    """Return hit/miss/eviction counters of the report cache."""
+    return _report_cache.stats()
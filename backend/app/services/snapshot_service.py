@@ -0,0 +1,184 @@
+"""
+Daily board snapshots.
+
+take_board_snapshot() stores today's per-(project, sprint, state) task counts
+and story points from the live tasks table; scripts/snapshot_board.py runs it
+from cron.  backfill_board_snapshots() rebuilds earlier days from the state
+history in task_updates.  The cumulative flow report opens from the latest
+snapshot before its window and replays only the tasks changed since, and
+GET /reports/snapshots returns the stored rows.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from ..core.config_defaults import DEFAULTS
+from ..repositories.snapshot_repository import (
+    board_history_frames,
+    board_totals,
+    get_snapshots,
+    replace_snapshots,
+)
+
+# Stands in for NULL project / sprint ids while pivoting (NaN keys are dropped)
+_NO_ID = -1
+
+_GROUP_KEYS = ["project_id", "sprint_id", "state"]
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+def state_events(tasks: pd.DataFrame, state_changes: pd.DataFrame) -> pd.DataFrame:
+    """
+    One (task_id, day, state) row per task per day its state was set.
+
+    Every task enters the board on the day it was created (or on its first
+    state change, if that is earlier): in its current state when it has no
+    state history at all, otherwise in the first workflow state, which the
+    recorded changes then move it out of.  The last recorded state of a day wins.
+    """
+    changes = state_changes.rename(columns={"update_date": "day"})
+    changes["day"] = pd.to_datetime(changes["day"])
+    first_change = changes.groupby("task_id")["day"].min()
+    entered = pd.concat([
+        pd.to_datetime(tasks["created_at"]).dt.normalize(),
+        tasks["task_id"].map(first_change),
+    ], axis=1).min(axis=1)
+    initial = tasks["state"].where(
+        ~tasks["has_history"].astype(bool), DEFAULTS["work_item_states"][0]
+    )
+    created = pd.DataFrame({
+        "task_id": tasks["task_id"],
+        "day": entered,
+        "state": initial.fillna("Unknown"),
+    })
+    events = pd.concat([f for f in (created, changes) if not f.empty] or [created], ignore_index=True)
+    events["day"] = pd.to_datetime(events["day"])
+    return (
+        events.sort_values(["task_id", "day"], kind="stable")
+        .drop_duplicates(["task_id", "day"], keep="last")
+        .reset_index(drop=True)
+    )
+
+
+def _daily_state_totals(
+    tasks: pd.DataFrame, state_changes: pd.DataFrame, start: date, end: date
+) -> pd.DataFrame:
+    """
+    End-of-day task counts and story points per (project, sprint, state) for
+    every day in ``start``..``end``.
+
+    Each state change adds the task to its new state and removes it from the
+    previous one; the per-day deltas are summed and cumulated over the range.
+    Project, sprint and story points are the tasks' current values, since the
+    history does not record them.
+    """
+    events = state_events(tasks, state_changes).merge(
+        tasks[["task_id", "project_id", "sprint_id", "story_points"]], on="task_id"
+    )
+    columns = ["snapshot_date", *_GROUP_KEYS, "task_count", "story_points"]
+    if events.empty:
+        return pd.DataFrame(columns=columns)
+    for key in ("project_id", "sprint_id"):
+        events[key] = pd.to_numeric(events[key]).fillna(_NO_ID).astype(int)
+    events["story_points"] = pd.to_numeric(events["story_points"]).fillna(0.0)
+
+    previous = events.groupby("task_id")["state"].shift()
+    moved = previous.notna()
+    entered = events.assign(task_count=1)
+    left = events[moved].assign(
+        state=previous[moved], task_count=-1, story_points=-events.loc[moved, "story_points"]
+    )
+    deltas = pd.concat([entered, left], ignore_index=True)
+
+    start_ts, end_ts = pd.Timestamp(start), pd.Timestamp(end)
+    deltas = deltas[deltas["day"] <= end_ts]
+    if deltas.empty:
+        return pd.DataFrame(columns=columns)
+    deltas["day"] = deltas["day"].clip(lower=start_ts)   # earlier history is the opening balance
+
+    daily = (
+        deltas.groupby(["day", *_GROUP_KEYS])[["task_count", "story_points"]].sum()
+        .unstack(_GROUP_KEYS, fill_value=0)
+        .reindex(pd.date_range(start_ts, end_ts, freq="D"), fill_value=0)
+        .cumsum()
+        .stack(_GROUP_KEYS, future_stack=True)
+    )
+    daily = daily[daily["task_count"] > 0].reset_index()
+    daily = daily.rename(columns={daily.columns[0]: "snapshot_date"})
+    daily["snapshot_date"] = daily["snapshot_date"].dt.date
+    daily["task_count"] = daily["task_count"].astype(int)
+    daily["story_points"] = daily["story_points"].astype(float).round(6)
+    return daily[columns]
+
+
+def _snapshot_rows(frame: pd.DataFrame) -> List[Dict]:
+    rows = frame.astype(object).to_dict(orient="records")
+    for row in rows:
+        for key in ("project_id", "sprint_id"):
+            if row[key] == _NO_ID:
+                row[key] = None
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Public service API
+# ---------------------------------------------------------------------------
+
+def take_board_snapshot(db: Session, day: Optional[date] = None) -> Dict:
+    """
+    Store the current board totals as the snapshot for ``day`` (default
+    today), replacing any rows already stored for that day.
+    """
+    day = day or date.today()
+    rows = [{"snapshot_date": day, **row._asdict()} for row in board_totals(db)]
+    replace_snapshots(db, day, day, rows)
+    return {"snapshot_date": day.isoformat(), "rows": len(rows)}
+
+
+def backfill_board_snapshots(db: Session, start: date, end: Optional[date] = None) -> Dict:
+    """
+    Rebuild the snapshots for ``start``..``end`` (default today) from the
+    task_updates state history, replacing any rows already stored.
+    """
+    end = end or date.today()
+    if start > end:
+        raise ValueError("start must be on or before end")
+    tasks, state_changes = board_history_frames(db)
+    rows = _snapshot_rows(_daily_state_totals(tasks, state_changes, start, end))
+    replace_snapshots(db, start, end, rows)
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "days": (end - start).days + 1,
+        "rows": len(rows),
+    }
+
+
+def get_board_snapshots(
+    db: Session,
+    start: date,
+    end: date,
+    project_id: Optional[int] = None,
+    sprint_id: Optional[int] = None,
+) -> List[Dict]:
+    """Return stored snapshot rows for ``start``..``end``, oldest first."""
+    if start > end:
+        raise ValueError("start must be on or before end")
+    return [
+        {
+            "snapshot_date": s.snapshot_date.isoformat(),
+            "project_id": s.project_id,
+            "sprint_id": s.sprint_id,
+            "state": s.state,
+            "task_count": s.task_count,
+            "story_points": s.story_points,
+        }
+        for s in get_snapshots(db, start, end, project_id, sprint_id)
+    ]
@@ -1,14 +1,22 @@
-from datetime import date
+import base64
+import json
+from datetime import date, datetime
+from typing import Sequence
+
+from sqlalchemy import ColumnElement
 from sqlalchemy.orm import Session
 
 from ..models.task import Task, TaskUpdate
-from ..schemas.task import WorkItemCreate, WorkItemUpdate
+from ..schemas.task import TaskRead, WorkItemCreate, WorkItemUpdate
 from ..schemas.task_update import TaskUpdateRequest
 from ..repositories.task_repository import (
     get_task_by_id,
     add_task_update,
     save_task,
     get_task_updates_by_task_id,
+    get_task_page,
+    search_rank,
+    TASK_SORT_COLUMNS,
     create_work_item as _repo_create,
     delete_work_item as _repo_delete,
 )
@@ -31,6 +39,8 @@ def update_task_status(db: Session, task_id: str, payload: TaskUpdateRequest) ->
         task.state = payload.state
     if payload.sub_state is not None:
         task.sub_state = payload.sub_state
+    # Manual edits must not be mistaken for an unchanged row on the next import
+    task.content_hash = None
 
     update_entry = TaskUpdate(
         task_id=task_id,
@@ -48,6 +58,11 @@ def get_task_updates(db: Session, task_id: str):
     return get_task_updates_by_task_id(db, task_id)
 
 
+def get_work_item(db: Session, task_id: str) -> Task | None:
+    """Return one work item with every field, or None if not found."""
+    return get_task_by_id(db, task_id)
+
+
 def create_work_item(db: Session, payload: WorkItemCreate) -> Task:
     """Create a new work item from UI."""
     data = payload.model_dump(exclude_none=True)
@@ -68,9 +83,124 @@ def update_work_item(db: Session, task_id: str, payload: WorkItemUpdate) -> Task
     data = payload.model_dump(exclude_none=True)
     for field, value in data.items():
         setattr(task, field, value)
+    task.content_hash = None
     return save_task(db, task)
 
 
+# ── Sparse fieldsets for the work item lists ─────────────────────────────────
+TASK_FIELDS = list(TaskRead.model_fields)
+
+# Named column sets for the common list views (id and task_id are always returned)
+TASK_FIELD_PRESETS = {
+    "board": [
+        "task_id", "work_item_type", "title", "state", "assigned_to",
+        "priority", "story_points",
+    ],
+    "backlog": [
+        "task_id", "work_item_type", "parent_task_id", "title", "state",
+        "assigned_to", "priority", "story_points", "sprint",
+    ],
+    "mobile": [
+        "task_id", "work_item_type", "parent_task_id", "title", "state",
+        "assigned_to", "priority", "story_points",
+    ],
+}
+
+
+def task_list_fields(fields: list[str] | None) -> list[str]:
+    """
+    Resolve a ``fields=`` list into TaskRead columns, in schema order.
+    Preset names expand to their columns and may be mixed with single
+    fields; None or empty means every field.  Raises ValueError for
+    anything else.
+    """
+    if not fields:
+        return TASK_FIELDS
+    unknown = sorted(set(fields) - set(TASK_FIELDS) - set(TASK_FIELD_PRESETS))
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Choose from the presets "
+            f"{', '.join(TASK_FIELD_PRESETS)} or: {', '.join(TASK_FIELDS)}"
+        )
+    wanted = {"id", "task_id"}
+    for name in fields:
+        wanted.update(TASK_FIELD_PRESETS.get(name, [name]))
+    return [f for f in TASK_FIELDS if f in wanted]
+
+
+# ── Keyset-paginated work item lists ──────────────────────────────────────────
+# ``sort`` is a TASK_SORT_COLUMNS name, prefixed with "-" for descending, or
+# "relevance" (best search match first; the default when searching)
+TASK_SORTS = [s for c in TASK_SORT_COLUMNS for s in (c, f"-{c}")] + ["relevance"]
+TASK_PAGE_SIZE = 200
+MAX_TASK_PAGE_SIZE = 1000
+
+
+def _encode_cursor(sort: str, row: dict) -> str:
+    value = row[sort.lstrip("-")]
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, row["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple:
+    """Return the (sort value, id) a cursor points after; ValueError if it is not one of ours."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, row_id = json.loads(raw)
+        if cursor_sort != sort or not isinstance(row_id, int):
+            raise ValueError
+        if value is not None and sort.lstrip("-") == "updated_at":
+            value = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid cursor for sort={sort}") from None
+    return value, row_id
+
+
+def list_task_page(
+    db: Session,
+    columns: list[str],
+    filters: Sequence[ColumnElement[bool]] = (),
+    sort: str | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+    search: str | None = None,
+) -> tuple[list[dict], str | None]:
+    """
+    Return one page of task rows and the cursor of the next page (None on
+    the last one).  Without ``limit`` or ``cursor`` every matching row is
+    returned; a ``cursor`` alone reads a TASK_PAGE_SIZE page.  ``search``
+    (the text the filters match) enables sort="relevance", the default
+    when it is given; otherwise rows come in id order.  Raises ValueError
+    for an unknown sort or a cursor from another sort.
+    """
+    sort = sort or ("relevance" if search else "id")
+    if sort not in TASK_SORTS:
+        raise ValueError(f"Unknown sort: {sort}. Choose from: {', '.join(TASK_SORTS)}")
+    if sort == "relevance" and not search:
+        raise ValueError("sort=relevance needs a search")
+    after = _decode_cursor(cursor, sort) if cursor else None
+    if limit is None and cursor is not None:
+        limit = TASK_PAGE_SIZE
+    rows = get_task_page(
+        db, columns, filters,
+        sort=sort.lstrip("-"),
+        descending=sort.startswith("-") or sort == "relevance",
+        after=after,
+        limit=None if limit is None else limit + 1,
+        order=search_rank(search) if sort == "relevance" else None,
+    )
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(sort, rows[-1])
+    extra = {"id", sort.lstrip("-")} - set(columns)
+    if extra:
+        rows = [{k: v for k, v in row.items() if k not in extra} for row in rows]
+    return rows, next_cursor
+
+
 def update_task_status(db: Session, task_id: str, payload: TaskUpdateRequest) -> Task:
     task = get_task_by_id(db, task_id)
     if task is None:
@@ -88,6 +218,8 @@ def update_task_status(db: Session, task_id: str, payload: TaskUpdateRequest) ->
         task.state = payload.state
     if payload.sub_state is not None:
         task.sub_state = payload.sub_state
+    # Manual edits must not be mistaken for an unchanged row on the next import
+    task.content_hash = None
 
     update_entry = TaskUpdate(
         task_id=task_id,
@@ -0,0 +1,15 @@
+"""
+Import path setup shared by the benchmark scripts.
+
+The scripts are run as files from the repository root
+(``python backend/benchmarks/bench_x.py``), which puts this directory, not
+the root, on sys.path.  Importing this module adds the root so the
+``backend.app`` / ``backend.benchmarks`` imports that follow resolve.
+"""
+import os
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
@@ -0,0 +1,121 @@
+"""
+Synthetic Azure DevOps export generator for ingestion benchmarks.
+
+Produces realistic work-item dumps: every header spelling in
+ingestion_service.COLUMN_ALIASES (one spelling per file, selected by
+``variant``), mixed date formats, messy criticality values and blank cells.
+
+    python backend/benchmarks/ado_dump_generator.py --rows 100000 --format csv --out dump.csv
+"""
+import argparse
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+if not __package__:
+    # Run as a file; the tests and the other benchmarks import it as a module
+    import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
+
+from backend.app.services.ingestion_service import COLUMN_ALIASES
+
+FORMATS = ("csv", "json", "xlsx")
+
+STATES = ["New", "Active", "Resolved", "Closed"]
+SUB_STATES = ["In Progress", "Blocked", "In Review", "Testing", "Done", None]
+CRITICALITY = ["Critical", "high", "Medium", " low ", "Very Low", "VERY LOW", "Unknown", None]
+PEOPLE = [f"dev{i}@example.com" for i in range(40)] + [None]
+RISKS = ["Dependency slip", "Env outage", "Scope creep", None, None, None]
+CARRY_FORWARD = ["Blocked by API", "Underestimated", "Priority change", None, None, None]
+DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%Y-%m-%dT%H:%M:%S", "%d %b %Y"]
+
+_SPELLINGS = defaultdict(list)
+for _alias, _canonical in COLUMN_ALIASES.items():
+    _SPELLINGS[_canonical].append(_alias)
+
+# Number of header variants needed to use every alias at least once
+VARIANT_COUNT = max(len(spellings) for spellings in _SPELLINGS.values())
+
+
+def header_for(canonical: str, variant: int) -> str:
+    """Return one source spelling of a canonical column, title-cased like ADO exports."""
+    spellings = _SPELLINGS[canonical]
+    return spellings[variant % len(spellings)].title()
+
+
+def _format_dates(rng: np.random.Generator, dates: pd.Series, blank_ratio: float) -> np.ndarray:
+    fmt_index = rng.integers(0, len(DATE_FORMATS), len(dates))
+    out = np.empty(len(dates), dtype=object)
+    for i, fmt in enumerate(DATE_FORMATS):
+        mask = fmt_index == i
+        out[mask] = dates[mask].dt.strftime(fmt).to_numpy()
+    out[rng.random(len(dates)) < blank_ratio] = None
+    return out
+
+
+def generate_dump(rows: int, variant: int = 0, seed: int = 7) -> pd.DataFrame:
+    """Build a synthetic ADO export with ``rows`` work items."""
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2024-01-01")
+    activated = base + pd.to_timedelta(rng.integers(0, 540, rows), unit="D")
+    target = activated + pd.to_timedelta(rng.integers(3, 20, rows), unit="D")
+    committed = activated + pd.to_timedelta(rng.integers(0, 5, rows), unit="D")
+    closed = activated + pd.to_timedelta(rng.integers(1, 30, rows), unit="D")
+    release = closed + pd.to_timedelta(rng.integers(0, 10, rows), unit="D")
+    updated = activated + pd.to_timedelta(rng.integers(0, 30, rows), unit="D")
+    activated, target, committed, closed, release, updated = (
+        pd.Series(d) for d in (activated, target, committed, closed, release, updated)
+    )
+    cycle = (closed - activated).dt.days.astype(float).to_numpy()
+    cycle[rng.random(rows) < 0.5] = np.nan   # half left for the pipeline to derive
+
+    columns = {
+        "task_id": np.arange(100000, 100000 + rows),
+        "title": [f"Work item {i}" for i in range(rows)],
+        "assigned_to": rng.choice(np.array(PEOPLE, dtype=object), rows),
+        "state": rng.choice(STATES, rows),
+        "sub_state": rng.choice(np.array(SUB_STATES, dtype=object), rows),
+        "iteration_path": [f"Project\\Sprint {n}" for n in rng.integers(1, 40, rows)],
+        "activated_date": _format_dates(rng, activated, 0.05),
+        "target_date": _format_dates(rng, target, 0.2),
+        "committed_date": _format_dates(rng, committed, 0.3),
+        "release_date": _format_dates(rng, release, 0.6),
+        "closed_date": _format_dates(rng, closed, 0.4),
+        "cycle_time": cycle,
+        "current_status": rng.choice(["On Track", "At Risk", "Off Track"], rows),
+        "current_update": [f"Progress note {n}" for n in rng.integers(0, 10_000, rows)],
+        "update_date": _format_dates(rng, updated, 0.1),
+        "risk_item": rng.choice(np.array(RISKS, dtype=object), rows),
+        "carry_forward_reason": rng.choice(np.array(CARRY_FORWARD, dtype=object), rows),
+        "criticality": rng.choice(np.array(CRITICALITY, dtype=object), rows),
+    }
+    return pd.DataFrame({header_for(name, variant): values for name, values in columns.items()})
+
+
+def write_dump(df: pd.DataFrame, path: str) -> None:
+    """Write a generated dump in the format implied by the file extension."""
+    if path.endswith(".csv"):
+        df.to_csv(path, index=False)
+    elif path.endswith(".json"):
+        df.to_json(path, orient="records")
+    elif path.endswith(".xlsx"):
+        df.to_excel(path, index=False)
+    else:
+        raise ValueError(f"Unsupported extension for {path}; use one of {FORMATS}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--variant", type=int, default=0, help="header spelling set (cycles)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+
+    write_dump(generate_dump(args.rows, args.variant, args.seed), args.out)
+    print(f"wrote {args.rows:,} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
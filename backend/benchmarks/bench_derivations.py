@@ -0,0 +1,105 @@
+"""
+Benchmark the criticality / delay derivation stages of the ingestion pipeline.
+
+Compares the column-wise stages in ingestion_service against the previous
+row-wise ``DataFrame.apply`` implementations and checks both produce the
+same frame.
+
+    python backend/benchmarks/bench_derivations.py --rows 200000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
+
+from backend.app.services.ingestion_service import (
+    CRITICALITY_TIMELINES,
+    _apply_criticality,
+    _apply_delay_flag,
+    _compute_cycle_time,
+)
+
+CRITICALITY_VALUES = ["Critical", "high", " Medium ", "LOW", "Very Low", "unknown", None, np.nan]
+
+
+# ── Row-wise reference implementations (pre-vectorisation) ────────────────────
+
+def _legacy_apply_criticality(df: pd.DataFrame) -> pd.DataFrame:
+    def timeline(row):
+        crit = str(row.get("criticality") or "").strip().lower()
+        return CRITICALITY_TIMELINES.get(crit)
+
+    if "criticality" in df.columns:
+        timeline_values = df.apply(timeline, axis=1)
+        df["expected_timeline_min"] = timeline_values.apply(
+            lambda x: x[0] if isinstance(x, tuple) else np.nan
+        )
+        df["expected_timeline_max"] = timeline_values.apply(
+            lambda x: x[1] if isinstance(x, tuple) else np.nan
+        )
+    else:
+        df["expected_timeline_min"] = np.nan
+        df["expected_timeline_max"] = np.nan
+    return df
+
+
+def _legacy_apply_delay_flag(df: pd.DataFrame) -> pd.DataFrame:
+    def is_delayed(row):
+        cycle = row.get("cycle_time")
+        max_days = row.get("expected_timeline_max")
+        if pd.isna(cycle) or pd.isna(max_days):
+            return False
+        return float(cycle) > float(max_days)
+
+    df["delayed"] = df.apply(is_delayed, axis=1)
+    return df
+
+
+# ── Harness ───────────────────────────────────────────────────────────────────
+
+def make_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    activated = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D")
+    closed = activated + pd.to_timedelta(rng.integers(0, 30, rows), unit="D")
+    closed = closed.where(rng.random(rows) > 0.3)
+    df = pd.DataFrame({
+        "task_id": np.arange(rows).astype(str),
+        "criticality": rng.choice(np.array(CRITICALITY_VALUES, dtype=object), rows),
+        "activated_date": activated.date,
+        "closed_date": pd.Series(closed).dt.date,
+    })
+    return _compute_cycle_time(df)
+
+
+def run_stages(df: pd.DataFrame, criticality, delay) -> tuple[pd.DataFrame, float]:
+    start = time.perf_counter()
+    out = delay(criticality(df.copy()))
+    return out, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    legacy_best = vector_best = float("inf")
+    for _ in range(args.repeat):
+        legacy_out, elapsed = run_stages(df, _legacy_apply_criticality, _legacy_apply_delay_flag)
+        legacy_best = min(legacy_best, elapsed)
+        vector_out, elapsed = run_stages(df, _apply_criticality, _apply_delay_flag)
+        vector_best = min(vector_best, elapsed)
+
+    pd.testing.assert_frame_equal(legacy_out, vector_out)
+    print(f"rows:       {args.rows:,}")
+    print(f"row-wise:   {legacy_best * 1000:9.1f} ms")
+    print(f"vectorised: {vector_best * 1000:9.1f} ms")
+    print(f"speedup:    {legacy_best / vector_best:9.1f}x  (outputs identical)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark the Monte Carlo delivery forecast.
+
+Seeds a scratch database with synthetic tasks, then times the vectorised
+NumPy simulation against a per-trial Python loop for a few backlog sizes
+(checking both give the same percentiles within a day), and the full
+forecast service cold and repeated from the forecast cache.
+
+    python backend/benchmarks/bench_forecast.py --rows 100000 --trials 50000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import date
+from datetime import timedelta
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
+
+from backend.app.core.base import Base
+from backend.app.services import forecast_service
+from backend.app.services.ingestion_service import _prepare_dataframe, _write_tasks
+from backend.benchmarks.ado_dump_generator import generate_dump
+
+
+# ── Per-trial loop, kept for comparison ───────────────────────────────────────
+
+def _loop_completion_days(samples: np.ndarray, remaining: float, trials: int) -> np.ndarray:
+    pool = samples.tolist()
+    days = []
+    for _ in range(trials):
+        delivered, n = 0.0, 0
+        while delivered < remaining:
+            delivered += random.choice(pool)
+            n += 1
+        days.append(n)
+    return np.array(days, dtype=float)
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--trials", type=int, default=forecast_service.FORECAST_TRIALS)
+    parser.add_argument("--backlogs", default="50,200,1000")
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2025, 6, 1))
+    parser.add_argument("--database-url", help="scratch database (default: temp sqlite file)")
+    args = parser.parse_args()
+    backlogs = [int(b) for b in args.backlogs.split(",")]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        engine = create_engine(url)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        _write_tasks(db, _prepare_dataframe(generate_dump(args.rows)))
+
+        history_start = args.start - timedelta(days=forecast_service.HISTORY_DAYS)
+        history_end = args.start - timedelta(days=1)
+        samples = forecast_service._daily_throughput(db, history_start, history_end, "tasks")
+
+        print(f"tasks:                 {args.rows:,}")
+        print(f"trials:                {args.trials:,}")
+        print(f"throughput / day:      {samples.mean():.2f} over {len(samples)} days")
+        for backlog in backlogs:
+            vec, vec_days = _timed(
+                forecast_service.simulate_completion_days, samples, backlog, args.trials
+            )
+            loop, loop_days = _timed(_loop_completion_days, samples, backlog, args.trials)
+            pcts = forecast_service.PERCENTILES
+            gap = np.abs(np.percentile(vec_days, pcts) - np.percentile(loop_days, pcts)).max()
+            cold, _ = _timed(
+                forecast_service.get_delivery_forecast, db, backlog, None, "tasks",
+                forecast_service.HISTORY_DAYS, args.trials, args.start,
+            )
+            warm, _ = _timed(
+                forecast_service.get_delivery_forecast, db, backlog, None, "tasks",
+                forecast_service.HISTORY_DAYS, args.trials, args.start,
+            )
+            print(f"backlog {backlog:>6}:")
+            print(f"  per-trial loop:      {loop * 1000:9.1f} ms")
+            print(f"  vectorised NumPy:    {vec * 1000:9.1f} ms  ({loop / vec:.1f}x)")
+            print(f"  forecast (cold):     {cold * 1000:9.1f} ms")
+            print(f"  forecast (cached):   {warm * 1000:9.1f} ms")
+            print(f"  percentiles agree:   {gap <= 1}  (max gap {gap:.0f} days)")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Stage-by-stage benchmark of the ADO import pipeline.
+
+For every size x format it generates a synthetic dump, then times
+_parse_file, _normalize_columns, _coerce_dates, _compute_cycle_time,
+_apply_criticality, _apply_delay_flag and the database write, recording
+wall time and peak traced memory per stage.  Results are written as JSON so
+runs can be compared with --compare.
+
+    python backend/benchmarks/bench_ingestion.py --sizes 1000,10000,100000 --output run.json
+    python backend/benchmarks/bench_ingestion.py --sizes 10000 --compare run.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
+
+from backend.app.core.base import Base
+from backend.app.services.ingestion_service import (
+    COLUMN_ALIASES,
+    _apply_criticality,
+    _apply_delay_flag,
+    _coerce_dates,
+    _compute_cycle_time,
+    _normalize_columns,
+    _parse_file,
+    _write_tasks,
+)
+from backend.benchmarks.ado_dump_generator import (
+    FORMATS,
+    VARIANT_COUNT,
+    generate_dump,
+    write_dump,
+)
+
+DEFAULT_SIZES = "1000,10000,100000"
+
+
+def _measure(results: dict, stage: str, fn, *args, trace_memory: bool = True):
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    value = fn(*args)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    results[stage] = {"seconds": round(elapsed, 6), "peak_bytes": peak}
+    return value
+
+
+def run_case(rows: int, fmt: str, database_url: str, workdir: str, trace_memory: bool) -> dict:
+    path = os.path.join(workdir, f"dump_{rows}.{fmt}")
+    write_dump(generate_dump(rows), path)
+    with open(path, "rb") as fh:
+        content = fh.read()
+
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    stages: dict = {}
+    df = _measure(stages, "parse_file", _parse_file, content, path, trace_memory=trace_memory)
+    df = _measure(stages, "normalize_columns", _normalize_columns, df, trace_memory=trace_memory)
+    df = _measure(stages, "coerce_dates", _coerce_dates, df, trace_memory=trace_memory)
+    df = _measure(stages, "compute_cycle_time", _compute_cycle_time, df, trace_memory=trace_memory)
+    df = _measure(stages, "apply_criticality", _apply_criticality, df, trace_memory=trace_memory)
+    df = _measure(stages, "apply_delay_flag", _apply_delay_flag, df, trace_memory=trace_memory)
+    counts = _measure(stages, "db_write", _write_tasks, db, df, trace_memory=trace_memory)
+    db.close()
+    engine.dispose()
+
+    return {
+        "rows": rows,
+        "format": fmt,
+        "file_bytes": len(content),
+        "counts": counts,
+        "stages": stages,
+        "total_seconds": round(sum(s["seconds"] for s in stages.values()), 6),
+    }
+
+
+def check_alias_variants() -> list:
+    """Every header spelling must normalise to the full canonical column set."""
+    expected = set(COLUMN_ALIASES.values())
+    missing = []
+    for variant in range(VARIANT_COUNT):
+        columns = set(_normalize_columns(generate_dump(10, variant)).columns)
+        if columns != expected:
+            missing.append({"variant": variant, "missing": sorted(expected - columns)})
+    return missing
+
+
+def compare(current: dict, baseline_path: str) -> None:
+    with open(baseline_path) as fh:
+        baseline = json.load(fh)
+    previous = {(r["rows"], r["format"]): r for r in baseline["results"]}
+    print(f"\nvs {baseline_path} ({baseline['started_at']})")
+    for result in current["results"]:
+        before = previous.get((result["rows"], result["format"]))
+        if before is None:
+            continue
+        for stage, now in result["stages"].items():
+            then = before["stages"].get(stage)
+            if then and then["seconds"]:
+                ratio = now["seconds"] / then["seconds"]
+                print(f"  {result['format']:>4} {result['rows']:>9,} {stage:<20} {ratio:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated row counts, e.g. 1000,1000000")
+    parser.add_argument("--formats", default=",".join(FORMATS))
+    parser.add_argument("--database-url", default="sqlite://", help="scratch database; tables are recreated")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc (faster, timing only)")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    args = parser.parse_args()
+
+    run = {
+        "started_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "database": args.database_url.split(":")[0],
+        "alias_variant_failures": check_alias_variants(),
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in (int(s) for s in args.sizes.split(",")):
+            for fmt in args.formats.split(","):
+                result = run_case(rows, fmt, args.database_url, workdir, not args.no_memory)
+                run["results"].append(result)
+                peak = max((s["peak_bytes"] or 0) for s in result["stages"].values())
+                print(
+                    f"{fmt:>4} {rows:>9,} rows  total {result['total_seconds']:8.2f}s  "
+                    f"peak stage memory {peak / 2**20:8.1f} MiB"
+                )
+    run["max_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(run, fh, indent=2)
+        print(f"results written to {args.output}")
+    if args.compare:
+        compare(run, args.compare)
+
+
+if __name__ == "__main__":
+    main()
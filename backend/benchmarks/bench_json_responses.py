@@ -0,0 +1,125 @@
+"""
+Benchmark the list and report response path.
+
+Seeds a scratch database with synthetic tasks, then serves /tasks and
+/reports/dashboard through FastAPI twice: the previous path (ORM objects
+validated through the TaskRead / DashboardRead response models and
+jsonable_encoder) and the current one (column tuples zipped into dicts and
+written by FastJSONResponse), checking that both return the same JSON.
+Then times /workitems with each ``fields=`` preset against the full rows.
+
+    python backend/benchmarks/bench_json_responses.py --rows 30000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
+
+from backend.app.core import db as core_db
+from backend.app.core.base import Base
+from backend.app.core.dependencies import get_db
+from backend.app.controllers.report_controller import router as report_router
+from backend.app.controllers.task_controller import router as task_router
+from backend.app.repositories.task_repository import get_all_tasks
+from backend.app.schemas.report import DashboardRead
+from backend.app.schemas.task import TaskRead
+from backend.app.services import report_service
+from backend.app.services.task_service import TASK_FIELD_PRESETS
+from backend.app.services.ingestion_service import _prepare_dataframe, _write_tasks
+from backend.benchmarks.ado_dump_generator import generate_dump
+
+DAY = date(2025, 6, 18)
+DASHBOARD_QUERY = "report_date=2025-06-18&week_start=2025-06-16&month_start=2025-06-01"
+
+
+# ── Previous path (response-model validation + jsonable_encoder) ──────────────
+
+legacy = APIRouter(prefix="/legacy")
+
+
+@legacy.get("/tasks", response_model=list[TaskRead])
+def _legacy_tasks(db=Depends(get_db)):
+    return get_all_tasks(db)
+
+
+@legacy.get("/reports/dashboard", response_model=DashboardRead, response_model_exclude_unset=True)
+def _legacy_dashboard(db=Depends(get_db)):
+    return report_service.get_dashboard(
+        db, report_date=DAY, week_start=date(2025, 6, 16), month_start=date(2025, 6, 1)
+    )
+
+
+def _best_of(repeat: int, client: TestClient, url: str) -> tuple[float, bytes]:
+    best, body = float("inf"), b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url)
+        best = min(best, time.perf_counter() - start)
+        response.raise_for_status()
+        body = response.content
+    return best, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=30_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    app = FastAPI()
+    app.include_router(task_router)
+    app.include_router(report_router)
+    app.include_router(legacy)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(engine)
+        core_db.SessionLocal.configure(bind=engine)
+        db = core_db.SessionLocal()
+        _write_tasks(db, _prepare_dataframe(generate_dump(args.rows)))
+        db.close()
+
+        client = TestClient(app)
+        results = {}
+        for name, old_url, new_url in [
+            ("/tasks", "/legacy/tasks", "/tasks"),
+            ("/reports/dashboard", "/legacy/reports/dashboard", f"/reports/dashboard?{DASHBOARD_QUERY}"),
+        ]:
+            old, _ = _best_of(args.repeat, client, old_url)
+            new, new_body = _best_of(args.repeat, client, new_url)
+            same = client.get(old_url).json() == client.get(new_url).json()
+            results[name] = (old, new, len(new_body), same)
+        fieldsets = {
+            preset: _best_of(args.repeat, client, f"/workitems?fields={preset}")
+            for preset in ["", *TASK_FIELD_PRESETS]
+        }
+        engine.dispose()
+
+    print(f"tasks:                 {args.rows:,}")
+    for name, (old, new, size, same) in results.items():
+        print(f"{name}  ({size / 1e6:.1f} MB)")
+        print(f"  response model path: {old * 1000:9.1f} ms  ({args.rows / old:,.0f} rows/s)")
+        print(f"  FastJSONResponse:    {new * 1000:9.1f} ms  ({args.rows / new:,.0f} rows/s, {old / new:.1f}x)")
+        print(f"  identical JSON:      {same}")
+    full, full_body = fieldsets.pop("")
+    print("/workitems fieldsets")
+    print(f"  all fields:          {full * 1000:9.1f} ms  ({len(full_body) / 1e6:.1f} MB)")
+    for preset, (elapsed, body) in fieldsets.items():
+        print(
+            f"  fields={preset + ':':<13}{elapsed * 1000:9.1f} ms  "
+            f"({len(body) / 1e6:.1f} MB, {len(body) / len(full_body):.0%} of the payload)"
+        )
+
+
+if __name__ == "__main__":
+    main()
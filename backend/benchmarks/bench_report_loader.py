@@ -0,0 +1,236 @@
+"""
+Benchmark the report_service task loader and report queries.
+
+Seeds a scratch database with synthetic tasks, then compares the previous
+ORM-hydrating ``_tasks_dataframe`` with the column-projected SQL loader, and
+the previous pandas-grouped daily / weekly / monthly reports with the SQL
+GROUP BY reports (uncached, and repeated from the report cache), checking
+that both produce identical responses.
+
+    python backend/benchmarks/bench_report_loader.py --rows 100000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import date
+from datetime import timedelta
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import _bootstrap  # noqa: F401  (puts the repository root on sys.path)
+
+from backend.app.core.base import Base
+from backend.app.models.task import Task
+from backend.app.services import report_service
+from backend.app.services.ingestion_service import _prepare_dataframe, _write_tasks
+from backend.benchmarks.ado_dump_generator import generate_dump
+
+
+# ── Previous loader (ORM hydration), kept for comparison ──────────────────────
+
+def _legacy_tasks_dataframe(db, active_since=None) -> pd.DataFrame:
+    rows = db.query(Task).order_by(Task.id).all()
+    data = [{c: getattr(t, c) for c in report_service._REPORT_COLUMNS} for t in rows]
+    df = pd.DataFrame(data) if data else pd.DataFrame(columns=report_service._REPORT_COLUMNS)
+    for col in report_service._DATE_COLS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+    return df
+
+
+# ── Previous reports (whole table grouped in pandas), kept for comparison ─────
+
+def _resource_performance(df: pd.DataFrame) -> list:
+    if df.empty:
+        return []
+    grouped = df.groupby("assigned_to", dropna=False).agg(
+        avg_cycle_time=("cycle_time", "mean"),
+        completed=("closed_date", "count"),
+        delayed_count=("delayed", "sum"),
+    )
+    return grouped.reset_index().fillna("Unassigned").to_dict(orient="records")
+
+
+def _risk_frequency(df: pd.DataFrame) -> list:
+    if df.empty:
+        return []
+    grouped = df[df["risk_item"].notna()].groupby("iteration_path").size()
+    return grouped.reset_index(name="risk_count").to_dict(orient="records")
+
+
+def _carry_forward_reasons(df: pd.DataFrame) -> list:
+    if df.empty:
+        return []
+    grouped = df[df["carry_forward_reason"].notna()].groupby("carry_forward_reason").size()
+    return grouped.reset_index(name="count").to_dict(orient="records")
+
+
+def _daily_update_compliance(df: pd.DataFrame, as_of: date) -> list:
+    if df.empty:
+        return []
+    df = df.copy()
+    df["has_update"] = df["current_update"].notna()
+    if "update_date" in df.columns:
+        df["on_date"] = df["update_date"].dt.normalize() == pd.Timestamp(as_of)
+    else:
+        df["on_date"] = False
+    grouped = df.groupby("assigned_to", dropna=False).agg(
+        total=("task_id", "count"),
+        updated=("on_date", "sum"),
+        has_update=("has_update", "sum"),
+    )
+    return grouped.reset_index().fillna("Unassigned").to_dict(orient="records")
+
+
+def _legacy_daily(db, day: date) -> dict:
+    df = _legacy_tasks_dataframe(db)
+    ts_day = pd.Timestamp(day)
+    activated = df[df["activated_date"].dt.normalize() == ts_day]
+    closed = df[df["closed_date"].dt.normalize() == ts_day]
+    return {
+        "date": day.isoformat(),
+        "status_distribution": df["state"].fillna("Unknown").value_counts().to_dict(),
+        "activated_today": activated[["task_id", "title", "assigned_to"]].to_dict(orient="records"),
+        "closed_today": closed[["task_id", "title", "assigned_to"]].to_dict(orient="records"),
+        "risks_last_24h": df[df["risk_item"].notna()][["task_id", "risk_item"]].to_dict(orient="records"),
+        "compliance": _daily_update_compliance(df, day),
+    }
+
+
+def _legacy_window(db, start: date) -> pd.DataFrame:
+    df = _legacy_tasks_dataframe(db)
+    ts = pd.Timestamp(start)
+    return df[(df["activated_date"] >= ts) | (df["closed_date"] >= ts)]
+
+
+def _legacy_weekly(db, week_start: date) -> dict:
+    in_week = _legacy_window(db, week_start)
+    return {
+        "week_start": week_start.isoformat(),
+        "week_end": (week_start + timedelta(days=6)).isoformat(),
+        "velocity": {
+            "committed": int(in_week["committed_date"].notna().sum()),
+            "completed": int(in_week["closed_date"].notna().sum()),
+        },
+        "cycle_time_by_resource": in_week[["assigned_to", "cycle_time"]].to_dict(orient="records"),
+        "carry_forward_reasons": _carry_forward_reasons(in_week),
+        "risk_heatmap": _risk_frequency(in_week),
+    }
+
+
+def _legacy_monthly(db, month_start: date) -> dict:
+    in_month = _legacy_window(db, month_start)
+    next_month = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return {
+        "month_start": month_start.isoformat(),
+        "month_end": (next_month - timedelta(days=1)).isoformat(),
+        "cycle_time_trend": in_month[["activated_date", "cycle_time"]].to_dict(orient="records"),
+        "velocity_trend": {
+            "committed": int(in_month["committed_date"].notna().sum()),
+            "completed": int(in_month["closed_date"].notna().sum()),
+        },
+        "delay_trend": in_month[["task_id", "delayed"]].to_dict(orient="records"),
+        "risk_register": _risk_frequency(in_month),
+        "carry_forward_trend": _carry_forward_reasons(in_month),
+        "release_reliability": report_service._release_reliability(in_month),
+        "team_performance": _resource_performance(in_month),
+    }
+
+
+def _legacy_reports(db, day: date) -> list:
+    week_start = date.fromordinal(day.toordinal() - day.weekday())
+    return [
+        _legacy_daily(db, day),
+        _legacy_weekly(db, week_start),
+        _legacy_monthly(db, day.replace(day=1)),
+    ]
+
+
+def _sql_reports(db, day: date) -> list:
+    week_start = date.fromordinal(day.toordinal() - day.weekday())
+    weekly = report_service._weekly_report(db, week_start)
+    weekly.pop("task_summaries")   # unchanged row-level section, not grouped
+    return [
+        report_service._daily_report(db, day),
+        weekly,
+        report_service._monthly_report(db, day.replace(day=1)),
+    ]
+
+
+def _canonical(reports: list) -> str:
+    """JSON with dict keys sorted, floats rounded and NaN/NaT as null, for comparison."""
+    def _round(value):
+        if value is pd.NaT:
+            return None
+        if isinstance(value, float):
+            return None if value != value else round(value, 9)
+        if isinstance(value, dict):
+            return {k: _round(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [_round(v) for v in value]
+        return value
+    return json.dumps(_round(reports), default=str, sort_keys=True)
+
+
+def _cached_reports(db, day: date) -> list:
+    week_start = date.fromordinal(day.toordinal() - day.weekday())
+    return [
+        report_service.get_daily_report(db, day),
+        report_service.get_weekly_report(db, week_start),
+        report_service.get_monthly_report(db, day.replace(day=1)),
+    ]
+
+
+def _best_of(repeat: int, fn, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--database-url", help="scratch database (default: temp sqlite file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        engine = create_engine(url)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        _write_tasks(db, _prepare_dataframe(generate_dump(args.rows)))
+
+        legacy = _best_of(args.repeat, _legacy_tasks_dataframe, db)
+        projected = _best_of(args.repeat, report_service._tasks_dataframe, db)
+        windowed = _best_of(args.repeat, report_service._tasks_dataframe, db, date(2025, 6, 1))
+
+        day = date(2025, 6, 18)
+        pandas_reports = _best_of(args.repeat, _legacy_reports, db, day)
+        sql_reports = _best_of(args.repeat, _sql_reports, db, day)
+        _cached_reports(db, day)
+        cached_reports = _best_of(args.repeat, _cached_reports, db, day)
+        identical = _canonical(_legacy_reports(db, day)) == _canonical(_sql_reports(db, day))
+        db.close()
+        engine.dispose()
+
+    print(f"tasks:                 {args.rows:,}")
+    print(f"ORM hydration:         {legacy * 1000:9.1f} ms")
+    print(f"column-projected SQL:  {projected * 1000:9.1f} ms  ({legacy / projected:.1f}x)")
+    print(f"  with date window:    {windowed * 1000:9.1f} ms  ({legacy / windowed:.1f}x)")
+    print(f"pandas-grouped reports:{pandas_reports * 1000:9.1f} ms")
+    print(f"SQL GROUP BY reports:  {sql_reports * 1000:9.1f} ms  ({pandas_reports / sql_reports:.1f}x)")
+    print(f"  repeat from cache:   {cached_reports * 1000:9.1f} ms  ({pandas_reports / cached_reports:.1f}x)")
+    print(f"reports identical:     {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Store daily board snapshots (task counts and story points per project,
+sprint and state).  Schedule it once a day, e.g. from cron:
+
+    5 0 * * *  python backend/scripts/snapshot_board.py
+
+Use --backfill-from to rebuild older days from the task_updates history:
+
+    python backend/scripts/snapshot_board.py --backfill-from 2025-01-01
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from backend.app.core.db import SessionLocal
+from backend.app.services.snapshot_service import backfill_board_snapshots, take_board_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store daily board snapshots.")
+    parser.add_argument("--date", type=date.fromisoformat, help="snapshot day (default: today)")
+    parser.add_argument("--backfill-from", type=date.fromisoformat,
+                        help="rebuild every day from this date up to --date from task history")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        if args.backfill_from:
+            result = backfill_board_snapshots(session, args.backfill_from, args.date)
+            print(f"Backfilled {result['days']} days ({result['rows']} rows) "
+                  f"from {result['start']} to {result['end']}.")
+        else:
+            result = take_board_snapshot(session, args.date)
+            print(f"Stored {result['rows']} snapshot rows for {result['snapshot_date']}.")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
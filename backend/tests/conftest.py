@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.app.core import db as core_db  # noqa: E402
+from backend.app.core.base import Base  # noqa: E402
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with every table; SessionLocal is bound to it."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    previous = core_db.SessionLocal.kw.get("bind")
+    core_db.SessionLocal.configure(bind=engine)
+    yield engine
+    core_db.SessionLocal.configure(bind=previous)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(engine):
+    """TestClient for the task routes, on the in-memory database."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from backend.app.controllers.task_controller import router
+
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def report_client(engine):
+    """TestClient for the report routes, on the in-memory database."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from backend.app.controllers.report_controller import router
+
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as client:
+        yield client
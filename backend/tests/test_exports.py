@@ -0,0 +1,123 @@
+import csv
+import io
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from backend.app.models.task import Task, TaskUpdate
+from backend.app.services import export_service
+from backend.app.services.export_service import export_columnar
+
+
+def _seed(db, count=5):
+    for n in range(1, count + 1):
+        db.add(Task(
+            task_id=str(n),
+            title=f"Task {n}",
+            state="Closed" if n % 2 else "Active",
+            story_points=float(n) if n != 3 else None,
+            expected_timeline_max=None if n in (3, 4) else n * 2,
+        ))
+        db.add(TaskUpdate(task_id=str(n), update_date=date(2025, 6, n), current_update=f"update {n}"))
+    db.commit()
+
+
+def _read(content: bytes, fmt: str) -> pa.Table:
+    if fmt == "parquet":
+        return pq.read_table(io.BytesIO(content))
+    return pa.ipc.open_file(pa.BufferReader(content)).read_all()
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_columnar_export_keeps_rows_and_column_types(db, monkeypatch, fmt):
+    _seed(db)
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_ROWS", 2)
+
+    table = _read(export_columnar(db, "tasks", fmt), fmt)
+    assert table.column_names == [c.name for c in Task.__table__.columns]
+    assert table.num_rows == 5
+    assert table.column("task_id").to_pylist() == ["1", "2", "3", "4", "5"]
+    assert table.column("story_points").to_pylist() == [1.0, 2.0, None, 4.0, 5.0]
+    # Typed from the model even though the second batch (rows 3-4) is all NULL
+    assert table.column("expected_timeline_max").to_pylist() == [2, 4, None, None, 10]
+    assert table.schema.field("expected_timeline_max").type == pa.int64()
+    assert table.schema.field("closed_date").type == pa.date32()
+    assert table.schema.field("delayed").type == pa.bool_()
+
+
+def test_columnar_export_of_an_empty_table_keeps_its_schema(db):
+    table = _read(export_columnar(db, "updates", "parquet"), "parquet")
+    assert table.num_rows == 0
+    assert table.column_names == [c.name for c in TaskUpdate.__table__.columns]
+
+
+def test_columnar_export_rejects_unknown_dataset_and_format(db):
+    with pytest.raises(ValueError):
+        export_columnar(db, "sprints", "parquet")
+    with pytest.raises(ValueError):
+        export_columnar(db, "tasks", "orc")
+
+
+@pytest.mark.parametrize("fmt, media_type", [
+    ("parquet", "application/vnd.apache.parquet"),
+    ("arrow", "application/vnd.apache.arrow.file"),
+])
+def test_columnar_export_routes(db, client, fmt, media_type):
+    _seed(db)
+    response = client.get(f"/export/{fmt}", params={"dataset": "updates"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == media_type
+    assert f"filename=updates.{fmt}" in response.headers["content-disposition"]
+    table = _read(response.content, fmt)
+    assert table.column("current_update").to_pylist() == [f"update {n}" for n in range(1, 6)]
+
+    assert client.get(f"/export/{fmt}", params={"dataset": "sprints"}).status_code == 422
+
+
+def _csv_rows(response) -> list[dict]:
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    return list(csv.DictReader(io.StringIO(response.text)))
+
+
+def test_csv_export_streams_batches_with_work_item_filters(db, client, monkeypatch):
+    _seed(db)
+    monkeypatch.setattr(export_service, "CSV_BATCH_ROWS", 2)
+    chunks = list(export_service.stream_csv("tasks"))
+    # Header, then batches of two rows
+    assert len(chunks) == 4
+
+    rows = _csv_rows(client.get("/export/csv"))
+    assert [r["task_id"] for r in rows] == ["1", "2", "3", "4", "5"]
+    assert list(rows[0]) == [c.name for c in Task.__table__.columns]
+    assert rows[2]["story_points"] == ""
+
+    closed = _csv_rows(client.get("/export/csv", params={"state": "Closed"}))
+    assert [r["task_id"] for r in closed] == ["1", "3", "5"]
+    # The history of the matching tasks only
+    updates = _csv_rows(client.get("/export/csv", params={"dataset": "updates", "state": "Closed"}))
+    assert [r["current_update"] for r in updates] == ["update 1", "update 3", "update 5"]
+
+
+def test_report_section_csv(db, report_client, monkeypatch):
+    _seed(db)
+    velocity = _csv_rows(report_client.get(
+        "/reports/weekly/csv", params={"section": "velocity", "report_date": "2025-06-02"}
+    ))
+    assert velocity == [{"committed": "0", "completed": "0"}]
+
+    # Summaries are read page by page and their two lines flattened into one row
+    monkeypatch.setattr(export_service, "MAX_SUMMARY_PAGE_SIZE", 2)
+    db.query(Task).update({Task.activated_date: date(2025, 6, 3)})
+    db.commit()
+    summaries = _csv_rows(report_client.get(
+        "/reports/weekly/csv", params={"section": "task_summaries", "report_date": "2025-06-02"}
+    ))
+    assert [r["task_id"] for r in summaries] == ["1", "2", "3", "4", "5"]
+    assert {"title", "weekly_update", "timeline_compliance"} <= set(summaries[0])
+
+    for report, section in (("weekly", "nope"), ("yearly", "velocity")):
+        response = report_client.get(f"/reports/{report}/csv", params={"section": section})
+        assert response.status_code == 400
@@ -0,0 +1,50 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from backend.app.models.task import Task
+from backend.app.services.forecast_service import (
+    MAX_FORECAST_DAYS,
+    get_delivery_forecast,
+    simulate_completion_days,
+)
+
+START = date(2025, 7, 1)
+
+
+def test_completion_days_stay_within_the_fastest_and_slowest_pace():
+    rng = np.random.default_rng(7)
+    days = simulate_completion_days(np.array([1.0, 3.0]), 12, 5000, rng)
+    assert days.min() >= 4 and days.max() <= 12     # ceil(12 / 3) .. 12 / 1
+    assert days.min() < days.max()
+
+    steady = simulate_completion_days(np.array([2.0]), 7, 100, rng)
+    assert set(steady) == {4.0}
+    assert set(simulate_completion_days(np.array([2.0]), 0, 10, rng)) == {0.0}
+
+
+def test_backlogs_out_of_reach_are_unfinished():
+    samples = np.array([0.0, 1.0])
+    days = simulate_completion_days(samples, MAX_FORECAST_DAYS + 1, 10)
+    assert np.isinf(days).all()
+
+
+def test_forecast_dates_follow_a_steady_history(db):
+    # One task closed on every day of the 90-day history window
+    for n in range(1, 91):
+        db.add(Task(task_id=str(n), title=str(n), state="Closed",
+                    closed_date=START - timedelta(days=n)))
+    db.commit()
+
+    forecast = get_delivery_forecast(db, backlog=10, start=START, trials=1000)
+    assert forecast["history"]["mean_per_day"] == 1.0
+    assert forecast["unfinished_trials"] == 0
+    assert [p["days"] for p in forecast["percentiles"]] == [10, 10, 10, 10]
+    assert forecast["percentiles"][0]["date"] == "2025-07-10"
+
+    assert get_delivery_forecast(db, epic_id="missing", start=START) is None
+    with pytest.raises(ValueError):
+        get_delivery_forecast(db, backlog=10, epic_id="1", start=START)
+    with pytest.raises(ValueError):      # nothing closed in the window before START - 200
+        get_delivery_forecast(db, backlog=10, start=START - timedelta(days=200))
@@ -0,0 +1,32 @@
+import time
+
+import pandas as pd
+
+from backend.app.models.import_job import ImportJob
+from backend.app.services.import_job_service import get_import_job, submit_import_job
+
+
+def _wait_for(job_id: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = get_import_job(job_id)
+        if job["state"] in ("completed", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+def test_job_status_is_stored_in_the_database(db, tmp_path):
+    path = tmp_path / "export.csv"
+    pd.DataFrame({"TaskID": range(1, 6), "Title": "Task", "State": "New"}).to_csv(path, index=False)
+
+    queued = submit_import_job(str(path), "export.csv", chunk_rows=2)
+    assert queued["state"] == "queued"
+
+    job = _wait_for(queued["job_id"])
+    assert job["state"] == "completed", job["errors"]
+    assert (job["inserted"], job["chunks_processed"], job["rows_processed"]) == (5, 3, 5)
+    assert not path.exists()
+
+    row = db.query(ImportJob).filter(ImportJob.job_id == queued["job_id"]).one()
+    assert (row.state, row.inserted) == ("completed", 5)
+    assert get_import_job("missing") is None
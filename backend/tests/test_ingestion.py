@@ -0,0 +1,221 @@
+import os
+from datetime import date
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.base import Base
+from backend.app.models.task import Task, TaskUpdate
+from backend.app.services.ingestion_service import (
+    _ingest_dataframe,
+    _prepare_dataframe,
+    import_ado_stream,
+    preview_ado_import,
+)
+
+ROWS = 1000
+
+
+def _export(rows: int = ROWS) -> pd.DataFrame:
+    return pd.DataFrame({
+        "TaskID": range(1, rows + 1),
+        "Title": [f"Task {i}" for i in range(1, rows + 1)],
+        "State": "Active",
+        "Criticality": ["High", "Low"] * (rows // 2),
+        "Activated Date": "2025-06-02",
+        "Closed Date": ["2025-06-09", None] * (rows // 2),
+    })
+
+
+def _with_blank_criticality(df: pd.DataFrame) -> pd.DataFrame:
+    """One extra task without Criticality: the timeline columns turn float."""
+    extra = pd.DataFrame({"TaskID": [len(df) + 1], "Title": ["New task"], "State": ["New"]})
+    return pd.concat([df, extra], ignore_index=True)
+
+
+def test_derived_cycle_time_timelines_and_delay_flag():
+    df = _prepare_dataframe(pd.DataFrame({
+        "Work Item ID": [1, 2, 3, 4],
+        "Criticality": [" HIGH ", "low", "unknown", None],
+        "Activated Date": ["2025-06-02", "2025-06-02", "2025-06-02", None],
+        "Closed Date": ["2025-06-14", "2025-06-04", None, "2025-06-04"],
+        "Cycle Time": [None, 9, None, None],
+    }))
+    # A cycle time given in the file wins over the one computed from the dates
+    assert df["cycle_time"].tolist()[:2] == [12, 9]
+    assert df["cycle_time"].iloc[2:].isna().all()
+    assert df["expected_timeline_min"].tolist()[:2] == [7, 3]
+    assert df["expected_timeline_max"].tolist()[:2] == [10, 5]
+    assert df["expected_timeline_max"].iloc[2:].isna().all()
+    # 12 > 10 and 9 > 5; unknown criticality or cycle time is never delayed
+    assert df["delayed"].tolist() == [True, True, False, False]
+
+
+def test_upsert_reports_inserted_updated_unchanged_and_skipped(db):
+    first = _ingest_dataframe(db, _export(4))
+    assert first == {"inserted": 4, "updated": 0, "unchanged": 0, "skipped": 0}
+
+    again = pd.DataFrame({
+        "TaskID": [1, 2, 5, None, 5],
+        "Title": ["Task 1", "Renamed", "Old five", "No id", "Task 5"],
+        "State": ["Active", "Active", "New", "New", "New"],
+        "Criticality": ["High", "Low", None, None, None],
+        "Activated Date": "2025-06-02",
+        "Closed Date": ["2025-06-09", None, None, None, None],
+    })
+    # task 5 appears twice (the later row wins) and one row has no TaskID
+    counts = _ingest_dataframe(db, again)
+    assert counts == {"inserted": 1, "updated": 1, "unchanged": 1, "skipped": 2}
+
+    titles = dict(db.execute(select(Task.task_id, Task.title)).all())
+    assert titles == {"1": "Task 1", "2": "Renamed", "3": "Task 3", "4": "Task 4", "5": "Task 5"}
+    # Only new tasks and tracked-field changes are recorded as history
+    history = db.execute(select(TaskUpdate.task_id).order_by(TaskUpdate.id)).scalars().all()
+    assert history == ["1", "2", "3", "4", "5"]
+
+
+def test_reimport_with_mixed_null_numeric_columns_is_unchanged(db):
+    first = _ingest_dataframe(db, _export())
+    assert first["inserted"] == ROWS
+
+    again = _ingest_dataframe(db, _with_blank_criticality(_export()))
+    assert again == {"inserted": 1, "updated": 0, "unchanged": ROWS, "skipped": 0}
+
+
+def test_chunked_reimport_is_unchanged(db, tmp_path):
+    path = tmp_path / "export.csv"
+    _with_blank_criticality(_export(20)).to_csv(path, index=False)
+    _ingest_dataframe(db, pd.read_csv(path))
+
+    result = import_ado_stream(str(path), "export.csv", db, chunk_rows=1, force=True)
+    assert result["updated"] == 0
+    assert result["unchanged"] == 21
+
+
+def _table_rows(db, table) -> list[tuple]:
+    columns = [c for c in table.columns if c.name not in {"id", "created_at", "updated_at"}]
+    return db.execute(select(*columns).order_by(*columns)).all()
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"),
+    reason="set TEST_POSTGRES_URL to a scratch PostgreSQL database",
+)
+def test_copy_engine_writes_the_same_rows_as_orm():
+    export = _export(20)
+    export["Current Status"] = ["", None, "tab\tand\nnewline", "back\\slash", "\\N"] * 4
+    changed = export.assign(State=["Active", "Closed"] * 10, **{"Current Status": ""})
+
+    engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+    results = {}
+    try:
+        for write_engine in ("orm", "copy"):
+            Base.metadata.drop_all(engine)
+            Base.metadata.create_all(engine)
+            with sessionmaker(bind=engine)() as db:
+                counts = [
+                    _ingest_dataframe(db, export, write_engine),
+                    _ingest_dataframe(db, changed, write_engine),
+                ]
+                results[write_engine] = (
+                    counts,
+                    _table_rows(db, Task.__table__),
+                    _table_rows(db, TaskUpdate.__table__),
+                )
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+    assert results["copy"] == results["orm"]
+    counts, tasks, _ = results["copy"]
+    assert counts[1] == {"inserted": 0, "updated": 18, "unchanged": 2, "skipped": 0}
+    assert "" in {row.current_status for row in tasks}
+
+
+@pytest.mark.parametrize(
+    "suffix", [".csv", ".jsonl", ".xlsx", ".parquet", ".arrow", ".feather"]
+)
+def test_streaming_import_commits_and_reports_each_chunk(db, tmp_path, suffix):
+    path = tmp_path / f"export{suffix}"
+    export = _export(10)
+    if suffix == ".csv":
+        export.to_csv(path, index=False)
+    elif suffix == ".jsonl":
+        export.to_json(path, orient="records", lines=True)
+    elif suffix == ".xlsx":
+        export.to_excel(path, index=False)
+    elif suffix == ".parquet":
+        export.to_parquet(path, index=False)
+    elif suffix == ".arrow":
+        # IPC stream format: read through the open_file() fallback
+        table = pa.Table.from_pandas(export, preserve_index=False)
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        feather.write_feather(export, path)
+
+    progress = []
+    result = import_ado_stream(str(path), path.name, db, chunk_rows=4, on_progress=progress.append)
+    assert [(p["chunk"], p["rows"], p["rows_processed"]) for p in progress] == [
+        (1, 4, 4), (2, 4, 8), (3, 2, 10),
+    ]
+    assert result["chunks"] == progress
+    assert (result["inserted"], result["file_unchanged"]) == (10, False)
+    assert db.query(Task).count() == 10
+
+    assert import_ado_stream(str(path), path.name, db, chunk_rows=4)["file_unchanged"]
+
+
+def test_streaming_import_keeps_chunks_committed_before_a_failure(db, tmp_path):
+    path = tmp_path / "export.csv"
+    _export(10).to_csv(path, index=False)
+
+    def stop_after_first_chunk(progress):
+        raise RuntimeError("stop")
+
+    with pytest.raises(RuntimeError):
+        import_ado_stream(str(path), path.name, db, chunk_rows=4, on_progress=stop_after_first_chunk)
+    db.rollback()
+    assert db.query(Task).count() == 4
+
+
+def test_dry_run_preview_lists_changes_and_writes_nothing(db, tmp_path):
+    _ingest_dataframe(db, _export(4))
+    path = tmp_path / "export.csv"
+    changed = _export(4).iloc[1:].assign(State=["Active", "Closed", "Active"])
+    pd.concat([changed, pd.DataFrame({"TaskID": [9], "Title": ["Task 9"]})]).to_csv(path, index=False)
+
+    preview = preview_ado_import(str(path), path.name, db)
+    assert preview["summary"] == {"new": 1, "updated": 1, "unchanged": 2, "missing": 1, "skipped": 0}
+    assert preview["new"] == ["9"]
+    assert preview["missing"] == ["1"]
+    assert preview["updated"] == [
+        {"task_id": "3", "changes": {"state": {"old": "Active", "new": "Closed"}}},
+    ]
+    assert db.query(Task).count() == 4
+    assert db.query(Task).filter(Task.state == "Closed").count() == 0
+
+
+def test_history_rows_are_written_in_bulk_with_current_values(engine, db):
+    first = _export(50).assign(**{"Current Status": "On track"})
+    _ingest_dataframe(db, first)
+
+    inserts = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, *args: inserts.append(sql)
+                 if sql.startswith("INSERT INTO task_updates") else None)
+    moved = _export(50).assign(State="Closed", **{"Update Date": "2025-06-20"})
+    _ingest_dataframe(db, moved)
+    assert len(inserts) == 1
+
+    rows = db.execute(
+        select(TaskUpdate.state, TaskUpdate.current_status, TaskUpdate.update_date)
+        .order_by(TaskUpdate.id)
+    ).all()
+    assert len(rows) == 100
+    # Fields the second file does not carry keep the task's current values
+    assert set(rows[50:]) == {("Closed", "On track", date(2025, 6, 20))}
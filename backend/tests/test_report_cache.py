@@ -0,0 +1,72 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import update
+
+from backend.app.core.cache import LRUCache, bump_task_writes, task_writes
+from backend.app.models.task import Task
+from backend.app.services import report_service
+from backend.app.services.report_service import get_daily_report, get_report_cache_stats
+from backend.app.services.task_service import delete_work_item
+
+DAY = date(2025, 6, 4)
+
+
+@pytest.fixture(autouse=True)
+def report_cache(monkeypatch):
+    """A fresh, empty report cache for every test."""
+    cache = LRUCache(8)
+    monkeypatch.setattr(report_service, "_report_cache", cache)
+    return cache
+
+
+def _seed(db):
+    db.add(Task(task_id="1", state="Active", updated_at=datetime(2025, 6, 1)))
+    db.add(Task(task_id="2", state="Closed", updated_at=datetime(2025, 6, 1)))
+    db.commit()
+
+
+def test_lru_cache_evicts_the_least_recently_used_entry():
+    cache = LRUCache(2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    assert cache.get_or_compute("a", lambda: 0) == 1
+    cache.get_or_compute("c", lambda: 3)
+    # "b" was used least recently
+    assert cache.get_or_compute("b", lambda: 20) == 20
+    assert cache.stats() == {
+        "size": 2, "maxsize": 2, "hits": 1, "misses": 4, "evictions": 2, "hit_ratio": 0.2,
+    }
+
+
+def test_write_counter_only_increases():
+    before = task_writes()
+    bump_task_writes()
+    assert task_writes() == before + 1
+
+
+def test_report_is_served_from_cache_until_tasks_change(db):
+    _seed(db)
+    first = get_daily_report(db, DAY)
+    assert get_daily_report(db, DAY) == first
+    assert get_report_cache_stats()["hits"] == 1
+    # Callers get a copy: changing it does not change the cached report
+    first.pop("status_distribution")
+    assert "status_distribution" in get_daily_report(db, DAY)
+
+    # A write through the repository bumps the counter
+    assert delete_work_item(db, "2")
+    assert get_daily_report(db, DAY)["status_distribution"] == {"Active": 1}
+
+
+def test_writes_by_another_process_change_the_version(db):
+    _seed(db)
+    assert get_daily_report(db, DAY)["status_distribution"] == {"Active": 1, "Closed": 1}
+    # Not through this process's repositories: only updated_at moves
+    db.execute(
+        update(Task).where(Task.task_id == "1")
+        .values(state="Closed", updated_at=datetime(2025, 6, 2))
+    )
+    db.commit()
+    assert get_daily_report(db, DAY)["status_distribution"] == {"Closed": 2}
+    assert get_report_cache_stats()["misses"] == 2
@@ -0,0 +1,227 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from backend.app.core.cache import LRUCache
+from backend.app.models.task import Task
+from backend.app.models.team import ProjectTeam
+from backend.app.repositories.report_repository import scope_filters
+from backend.app.schemas.report import ReportScope
+from backend.app.services import report_service
+from backend.app.services.report_service import (
+    _daily_report,
+    _monthly_report,
+    _tasks_dataframe,
+    _weekly_report,
+)
+
+
+def _seed(db):
+    db.add(Task(task_id="1", title="Old", assigned_to="Ana", project_id=1,
+                activated_date=date(2025, 5, 1), closed_date=date(2025, 5, 20),
+                description="Long text"))
+    db.add(Task(task_id="2", title="Active", assigned_to="Ben", project_id=1,
+                activated_date=date(2025, 6, 3)))
+    db.add(Task(task_id="3", title="Closed late", assigned_to="Ana", project_id=2,
+                activated_date=date(2025, 5, 12), closed_date=date(2025, 6, 4), cycle_time=23))
+    db.add(Task(task_id="4", title="Not started", project_id=2))
+    db.commit()
+
+
+def test_report_loader_selects_only_the_requested_columns(engine, db):
+    _seed(db)
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, *args: statements.append(sql))
+
+    df = _tasks_dataframe(db, columns=["task_id", "closed_date"])
+    assert list(df.columns) == ["task_id", "closed_date"]
+    select_list = statements[-1].split(" FROM ")[0]
+    assert "title" not in select_list and "description" not in select_list
+    # Dates come back as datetime64 with NaT for NULL
+    assert pd.api.types.is_datetime64_any_dtype(df["closed_date"])
+    assert df["closed_date"].isna().tolist() == [False, True, False, True]
+
+
+def test_report_loader_window_filters_and_paging(db):
+    _seed(db)
+    window = _tasks_dataframe(db, active_since=date(2025, 6, 1), columns=["task_id"])
+    # Activated or closed on/after the day
+    assert window["task_id"].tolist() == ["2", "3"]
+
+    scoped = _tasks_dataframe(
+        db, columns=["task_id"], filters=scope_filters(ReportScope(assigned_to="Ana"))
+    )
+    assert scoped["task_id"].tolist() == ["1", "3"]
+
+    page = _tasks_dataframe(db, columns=["task_id"], after_id=1, limit=2)
+    assert page["task_id"].tolist() == ["2", "3"]
+
+
+def _seed_week(db):
+    db.add(Task(task_id="1", title="Vendor API", assigned_to="Ana", state="Active",
+                activated_date=date(2025, 6, 2), committed_date=date(2025, 6, 1),
+                update_date=date(2025, 6, 4), current_update="waiting on vendor",
+                risk_item="Vendor", iteration_path="S1", carry_forward_reason="Blocked"))
+    db.add(Task(task_id="2", title="Hotfix", activated_date=date(2025, 6, 4),
+                closed_date=date(2025, 6, 4), committed_date=date(2025, 6, 2),
+                release_date=date(2025, 6, 5), cycle_time=2, delayed=True,
+                risk_item="Scope", iteration_path="S1"))
+    db.add(Task(task_id="3", title="Last sprint", assigned_to="Ben", state="Closed",
+                activated_date=date(2025, 5, 1), closed_date=date(2025, 5, 10),
+                committed_date=date(2025, 5, 1), risk_item="Old", iteration_path="S0",
+                carry_forward_reason="Blocked"))
+    db.add(Task(task_id="4", title="Docs", assigned_to="Ana", state="Active",
+                activated_date=date(2025, 6, 3), update_date=date(2025, 6, 1),
+                current_update="drafted", cycle_time=4, carry_forward_reason="Leave"))
+    db.commit()
+
+
+def test_daily_report_groups_in_sql(db):
+    _seed_week(db)
+    report = _daily_report(db, date(2025, 6, 4))
+    # Most common state first; a NULL state counts as "Unknown"
+    assert list(report["status_distribution"].items()) == [
+        ("Active", 2), ("Closed", 1), ("Unknown", 1),
+    ]
+    assert report["activated_today"] == [{"task_id": "2", "title": "Hotfix", "assigned_to": None}]
+    assert report["closed_today"] == report["activated_today"]
+    assert [r["task_id"] for r in report["risks_last_24h"]] == ["1", "2", "3"]
+    # NULL assignee group last, filled in as "Unassigned"
+    assert report["compliance"] == [
+        {"assigned_to": "Ana", "total": 2, "updated": 1, "has_update": 2},
+        {"assigned_to": "Ben", "total": 1, "updated": 0, "has_update": 0},
+        {"assigned_to": "Unassigned", "total": 1, "updated": 0, "has_update": 0},
+    ]
+
+
+def test_weekly_and_monthly_aggregations_stay_in_the_window(db):
+    _seed_week(db)
+    weekly = _weekly_report(db, date(2025, 6, 2), include_summaries=False)
+    assert weekly["velocity"] == {"committed": 2, "completed": 1}
+    assert weekly["carry_forward_reasons"] == [
+        {"carry_forward_reason": "Blocked", "count": 1},
+        {"carry_forward_reason": "Leave", "count": 1},
+    ]
+    assert weekly["risk_heatmap"] == [{"iteration_path": "S1", "risk_count": 2}]
+    assert weekly["cycle_time_by_resource"] == [
+        {"assigned_to": "Ana", "cycle_time": None},
+        {"assigned_to": None, "cycle_time": 2.0},
+        {"assigned_to": "Ana", "cycle_time": 4.0},
+    ]
+    assert "task_summaries" not in weekly
+
+    monthly = _monthly_report(db, date(2025, 6, 1))
+    assert monthly["month_end"] == "2025-06-30"
+    assert monthly["team_performance"] == [
+        {"assigned_to": "Ana", "avg_cycle_time": 4.0, "completed": 0, "delayed_count": 0},
+        {"assigned_to": "Unassigned", "avg_cycle_time": 2.0, "completed": 1, "delayed_count": 1},
+    ]
+    assert monthly["release_reliability"] == [{"task_id": "2", "release_delta": 3}]
+    assert [r["task_id"] for r in monthly["delay_trend"]] == ["1", "2", "4"]
+
+
+def test_weekly_task_summary_pages_match_the_full_report(db, report_client):
+    _seed_week(db)
+    full = _weekly_report(db, date(2025, 6, 2))["task_summaries"]
+    assert [s["line1"]["task_id"] for s in full] == ["1", "2", "4"]
+    assert full[1]["line1"]["activated_date"] == "2025-06-04"
+    assert full[1]["line1"]["target_date"] is None
+    assert [s["line2"]["timeline_compliance"] for s in full] == ["On-Time", "Delayed", "On-Time"]
+
+    items, cursor = [], None
+    while True:
+        params = {"week_start": "2025-06-02", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = report_client.get("/reports/weekly/tasks", params=params).json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert items == full
+
+
+def test_weekly_task_summary_fields(db, report_client):
+    _seed_week(db)
+    page = report_client.get("/reports/weekly/tasks", params={
+        "week_start": "2025-06-02", "fields": "task_id,weekly_update",
+    }).json()
+    assert page["items"][0] == {
+        "line1": {"task_id": "1"}, "line2": {"weekly_update": "waiting on vendor"},
+    }
+    response = report_client.get("/reports/weekly/tasks", params={"fields": "task_id,nope"})
+    assert response.status_code == 400
+    assert "nope" in response.json()["detail"]
+
+
+def _seed_projects(db):
+    rows = [
+        ("1", 1, 10, "Ana", "Active"),
+        ("2", 1, 11, "Ben", "Closed"),
+        ("3", 2, 20, "Ana", "Closed"),
+        ("4", 3, None, "Ben", "New"),
+    ]
+    for task_id, project_id, sprint_id, assignee, state in rows:
+        db.add(Task(task_id=task_id, project_id=project_id, sprint_id=sprint_id,
+                    assigned_to=assignee, state=state, activated_date=date(2025, 6, 2)))
+    db.add(ProjectTeam(project_id=2, team_id=7))
+    db.add(ProjectTeam(project_id=3, team_id=7))
+    db.commit()
+
+
+@pytest.mark.parametrize("scope, task_ids, states", [
+    ({}, ["1", "2", "3", "4"], {"Active": 1, "Closed": 2, "New": 1}),
+    ({"project_id": 1}, ["1", "2"], {"Active": 1, "Closed": 1}),
+    ({"project_id": 1, "sprint_id": 11}, ["2"], {"Closed": 1}),
+    ({"team_id": 7}, ["3", "4"], {"Closed": 1, "New": 1}),
+    ({"assigned_to": "Ana"}, ["1", "3"], {"Active": 1, "Closed": 1}),
+    ({"team_id": 8}, [], {}),
+])
+def test_reports_are_scoped_in_sql(db, report_client, scope, task_ids, states):
+    _seed_projects(db)
+    daily = report_client.get(
+        "/reports/daily", params={"report_date": "2025-06-02", **scope}
+    ).json()
+    assert daily["status_distribution"] == states
+    assert [r["task_id"] for r in daily["activated_today"]] == task_ids
+
+    weekly = report_client.get("/reports/weekly", params={"week_start": "2025-06-02", **scope})
+    page = report_client.get("/reports/weekly/tasks", params={"week_start": "2025-06-02", **scope})
+    monthly = report_client.get("/reports/monthly", params={"month_start": "2025-06-01", **scope})
+    assert [s["line1"]["task_id"] for s in weekly.json()["task_summaries"]] == task_ids
+    assert [s["line1"]["task_id"] for s in page.json()["items"]] == task_ids
+    assert [r["task_id"] for r in monthly.json()["delay_trend"]] == task_ids
+
+
+def test_dashboard_matches_the_report_endpoints_and_shares_their_cache(
+    db, report_client, monkeypatch
+):
+    monkeypatch.setattr(report_service, "_report_cache", LRUCache(16))
+    _seed_week(db)
+    dates = {"report_date": "2025-06-04", "week_start": "2025-06-02", "month_start": "2025-06-01"}
+    daily = report_client.get("/reports/daily", params={"report_date": "2025-06-04"}).json()
+    weekly = report_client.get(
+        "/reports/weekly", params={"week_start": "2025-06-02", "include_summaries": False}
+    ).json()
+    monthly = report_client.get("/reports/monthly", params={"month_start": "2025-06-01"}).json()
+    hits = report_service.get_report_cache_stats()["hits"]
+
+    dashboard = report_client.get("/reports/dashboard", params=dates).json()
+    assert set(dashboard) == {"daily", "weekly", "monthly", "tasks"}
+    assert (dashboard["daily"], dashboard["weekly"], dashboard["monthly"]) == (
+        daily, weekly, monthly,
+    )
+    assert [t["task_id"] for t in dashboard["tasks"]] == ["1", "2", "3", "4"]
+    # The three reports came from the cache; only the task list was built
+    assert report_service.get_report_cache_stats()["hits"] == hits + 3
+
+
+def test_dashboard_parts(db, report_client):
+    _seed_week(db)
+    dashboard = report_client.get("/reports/dashboard", params={"parts": "daily, tasks"}).json()
+    assert set(dashboard) == {"daily", "tasks"}
+
+    response = report_client.get("/reports/dashboard", params={"parts": "daily,yearly"})
+    assert response.status_code == 400
+    assert "yearly" in response.json()["detail"]
@@ -0,0 +1,53 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from backend.app.core.responses import FastJSONResponse, dumps
+from backend.app.models.task import Task
+from backend.app.schemas.task import TaskRead
+
+
+def test_dumps_writes_dates_numpy_pandas_and_decimal_values():
+    content = {
+        "day": date(2025, 6, 2),
+        "at": datetime(2025, 6, 2, 9, 30),
+        "stamp": pd.Timestamp("2025-06-02 09:30"),
+        "count": np.int64(3),
+        "ratio": np.float32(0.5),
+        "points": Decimal("2.5"),
+        "series": np.array([1, 2]),
+        "missing": float("nan"),
+        1: "non-string key",
+    }
+    assert json.loads(dumps(content)) == {
+        "day": "2025-06-02",
+        "at": "2025-06-02T09:30:00",
+        "stamp": "2025-06-02T09:30:00",
+        "count": 3,
+        "ratio": 0.5,
+        "points": 2.5,
+        "series": [1, 2],
+        "missing": None,
+        "1": "non-string key",
+    }
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_fast_response_matches_the_default_encoder(db):
+    db.add(Task(task_id="1", title="Ünïcode", story_points=2.5, activated_date=date(2025, 6, 2)))
+    db.add(Task(task_id="2"))
+    db.commit()
+    rows = [TaskRead.model_validate(t).model_dump() for t in db.query(Task).order_by(Task.id)]
+
+    response = FastJSONResponse(rows)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(rows)
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core import db as core_db
+from backend.app.core.base import Base
+from backend.app.models.task import Task
+from backend.app.repositories.task_repository import work_item_filters
+
+TITLES = ["The login page", "Plan A", "Logout button"]
+ASSIGNEES = ["Priya Raman", None, "Tom Berg"]
+
+
+def _seed(db):
+    for n, (title, assignee) in enumerate(zip(TITLES, ASSIGNEES), start=1):
+        db.add(Task(task_id=str(1000 + n), title=title, assigned_to=assignee))
+    db.commit()
+
+
+def _titles(db, search):
+    stmt = select(Task.title).where(*work_item_filters(search=search)).order_by(Task.id)
+    return db.execute(stmt).scalars().all()
+
+
+def test_stop_words_compile_to_an_ilike_fallback_on_postgresql():
+    stmt = select(Task.id).where(*work_item_filters(search="the"))
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "numnode(to_tsquery('english'::regconfig, 'the:*')) = 0" in sql
+    assert "tasks.title ILIKE '%%the%%'" in sql
+
+
+def test_search_matches_stop_words(db):
+    _seed(db)
+    assert _titles(db, "the") == ["The login page"]
+    assert _titles(db, "a") == ["The login page", "Plan A"]
+
+
+def test_search_matches_assignee(db):
+    _seed(db)
+    assert _titles(db, "priya") == ["The login page"]
+    assert _titles(db, "berg") == ["Logout button"]
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"),
+    reason="set TEST_POSTGRES_URL to a scratch PostgreSQL database",
+)
+def test_search_matches_stop_words_on_postgresql():
+    engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    previous = (core_db.engine, core_db.SessionLocal.kw.get("bind"))
+    core_db.engine = engine
+    core_db.SessionLocal.configure(bind=engine)
+    try:
+        # A search_vector generated from an older document is rebuilt
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS "
+                "(to_tsvector('simple', coalesce(task_id, ''))) STORED"
+            ))
+        core_db.run_migrations()
+        core_db.run_migrations()
+        with sessionmaker(bind=engine)() as db:
+            _seed(db)
+            assert _titles(db, "the") == ["The login page"]
+            assert _titles(db, "the a") == []
+            assert _titles(db, "the login") == ["The login page"]
+            assert _titles(db, "log") == ["The login page", "Logout button"]
+            assert _titles(db, "a") == ["The login page", "Plan A"]
+            assert _titles(db, "priya") == ["The login page"]
+            assert _titles(db, "Berg") == ["Logout button"]
+    finally:
+        core_db.engine, bind = previous
+        core_db.SessionLocal.configure(bind=bind)
+        Base.metadata.drop_all(engine)
+        engine.dispose()
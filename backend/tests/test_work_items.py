@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from backend.app.models.task import Task
+from backend.app.services.task_service import TASK_FIELD_PRESETS
+
+
+def _seed(db):
+    db.add(Task(task_id="101", title="Login page", state="Active", description="Full text",
+                tags="ui", story_points=3))
+    db.add(Task(task_id="102", title="Logout", state="New"))
+    db.commit()
+
+
+def _walk(client, path, params):
+    """Follow X-Next-Cursor from the first page to the last; return every row seen."""
+    rows, cursor = [], None
+    while True:
+        resp = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200, resp.text
+        rows += resp.json()
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return rows
+
+
+def test_field_presets_always_return_id(db, client):
+    _seed(db)
+    for fields in ("mobile", "board", "backlog", "title"):
+        rows = client.get("/workitems", params={"fields": fields}).json()
+        assert [r["id"] for r in rows] == [1, 2]
+        assert {"id", "task_id"} <= set(rows[0])
+        assert "description" not in rows[0]
+
+
+
+def test_field_presets_narrow_the_select_and_the_payload(engine, db, client):
+    _seed(db)
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, sql, *args: statements.append(sql))
+    for preset, columns in TASK_FIELD_PRESETS.items():
+        statements.clear()
+        rows = client.get("/workitems", params={"fields": preset}).json()
+        assert set(rows[0]) == {"id", *columns}
+        select_list = statements[-1].split(" FROM ")[0]
+        assert "description" not in select_list and "current_update" not in select_list
+
+    rows = client.get("/tasks", params={"fields": "board,description"}).json()
+    assert set(rows[0]) == {"id", "description", *TASK_FIELD_PRESETS["board"]}
+    assert client.get("/tasks", params={"fields": "board,nope"}).status_code == 400
+
+
+def test_get_work_item_returns_every_field(db, client):
+    _seed(db)
+    item = client.get("/workitems/101").json()
+    assert item["id"] == 1
+    assert item["description"] == "Full text"
+    assert item["tags"] == "ui"
+    assert client.get("/workitems/999").status_code == 404
+
+
+def test_cursor_pages_cover_the_filtered_list_once(db, client):
+    for n in range(1, 26):
+        db.add(Task(task_id=str(n), title=f"Item {n}", state="Active" if n % 3 else "New",
+                    priority=n % 4 + 1))
+    db.commit()
+    expected = [str(n) for n in range(1, 26) if n % 3]
+    for sort in ("id", "-priority"):
+        params = {"state": "Active", "fields": "mobile", "sort": sort, "limit": 4}
+        seen = [row["task_id"] for row in _walk(client, "/workitems", params)]
+        assert sorted(seen, key=int) == expected
+        assert len(seen) == len(expected)
+
+
+def test_state_filter_new_includes_items_without_state(db, client):
+    _seed(db)
+    db.add(Task(task_id="103", title="No state yet", state=None))
+    db.commit()
+    rows = client.get("/workitems", params={"state": "New", "fields": "title"}).json()
+    assert [r["task_id"] for r in rows] == ["102", "103"]
+
+
+def test_task_cursor_round_trips_with_ties_and_nulls(db, client):
+    touched = datetime(2025, 6, 2, 9, 30, 15, 123456)
+    for n in range(1, 15):
+        db.add(Task(task_id=str(n), title=f"Item {n}", priority=None if n % 5 == 0 else n % 3,
+                    updated_at=touched if n % 2 else touched + timedelta(hours=n)))
+    db.commit()
+    for sort in ("id", "-id", "priority", "-priority", "updated_at", "-updated_at"):
+        everything = client.get("/tasks", params={"sort": sort, "fields": "title"}).json()
+        paged = _walk(client, "/tasks", {"sort": sort, "fields": "title", "limit": 3})
+        assert [r["id"] for r in paged] == [r["id"] for r in everything]
+        assert len(everything) == 14
+
+
+def test_cursor_from_another_sort_is_rejected(db, client):
+    _seed(db)
+    resp = client.get("/tasks", params={"sort": "priority", "limit": 1})
+    cursor = resp.headers["X-Next-Cursor"]
+    assert client.get("/tasks", params={"sort": "priority", "cursor": cursor}).status_code == 200
+    assert client.get("/tasks", params={"sort": "-id", "cursor": cursor}).status_code == 400
+    assert client.get("/tasks", params={"cursor": "not-a-cursor"}).status_code == 400
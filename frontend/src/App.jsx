@@ -1,4 +1,4 @@
-import React, { useCallback, useEffect, useState } from "react";
+import React, { useCallback, useEffect, useRef, useState } from "react";
 import Sidebar from "./components/Sidebar.jsx";
 import WorkItemModal from "./components/WorkItemModal.jsx";
 import Login from "./components/Login.jsx";
@@ -15,12 +15,21 @@ import UserSettings from "./pages/UserSettings.jsx";
 import Retrospectives from "./pages/Retrospectives.jsx";
 import Teams from "./pages/Teams.jsx";
 import { listUsers } from "./services/api.js";
-import { getWorkItems, createWorkItem, updateWorkItem, updateTaskStatus, deleteWorkItem } from "./services/api.js";
+import { getWorkItem, getWorkItemsPage, createWorkItem, updateWorkItem, updateTaskStatus, deleteWorkItem } from "./services/api.js";
 import { isAuthenticated, getAuthUser, logoutUser } from "./services/auth.js";
 
+// Pages that need every work item (boards, sprint board, backlog tree), and
+// the columns they read; Work Items pages its own list and edits load the full item
+const ALL_ITEMS_PAGES = ["boards", "sprints", "backlog"];
+const ALL_ITEMS_FIELDS = "backlog,sprint_id";
+const ALL_ITEMS_PAGE_SIZE = 500;
+
 function App() {
   const [page, setPage] = useState("boards");
   const [workItems, setWorkItems] = useState([]);
+  const [itemChange, setItemChange] = useState(null);
+  const itemsRequested = useRef(false);
+  const itemsLoad = useRef(0);
   const [modalOpen, setModalOpen] = useState(false);
   const [modalDefaults, setModalDefaults] = useState({});
   const [currentProject, setCurrentProject] = useState(null);
@@ -75,52 +84,80 @@ function App() {
     setShowUserPicker(false);
   };
 
+  // Follow the cursor through narrow pages, showing each page as it arrives
   const loadItems = useCallback(async () => {
+    itemsRequested.current = true;
+    const req = ++itemsLoad.current;
     try {
-      const data = await getWorkItems();
-      setWorkItems(data);
+      let items = [];
+      let cursor = null;
+      do {
+        const next = await getWorkItemsPage({ fields: ALL_ITEMS_FIELDS, limit: ALL_ITEMS_PAGE_SIZE, cursor });
+        if (req !== itemsLoad.current) return;
+        items = items.concat(next.items);
+        cursor = next.nextCursor;
+        setWorkItems(items);
+      } while (cursor);
     } catch (e) {
       console.error("Failed to load work items", e);
     }
   }, []);
 
-  useEffect(() => { loadItems(); }, [loadItems]);
+  useEffect(() => {
+    if (ALL_ITEMS_PAGES.includes(page) && !itemsRequested.current) loadItems();
+  }, [page, loadItems]);
   useEffect(() => { loadUsers(); }, [loadUsers]);
 
+  // Apply a saved or deleted item to the loaded list instead of reloading it;
+  // itemChange tells pages with their own list (Work Items) about it too
+  const applyChange = (kind, item) => {
+    setWorkItems((prev) => {
+      if (kind === "deleted") return prev.filter((w) => w.task_id !== item.task_id);
+      if (!prev.some((w) => w.task_id === item.task_id)) return itemsRequested.current ? [...prev, item] : prev;
+      return prev.map((w) => (w.task_id === item.task_id ? { ...w, ...item } : w));
+    });
+    setItemChange({ kind, item });
+  };
+
   const openCreate = (defaults = {}) => {
     setModalDefaults(defaults);
     setModalOpen(true);
   };
 
   const handleSave = async (payload) => {
+    let saved;
     if (payload.task_id) {
       // Edit mode — task_id present means update existing
       const { task_id, ...fields } = payload;
-      await updateWorkItem(task_id, fields);
+      saved = await updateWorkItem(task_id, fields);
     } else {
-      await createWorkItem(payload);
+      saved = await createWorkItem(payload);
     }
     setModalOpen(false);
     setModalDefaults({});
-    loadItems();
+    applyChange(payload.task_id ? "updated" : "created", saved);
   };
 
-  const openEdit = (item) => {
-    setModalDefaults(item);
-    setModalOpen(true);
+  // List rows carry only a few columns, so edit the full item
+  const openEdit = async (item) => {
+    try {
+      setModalDefaults(await getWorkItem(item.task_id));
+      setModalOpen(true);
+    } catch (e) {
+      console.error("Failed to load work item", e);
+    }
   };
 
   const handleStateChange = async (taskId, newState) => {
-    await updateTaskStatus(taskId, { state: newState });
-    loadItems();
+    applyChange("updated", await updateTaskStatus(taskId, { state: newState }));
   };
 
   const handleDelete = async (taskId) => {
     await deleteWorkItem(taskId);
-    loadItems();
+    applyChange("deleted", { task_id: taskId });
   };
 
-  const sharedProps = { workItems, onStateChange: handleStateChange, onDelete: handleDelete, onNewItem: openCreate, onEdit: openEdit, reload: loadItems };
+  const sharedProps = { workItems, itemChange, onStateChange: handleStateChange, onDelete: handleDelete, onNewItem: openCreate, onEdit: openEdit, reload: loadItems };
 
   // Show login/register if not authenticated
   if (!authUser || !isAuthenticated()) {
@@ -1,10 +1,11 @@
-import React, { useMemo, useState } from "react";
+import React, { useEffect, useMemo, useState } from "react";
 import {
   Chart as ChartJS,
   CategoryScale, LinearScale, BarElement,
   PointElement, LineElement, Tooltip, Legend, Filler,
 } from "chart.js";
 import { Bar, Line } from "react-chartjs-2";
+import { getCumulativeFlow } from "../services/api.js";
 
 ChartJS.register(
   CategoryScale, LinearScale, BarElement,
@@ -27,38 +28,54 @@ function sprintLabel(s) {
 }
 
 /* ── Full CFD Report ─────────────────────────────────────────────────── */
-function CFDFullReport({ workItems, onClose }) {
-  // group by sprint, stack by state
-  const sprints = useMemo(() => {
-    const map = {};
-    workItems.forEach(w => {
-      const sp = sprintLabel(w.sprint);
-      if (!map[sp]) map[sp] = { New: 0, Active: 0, Resolved: 0, Closed: 0 };
-      const st = w.state || "New";
-      if (map[sp][st] !== undefined) map[sp][st]++;
-    });
-    // sort sprint keys naturally
-    return Object.fromEntries(
-      Object.entries(map).sort(([a], [b]) => {
-        const na = parseInt(a.match(/\d+/)?.[0] ?? 0);
-        const nb = parseInt(b.match(/\d+/)?.[0] ?? 0);
-        return na - nb;
-      })
-    );
-  }, [workItems]);
+const CFD_BUCKETS = [
+  ["sprint", "By sprint"],
+  ["day",    "Daily"],
+  ["week",   "Weekly"],
+  ["month",  "Monthly"],
+];
+const OTHER_COLOR = { bg: "rgba(135,100,184,.45)", border: "#8764b8" };
 
-  const labels = Object.keys(sprints).length
-    ? Object.keys(sprints)
-    : ["Sprint 1", "Sprint 2", "Sprint 3"];
+function CFDFullReport({ onClose }) {
+  const [bucket, setBucket] = useState("sprint");
+  const [cfd, setCfd] = useState(null);
+
+  // counts come from GET /reports/cfd, so the payload does not grow with the backlog
+  useEffect(() => {
+    let cancelled = false;
+    setCfd(null);
+    getCumulativeFlow({ bucket })
+      .then(data => { if (!cancelled) setCfd(data); })
+      .catch(() => { if (!cancelled) setCfd({ bucket, labels: [], states: [], counts: {} }); });
+    return () => { cancelled = true; };
+  }, [bucket]);
+
+  // sprint labels are merged the same way the other charts label sprints
+  const { labels, counts } = useMemo(() => {
+    if (!cfd) return { labels: [], counts: {} };
+    if (cfd.bucket !== "sprint") return { labels: cfd.labels, counts: cfd.counts };
+    const merged = {};
+    const order = [];
+    cfd.labels.forEach((raw, i) => {
+      const sp = sprintLabel(raw);
+      if (!merged[sp]) { merged[sp] = {}; order.push(sp); }
+      cfd.states.forEach(s => { merged[sp][s] = (merged[sp][s] || 0) + cfd.counts[s][i]; });
+    });
+    return {
+      labels: order,
+      counts: Object.fromEntries(cfd.states.map(s => [s, order.map(sp => merged[sp][s])])),
+    };
+  }, [cfd]);
 
   const data = {
     labels,
-    datasets: STATES.map(s => ({
+    datasets: (cfd?.states ?? []).map(s => ({
       label: s,
-      data: labels.map(l => sprints[l]?.[s] ?? 0),
-      backgroundColor: S_COLORS[s].bg,
-      borderColor: S_COLORS[s].border,
+      data: counts[s] ?? [],
+      backgroundColor: (S_COLORS[s] ?? OTHER_COLOR).bg,
+      borderColor: (S_COLORS[s] ?? OTHER_COLOR).border,
       borderWidth: 1,
+      pointRadius: 0,
       fill: true,
     })),
   };
@@ -74,10 +91,17 @@ function CFDFullReport({ workItems, onClose }) {
       <div className="analytics-modal" onClick={e => e.stopPropagation()}>
         <div className="analytics-modal-header">
           <h3>Cumulative Flow Diagram</h3>
+          <select className="filter-select" value={bucket} onChange={e => setBucket(e.target.value)}>
+            {CFD_BUCKETS.map(([value, label]) => <option key={value} value={value}>{label}</option>)}
+          </select>
           <button className="analytics-modal-close" onClick={onClose}>✕</button>
         </div>
         <div className="analytics-modal-body">
-          <Bar data={data} options={opts} />
+          {!cfd
+            ? <div className="empty-state">Loading…</div>
+            : bucket === "sprint"
+              ? <Bar data={data} options={opts} />
+              : <Line data={data} options={opts} />}
         </div>
       </div>
     </div>
@@ -277,7 +301,7 @@ export default function BoardAnalytics({ workItems }) {
         </div>
       </div>
 
-      {cfdOpen && <CFDFullReport workItems={workItems} onClose={() => setCfdOpen(false)} />}
+      {cfdOpen && <CFDFullReport onClose={() => setCfdOpen(false)} />}
       {velOpen && <VelocityFullReport workItems={workItems} onClose={() => setVelOpen(false)} />}
     </div>
   );
@@ -1,9 +1,10 @@
-import React, { useMemo } from "react";
+import React, { useEffect, useMemo, useState } from "react";
 import {
   Chart as ChartJS, CategoryScale, LinearScale,
   PointElement, LineElement, Filler, Tooltip, Legend,
 } from "chart.js";
 import { Line } from "react-chartjs-2";
+import { getSprintBurndown } from "../services/api.js";
 
 ChartJS.register(CategoryScale, LinearScale, PointElement, LineElement, Filler, Tooltip, Legend);
 
@@ -11,9 +12,31 @@ ChartJS.register(CategoryScale, LinearScale, PointElement, LineElement, Filler,
  * SprintBurndown
  * Shows a mini burndown sparkline for a sprint.
  * Computes ideal burndown line vs remaining story points.
+ * With a `sprintId` the series come from GET /sprints/{id}/burndown,
+ * which rebuilds them from the task state history.
  */
-export default function SprintBurndown({ workItems, sprint, startDate, endDate }) {
+export default function SprintBurndown({ workItems, sprint, sprintId, startDate, endDate }) {
+  const [server, setServer] = useState(null);
+
+  useEffect(() => {
+    if (!sprintId) { setServer(null); return; }
+    let cancelled = false;
+    getSprintBurndown(sprintId)
+      .then(data => { if (!cancelled) setServer(data); })
+      .catch(() => { if (!cancelled) setServer(null); });
+    return () => { cancelled = true; };
+  }, [sprintId]);
+
   const { labels, ideal, actual } = useMemo(() => {
+    if (server) {
+      const n = server.days.length;
+      return {
+        labels: server.days.map((d, i) => (i === 0 || i === n - 1 || i === Math.floor(n / 2) ? d.slice(5) : "")),
+        ideal: server.ideal,
+        actual: server.remaining,
+      };
+    }
+
     // Get items in this sprint
     const sprintItems = sprint && sprint !== "All"
       ? workItems.filter(w => String(w.sprint) === String(sprint))
@@ -60,7 +83,7 @@ export default function SprintBurndown({ workItems, sprint, startDate, endDate }
       ideal: idealLine,
       actual: actualLine,
     };
-  }, [workItems, sprint, startDate, endDate]);
+  }, [server, workItems, sprint, startDate, endDate]);
 
   const data = {
     labels,
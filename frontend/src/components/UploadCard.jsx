@@ -12,8 +12,15 @@ function UploadCard({ onUpload }) {
     if (!file) { setError("Select a CSV, JSON, or Excel file."); return; }
     try {
       setStatus("Uploading…");
-      await onUpload(file);
-      setStatus("✅ Upload complete.");
+      const job = await onUpload(file, (progress) =>
+        setStatus(`Importing… ${progress.rows_processed.toLocaleString()} rows processed`)
+      );
+      if (!job) setStatus("✅ Upload complete.");
+      else if (job.file_unchanged) setStatus("✅ This file was already imported — nothing changed.");
+      else setStatus(
+        `✅ Import complete: ${job.inserted} new, ${job.updated} updated, ` +
+        `${job.unchanged} unchanged, ${job.skipped} skipped.`
+      );
       setFile(null);
       event.target.reset();
     } catch (err) {
@@ -29,7 +36,7 @@ function UploadCard({ onUpload }) {
       <form className="upload-form" onSubmit={handleSubmit}>
         <input
           type="file"
-          accept=".csv,.json,.xlsx,.xls"
+          accept=".csv,.json,.jsonl,.xlsx,.xls,.parquet,.arrow,.feather"
           onChange={(event) => setFile(event.target.files?.[0] || null)}
         />
         <button type="submit" className="btn btn-primary">Upload</button>
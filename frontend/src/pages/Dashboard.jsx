@@ -15,10 +15,8 @@ import { Pie, Bar, Line } from "react-chartjs-2";
 import UploadCard from "../components/UploadCard.jsx";
 import TaskTable from "../components/TaskTable.jsx";
 import {
-  getDailyReport,
-  getWeeklyReport,
-  getMonthlyReport,
-  getTasks,
+  getDashboard,
+  getWeeklyTaskSummaries,
   uploadAdoDump,
   getTaskUpdates,
   updateTaskStatus
@@ -37,30 +35,52 @@ ChartJS.register(
 
 const tabs = ["Daily", "Weekly", "Monthly"];
 
+// Report sections the tabs render (the task list is not shown here)
+const DASHBOARD_PARTS = ["daily", "weekly", "monthly"];
+
+// Only the summary keys the Weekly tab renders
+const SUMMARY_FIELDS = ["task_id", "title", "assigned_to", "weekly_update", "timeline_compliance"];
+
 function Dashboard() {
   const [activeTab, setActiveTab] = useState("Daily");
   const [daily, setDaily] = useState(null);
   const [weekly, setWeekly] = useState(null);
   const [monthly, setMonthly] = useState(null);
-  const [tasks, setTasks] = useState([]);
-
-  useEffect(() => {
-    getDailyReport().then(setDaily).catch(() => setDaily(null));
-    getWeeklyReport().then(setWeekly).catch(() => setWeekly(null));
-    getMonthlyReport().then(setMonthly).catch(() => setMonthly(null));
-    getTasks().then(setTasks).catch(() => setTasks([]));
-  }, []);
+  const [summaries, setSummaries] = useState({ items: [], nextCursor: null });
+
+  const loadSummaries = (cursor = null) =>
+    getWeeklyTaskSummaries({ cursor, fields: SUMMARY_FIELDS })
+      .then((page) =>
+        setSummaries((prev) => ({
+          items: cursor == null ? page.items : [...prev.items, ...page.items],
+          nextCursor: page.next_cursor,
+        }))
+      )
+      .catch(() => setSummaries({ items: [], nextCursor: null }));
 
   const refreshReports = () => {
-    getDailyReport().then(setDaily).catch(() => setDaily(null));
-    getWeeklyReport().then(setWeekly).catch(() => setWeekly(null));
-    getMonthlyReport().then(setMonthly).catch(() => setMonthly(null));
-    getTasks().then(setTasks).catch(() => setTasks([]));
+    getDashboard({ parts: DASHBOARD_PARTS })
+      .then((dashboard) => {
+        setDaily(dashboard.daily);
+        setWeekly(dashboard.weekly);
+        setMonthly(dashboard.monthly);
+      })
+      .catch(() => {
+        setDaily(null);
+        setWeekly(null);
+        setMonthly(null);
+      });
+    loadSummaries();
   };
 
-  const handleUpload = async (file) => {
-    await uploadAdoDump(file);
+  useEffect(() => {
+    refreshReports();
+  }, []);
+
+  const handleUpload = async (file, onProgress) => {
+    const job = await uploadAdoDump(file, onProgress);
     refreshReports();
+    return job;
   };
 
   const handleTaskUpdate = async (taskId, payload) => {
@@ -168,7 +188,7 @@ function Dashboard() {
           <div className="report-card">
             <h2>Task Summaries</h2>
             <div className="summary-list">
-              {(weekly?.task_summaries || []).map((summary) => (
+              {summaries.items.map((summary) => (
                 <div className="summary-item" key={summary.line1.task_id}>
                   <div className="line1">
                     <strong>{summary.line1.task_id}</strong> — {summary.line1.title}
@@ -180,6 +200,11 @@ function Dashboard() {
                 </div>
               ))}
             </div>
+            {summaries.nextCursor != null && (
+              <button type="button" className="btn btn-ghost" onClick={() => loadSummaries(summaries.nextCursor)}>
+                Load more
+              </button>
+            )}
           </div>
         </div>
       )}
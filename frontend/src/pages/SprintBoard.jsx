@@ -21,7 +21,7 @@ const TABS = [
 ];
 
 /* ── Sprint Analytics sub-view ───────────────────────────────────────── */
-function SprintAnalytics({ workItems, sprint }) {
+function SprintAnalytics({ workItems, sprint, sprintId }) {
   const items = useMemo(() =>
     sprint && sprint !== "All"
       ? workItems.filter(w => String(w.sprint) === String(sprint))
@@ -96,7 +96,7 @@ function SprintAnalytics({ workItems, sprint }) {
         <div className="sprint-chart-card">
           <div className="sprint-chart-title">Burndown</div>
           <div style={{ height: 200 }}>
-            <SprintBurndown workItems={workItems} sprint={sprint} />
+            <SprintBurndown workItems={workItems} sprint={sprint} sprintId={sprintId} />
           </div>
         </div>
       </div>
@@ -353,6 +353,12 @@ export default function SprintBoard({ workItems, onStateChange, onDelete, onNewI
     };
   }, [sprint]);
 
+  // Sprint record behind the selected label, for the server-side burndown
+  const sprintId = useMemo(() => {
+    if (!sprint || sprint === "All") return null;
+    return workItems.find(w => String(w.sprint) === sprint && w.sprint_id)?.sprint_id ?? null;
+  }, [workItems, sprint]);
+
   const selectedSprintLabel = sprint === "All" ? "All Sprints" : sprint;
 
   return (
@@ -456,6 +462,7 @@ export default function SprintBoard({ workItems, onStateChange, onDelete, onNewI
               <SprintBurndown
                 workItems={workItems}
                 sprint={sprint}
+                sprintId={sprintId}
                 startDate={sprintInfo.start}
                 endDate={sprintInfo.end}
               />
@@ -530,6 +537,7 @@ export default function SprintBoard({ workItems, onStateChange, onDelete, onNewI
           <SprintAnalytics
             workItems={workItems}
             sprint={sprint}
+            sprintId={sprintId}
           />
         )}
 
@@ -1,8 +1,11 @@
-import React, { useMemo, useState } from "react";
+import React, { useEffect, useMemo, useRef, useState } from "react";
 import { TypeBadge, StatePill, PriDot, Avatar } from "../components/WorkItemModal.jsx";
 import { useConfig } from "../hooks/useConfig.js";
+import { getWorkItemsPage } from "../services/api.js";
 
-export default function WorkItems({ workItems, onStateChange, onDelete, onNewItem, onEdit }) {
+const PAGE_SIZE = 200;
+
+export default function WorkItems({ itemChange, onStateChange, onDelete, onNewItem, onEdit }) {
   const config = useConfig();
   // Build priority label map from dynamic config
   const priorityLabels = useMemo(
@@ -15,22 +18,49 @@ export default function WorkItems({ workItems, onStateChange, onDelete, onNewIte
   const [typeFilter, setTypeFilter]   = useState("");
   const [stateFilter, setStateFilter] = useState("");
   const [search, setSearch]           = useState("");
+  const [query, setQuery]             = useState("");
+  const [page, setPage]               = useState({ items: [], nextCursor: null });
+  const latest = useRef(0);   // ignore pages of an older filter / search
+
+  // Search on the server once typing pauses
+  useEffect(() => {
+    const t = setTimeout(() => setQuery(search.trim()), 300);
+    return () => clearTimeout(t);
+  }, [search]);
+
+  const loadPage = (cursor = null) => {
+    const req = cursor == null ? ++latest.current : latest.current;
+    return getWorkItemsPage({ type: typeFilter, state: stateFilter, search: query, limit: PAGE_SIZE, cursor })
+      .then((next) => {
+        if (req !== latest.current) return;
+        setPage((prev) => ({
+          items: cursor == null ? next.items : [...prev.items, ...next.items],
+          nextCursor: next.nextCursor,
+        }));
+      })
+      .catch((e) => console.error("Failed to load work items", e));
+  };
+
+  // Filters and search run server-side
+  useEffect(() => { loadPage(); }, [typeFilter, stateFilter, query]);
+
+  // Patch edits into the pages already loaded rather than starting over;
+  // a new item shows up once the last page is loaded (the list is in id order)
+  useEffect(() => {
+    if (!itemChange) return;
+    const { kind, item } = itemChange;
+    setPage((prev) => {
+      if (kind === "deleted") {
+        return { ...prev, items: prev.items.filter((w) => w.task_id !== item.task_id) };
+      }
+      if (prev.items.some((w) => w.task_id === item.task_id)) {
+        return { ...prev, items: prev.items.map((w) => (w.task_id === item.task_id ? { ...w, ...item } : w)) };
+      }
+      return kind === "created" && prev.nextCursor == null ? { ...prev, items: [...prev.items, item] } : prev;
+    });
+  }, [itemChange]);
 
-  const filtered = useMemo(() => {
-    let list = workItems;
-    if (typeFilter)  list = list.filter((w) => w.work_item_type === typeFilter);
-    if (stateFilter) list = list.filter((w) => (w.state || "New") === stateFilter);
-    if (search) {
-      const q = search.toLowerCase();
-      list = list.filter(
-        (w) =>
-          (w.title || "").toLowerCase().includes(q) ||
-          (w.task_id || "").toLowerCase().includes(q) ||
-          (w.assigned_to || "").toLowerCase().includes(q)
-      );
-    }
-    return list;
-  }, [workItems, typeFilter, stateFilter, search]);
+  const filtered = page.items;
 
   return (
     <>
@@ -59,7 +89,7 @@ export default function WorkItems({ workItems, onStateChange, onDelete, onNewIte
             {config.work_item_states.map((s) => <option key={s}>{s}</option>)}
           </select>
           <span style={{ marginLeft: "auto", fontSize: 13, color: "#605e5c" }}>
-            {filtered.length} item(s)
+            {filtered.length}{page.nextCursor != null ? "+" : ""} item(s)
           </span>
         </div>
 
@@ -163,6 +193,11 @@ export default function WorkItems({ workItems, onStateChange, onDelete, onNewIte
                 ))}
               </tbody>
             </table>
+            {page.nextCursor != null && (
+              <button type="button" className="btn btn-ghost" onClick={() => loadPage(page.nextCursor)}>
+                Load more
+              </button>
+            )}
           </div>
         )}
       </div>
@@ -81,21 +81,94 @@ export const assignRole = (data) => postJson(`/projects/${data.project_id}/roles
 export const updateRole = (roleId, data) => patchJson(`/roles/${roleId}`, data);
 export const deleteRole = (roleId) => deleteJson(`/roles/${roleId}`);
 export const getDailyReport   = () => fetchJson("/reports/daily");
-export const getWeeklyReport  = () => fetchJson("/reports/weekly");
+export const getWeeklyReport  = () => fetchJson("/reports/weekly?include_summaries=false");
 export const getMonthlyReport = () => fetchJson("/reports/monthly");
 
+// Daily, weekly and monthly reports (and optionally the task list) in one request
+export function getDashboard({ parts } = {}) {
+  const qs = parts ? `?parts=${parts.join(",")}` : "";
+  return fetchJson(`/reports/dashboard${qs}`);
+}
+
+// Cumulative flow: per-state counts by day / week / month / sprint
+export function getCumulativeFlow({ bucket, start, end, project_id, sprint_id } = {}) {
+  const params = new URLSearchParams();
+  if (bucket)     params.set("bucket", bucket);
+  if (start)      params.set("start", start);
+  if (end)        params.set("end", end);
+  if (project_id) params.set("project_id", project_id);
+  if (sprint_id)  params.set("sprint_id", sprint_id);
+  const qs = params.toString();
+  return fetchJson(`/reports/cfd${qs ? `?${qs}` : ""}`);
+}
+
+// Monte Carlo completion forecast for a backlog size or an epic's open items
+export function getForecast({ backlog, epic_id, unit, history_days, project_id, team_id } = {}) {
+  const params = new URLSearchParams();
+  if (backlog != null) params.set("backlog", backlog);
+  if (epic_id)         params.set("epic_id", epic_id);
+  if (unit)            params.set("unit", unit);
+  if (history_days)    params.set("history_days", history_days);
+  if (project_id)      params.set("project_id", project_id);
+  if (team_id)         params.set("team_id", team_id);
+  return fetchJson(`/reports/forecast?${params}`);
+}
+
+// Weekly task summaries, one page at a time ({ items, next_cursor })
+export function getWeeklyTaskSummaries({ cursor, limit, fields } = {}) {
+  const params = new URLSearchParams();
+  if (cursor != null) params.set("cursor", cursor);
+  if (limit)          params.set("limit", limit);
+  if (fields)         params.set("fields", fields.join(","));
+  const qs = params.toString();
+  return fetchJson(`/reports/weekly/tasks${qs ? `?${qs}` : ""}`);
+}
+
 // ── Work items (new ADO endpoints) ───────────────────────────────────
-export function getWorkItems({ type, state, assigned_to, sprint, search } = {}) {
+export function getWorkItems({ type, state, assigned_to, sprint, search, fields } = {}) {
   const params = new URLSearchParams();
   if (type)        params.set("work_item_type", type);
   if (state)       params.set("state", state);
   if (assigned_to) params.set("assigned_to", assigned_to);
   if (sprint)      params.set("sprint", sprint);
   if (search)      params.set("search", search);
+  if (fields)      params.set("fields", fields);
   const qs = params.toString();
   return fetchJson(`/workitems${qs ? `?${qs}` : ""}`);
 }
 
+/**
+ * One page of work items, sorted server-side ("priority", "-updated_at", ...).
+ * `fields` narrows the columns: a preset ("board", "backlog", "mobile") or
+ * a comma-separated field list.
+ * Resolves to { items, nextCursor }; pass nextCursor back for the next page
+ * (null after the last one).
+ */
+export async function getWorkItemsPage({ type, state, assigned_to, sprint, search, fields, sort, limit = 200, cursor } = {}) {
+  const params = new URLSearchParams();
+  if (type)        params.set("work_item_type", type);
+  if (state)       params.set("state", state);
+  if (assigned_to) params.set("assigned_to", assigned_to);
+  if (sprint)      params.set("sprint", sprint);
+  if (search)      params.set("search", search);
+  if (fields)      params.set("fields", fields);
+  if (sort)        params.set("sort", sort);
+  if (cursor)      params.set("cursor", cursor);
+  params.set("limit", limit);
+  const res = await fetch(`${API_BASE}/workitems?${params}`, {
+    headers: getAuthHeaders(),
+    credentials: 'include',
+  });
+  if (!res.ok) {
+    const error = await res.json().catch(() => ({}));
+    throw new Error(error.detail || `Request failed: ${res.status}`);
+  }
+  return { items: await res.json(), nextCursor: res.headers.get("X-Next-Cursor") };
+}
+
+/** Every field of one work item (the list presets return only a few). */
+export const getWorkItem = (taskId) => fetchJson(`/workitems/${encodeURIComponent(taskId)}`);
+
 export function createWorkItem(payload) {
   return postJson("/workitems", payload);
 }
@@ -112,7 +185,16 @@ export async function deleteWorkItem(taskId) {
 export const getTasks = () => fetchJson("/tasks");
 
 // ── Import ────────────────────────────────────────────────────────────
-export async function uploadAdoDump(file) {
+export const getImportJob = (jobId) => fetchJson(`/import/jobs/${encodeURIComponent(jobId)}`);
+
+const IMPORT_POLL_MS = 1000;
+
+/**
+ * Upload an ADO dump and wait for its background import job to finish.
+ * @param {File}     file
+ * @param {Function} onProgress  called with the job status on every poll
+ */
+export async function uploadAdoDump(file, onProgress) {
   const formData = new FormData();
   formData.append("file", file);
   
@@ -134,7 +216,17 @@ export async function uploadAdoDump(file) {
     const detail = await res.json().catch(() => ({}));
     throw new Error(detail.detail || "Upload failed");
   }
-  return res.json();
+
+  let job = await res.json();
+  while (job.state === "queued" || job.state === "running") {
+    onProgress?.(job);
+    await new Promise((resolve) => setTimeout(resolve, IMPORT_POLL_MS));
+    job = await getImportJob(job.job_id);
+  }
+  if (job.state === "failed") {
+    throw new Error(job.errors?.[0] || "Import failed");
+  }
+  return job;
 }
 
 // ── Task status patch ─────────────────────────────────────────────────
@@ -175,6 +267,7 @@ export const updateSprint  = (sprintId, data) => patchJson(`/sprints/${sprintId}
 export const activateSprint = (sprintId) => postJson(`/sprints/${sprintId}/activate`, {});
 export const completeSprint = (sprintId) => postJson(`/sprints/${sprintId}/complete`, {});
 export const deleteSprint  = (sprintId) => deleteJson(`/sprints/${sprintId}`);
+export const getSprintBurndown = (sprintId) => fetchJson(`/sprints/${sprintId}/burndown`);
 
 // ── Config ─────────────────────────────────────────────────────────────────
 
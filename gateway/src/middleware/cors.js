@@ -34,6 +34,7 @@ const corsOptions = {
     'Content-Range',
     'X-Content-Range',
     'X-Total-Count',
+    'X-Next-Cursor',
   ],
   credentials: true,
   optionsSuccessStatus: 200, // For legacy browsers
@@ -18,6 +18,7 @@
  * POST   /api/sprints/:id/activate
  * POST   /api/sprints/:id/complete
  * DELETE /api/sprints/:id
+ * GET    /api/sprints/:id/burndown
  */
 const express = require('express');
 const { proxyRequest } = require('../middleware/proxy');
@@ -61,6 +62,7 @@ router.patch('/sprints/:id',            (req, res) => proxyRequest(req, res, FAS
 router.post('/sprints/:id/activate',    (req, res) => proxyRequest(req, res, FASTAPI(), `/sprints/${req.params.id}/activate`));
 router.post('/sprints/:id/complete',    (req, res) => proxyRequest(req, res, FASTAPI(), `/sprints/${req.params.id}/complete`));
 router.delete('/sprints/:id',           (req, res) => proxyRequest(req, res, FASTAPI(), `/sprints/${req.params.id}`));
+router.get('/sprints/:id/burndown',     (req, res) => proxyRequest(req, res, FASTAPI(), `/sprints/${req.params.id}/burndown`));
 
 /* ── Retrospectives ──────────────────────────────────────────────────────── */
 router.get('/sprints/:id/retrospective',   (req, res) => proxyRequest(req, res, FASTAPI(), `/sprints/${req.params.id}/retrospective`));
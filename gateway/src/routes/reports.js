@@ -3,7 +3,14 @@
  *
  * GET /api/reports/daily
  * GET /api/reports/weekly
+ * GET /api/reports/weekly/tasks
  * GET /api/reports/monthly
+ * GET /api/reports/dashboard
+ * GET /api/reports/cfd
+ * GET /api/reports/forecast
+ * GET /api/reports/cache/stats
+ * GET /api/reports/snapshots
+ * GET /api/reports/:report/csv
  */
 const express = require('express');
 const { proxyRequest } = require('../middleware/proxy');
@@ -19,8 +26,36 @@ router.get('/weekly', (req, res) => {
   proxyRequest(req, res, FASTAPI(), '/reports/weekly');
 });
 
+router.get('/weekly/tasks', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/reports/weekly/tasks');
+});
+
 router.get('/monthly', (req, res) => {
   proxyRequest(req, res, FASTAPI(), '/reports/monthly');
 });
 
+router.get('/dashboard', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/reports/dashboard');
+});
+
+router.get('/cfd', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/reports/cfd');
+});
+
+router.get('/forecast', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/reports/forecast');
+});
+
+router.get('/cache/stats', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/reports/cache/stats');
+});
+
+router.get('/snapshots', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/reports/snapshots');
+});
+
+router.get('/:report/csv', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), `/reports/${req.params.report}/csv`);
+});
+
 module.exports = router;
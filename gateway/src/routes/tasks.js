@@ -1,10 +1,13 @@
 /**
  * /api/tasks  →  FastAPI /tasks
  *
- * GET   /api/tasks                       list all tasks
+ * GET   /api/tasks                       list all tasks (?fields=&sort=&limit=&cursor=; next cursor in X-Next-Cursor)
  * PATCH /api/tasks/:taskId               update status/fields
  * GET   /api/tasks/:taskId/updates       daily updates log
  * GET   /api/tasks/export/excel          Excel export
+ * GET   /api/tasks/export/parquet        Parquet export (?dataset=tasks|updates)
+ * GET   /api/tasks/export/arrow          Arrow IPC export (?dataset=tasks|updates)
+ * GET   /api/tasks/export/csv            streaming CSV export (?dataset=tasks|updates + /workitems filters)
  */
 const express = require('express');
 const { proxyRequest } = require('../middleware/proxy');
@@ -20,6 +23,18 @@ router.get('/export/excel', (req, res) => {
   proxyRequest(req, res, FASTAPI(), '/export/excel');
 });
 
+router.get('/export/parquet', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/export/parquet');
+});
+
+router.get('/export/arrow', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/export/arrow');
+});
+
+router.get('/export/csv', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), '/export/csv');
+});
+
 router.get('/:taskId/updates', (req, res) => {
   proxyRequest(req, res, FASTAPI(), `/tasks/${req.params.taskId}/updates`);
 });
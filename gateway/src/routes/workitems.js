@@ -1,7 +1,11 @@
 /**
  * /api/workitems  →  FastAPI /workitems
  *
- * GET    /api/workitems          list (supports ?type=&state=&assigned_to=&sprint=&search=)
+ * GET    /api/workitems          list (supports ?type=&state=&assigned_to=&sprint=&search=,
+ *                                 paged with ?sort=&limit=&cursor=; next cursor in X-Next-Cursor;
+ *                                 ?search= is ranked full-text search (sort=relevance by default)
+ *                                 ?fields=board|backlog|mobile or a field list narrows the columns)
+ * GET    /api/workitems/:taskId  one work item, every field
  * POST   /api/workitems          create
  * DELETE /api/workitems/:taskId  delete
  */
@@ -17,6 +21,11 @@ router.get('/', (req, res) => {
   proxyRequest(req, res, FASTAPI(), `/workitems${qs ? '?' + qs : ''}`);
 });
 
+// GET /api/workitems/:taskId
+router.get('/:taskId', (req, res) => {
+  proxyRequest(req, res, FASTAPI(), `/workitems/${req.params.taskId}`);
+});
+
 // POST /api/workitems
 router.post('/', (req, res) => {
   proxyRequest(req, res, FASTAPI(), '/workitems');
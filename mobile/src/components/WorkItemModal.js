@@ -5,7 +5,8 @@ import {
 } from 'react-native';
 import { COLORS, SPACING, TYPOGRAPHY, RADIUS, SHADOW } from '../theme';
 import { WORK_ITEM_TYPES, STATES, PRIORITIES } from '../constants';
-import { TypeBadge, StatePill, Divider } from './UIComponents';
+import { TypeBadge, StatePill, Divider, Spinner } from './UIComponents';
+import { getWorkItem } from '../services/api';
 
 // ── Picker row (tap to cycle options) ────────────────────────────────────────
 function CyclePicker({ label, options, valueKey = 'value', labelKey = 'label', value, onChange, renderValue }) {
@@ -72,11 +73,21 @@ export default function WorkItemModal({ visible, item, onClose, onSave }) {
 
   const [form, setForm] = useState(defaults);
   const [saving, setSaving] = useState(false);
+  const [loading, setLoading] = useState(false);
 
+  // List rows carry only a few fields, so load the full item before editing
   useEffect(() => {
-    if (visible) {
-      setForm(item ? { ...defaults, ...item, story_points: String(item.story_points ?? ''), tags: item.tags ?? '' } : defaults);
-    }
+    if (!visible) return;
+    if (!item) { setForm(defaults); return; }
+    let cancelled = false;
+    setLoading(true);
+    getWorkItem(item.task_id)
+      .then(full => {
+        if (!cancelled) setForm({ ...defaults, ...full, story_points: String(full.story_points ?? ''), tags: full.tags ?? '' });
+      })
+      .catch(e => { if (!cancelled) { console.error('Load error', e); onClose(); } })
+      .finally(() => { if (!cancelled) setLoading(false); });
+    return () => { cancelled = true; };
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [visible, item]);
 
@@ -118,6 +129,7 @@ export default function WorkItemModal({ visible, item, onClose, onSave }) {
               </TouchableOpacity>
             </View>
 
+            {loading ? <Spinner /> : (
             <ScrollView contentContainerStyle={styles.body} showsVerticalScrollIndicator={false}>
               {/* Title */}
               <View style={styles.fieldRow}>
@@ -171,6 +183,7 @@ export default function WorkItemModal({ visible, item, onClose, onSave }) {
               <Field label="Target Date"  value={form.target_date}   onChange={v => set('target_date', v)}  placeholder="YYYY-MM-DD" />
               <Field label="Description"  value={form.description}   onChange={v => set('description', v)}  multiline />
             </ScrollView>
+            )}
 
             {/* Footer */}
             <View style={styles.footer}>
@@ -178,9 +191,9 @@ export default function WorkItemModal({ visible, item, onClose, onSave }) {
                 <Text style={styles.cancelText}>Cancel</Text>
               </TouchableOpacity>
               <TouchableOpacity
-                style={[styles.saveBtn, (!form.title.trim() || saving) && styles.saveBtnDisabled]}
+                style={[styles.saveBtn, (!form.title.trim() || saving || loading) && styles.saveBtnDisabled]}
                 onPress={handleSave}
-                disabled={!form.title.trim() || saving}
+                disabled={!form.title.trim() || saving || loading}
               >
                 <Text style={styles.saveText}>{saving ? 'Saving…' : isEdit ? 'Save Changes' : 'Create'}</Text>
               </TouchableOpacity>
@@ -1,4 +1,4 @@
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useRef } from 'react';
 import {
   View, Text, FlatList, TouchableOpacity,
   StyleSheet, RefreshControl, Alert,
@@ -8,7 +8,9 @@ import { COLORS, SPACING, TYPOGRAPHY, RADIUS } from '../theme';
 import { TYPE_HIERARCHY, getTypeInfo, getStateInfo } from '../constants';
 import { TypeBadge, StatePill, Avatar, Spinner, EmptyState } from '../components/UIComponents';
 import WorkItemModal from '../components/WorkItemModal';
-import { getWorkItems, createWorkItem, deleteWorkItem } from '../services/api';
+import { getWorkItemsPage, createWorkItem, deleteWorkItem } from '../services/api';
+
+const PAGE_SIZE = 200;
 
 // ── Build parent→children tree ────────────────────────────────────────────────
 function buildTree(flat) {
@@ -106,14 +108,25 @@ export default function BacklogScreen() {
   const [loading,   setLoading]   = useState(true);
   const [refreshing,setRefreshing]= useState(false);
   const [modal,     setModal]     = useState({ visible: false, item: null, parentId: null });
+  const latest = useRef(0);   // a newer load stops an older one
 
+  // The tree needs every item, so follow the cursor to the last page, but
+  // show what has arrived after each page instead of waiting for all of it
   const load = useCallback(async (isRefresh = false) => {
     if (isRefresh) setRefreshing(true); else setLoading(true);
+    const req = ++latest.current;
     try {
-      const data = await getWorkItems();
-      const flat = Array.isArray(data) ? data : [];
-      setItems(flat);
-      setTree(buildTree(flat));
+      let flat = [];
+      let cursor = null;
+      do {
+        const page = await getWorkItemsPage({ fields: 'mobile', limit: PAGE_SIZE, cursor });
+        if (req !== latest.current) return;
+        flat = flat.concat(page.items);
+        cursor = page.nextCursor;
+        setItems(flat);
+        setTree(buildTree(flat));
+        setLoading(false);
+      } while (cursor);
     } catch (e) {
       console.error(e);
     } finally {
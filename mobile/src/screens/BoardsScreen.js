@@ -73,7 +73,7 @@ export default function BoardsScreen() {
   const load = useCallback(async (isRefresh = false) => {
     if (isRefresh) setRefreshing(true); else setLoading(true);
     try {
-      const data = await getWorkItems();
+      const data = await getWorkItems({ fields: 'mobile' });
       setItems(Array.isArray(data) ? data : []);
     } catch (e) {
       console.error(e);
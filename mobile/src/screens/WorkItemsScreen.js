@@ -1,4 +1,4 @@
-import React, { useState, useCallback, useMemo } from 'react';
+import React, { useState, useCallback, useEffect, useMemo, useRef } from 'react';
 import {
   View, Text, FlatList, TouchableOpacity, TextInput,
   StyleSheet, RefreshControl, Alert, ScrollView,
@@ -8,7 +8,9 @@ import { COLORS, SPACING, TYPOGRAPHY, RADIUS } from '../theme';
 import { WORK_ITEM_TYPES, STATES, getTypeInfo, getStateInfo, getPriorityInfo } from '../constants';
 import { TypeBadge, StatePill, Avatar, Spinner, EmptyState } from '../components/UIComponents';
 import WorkItemModal from '../components/WorkItemModal';
-import { getWorkItems, createWorkItem, deleteWorkItem, updateTaskStatus } from '../services/api';
+import { getWorkItemsPage, createWorkItem, deleteWorkItem, updateTaskStatus } from '../services/api';
+
+const PAGE_SIZE = 50;
 
 // ── Filter chips ──────────────────────────────────────────────────────────────
 function FilterChips({ label, options, active, onSelect }) {
@@ -65,33 +67,58 @@ function WorkItemRow({ item, onEdit, onDelete }) {
 // ── Screen ────────────────────────────────────────────────────────────────────
 export default function WorkItemsScreen() {
   const [items,      setItems]      = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading,    setLoading]    = useState(true);
+  const [loadingMore,setLoadingMore]= useState(false);
   const [refreshing, setRefreshing] = useState(false);
   const [search,     setSearch]     = useState('');
+  const [query,      setQuery]      = useState('');
   const [typeFilter, setTypeFilter] = useState('');
   const [stateFilter,setStateFilter]= useState('');
   const [modal,      setModal]      = useState({ visible: false, item: null });
+  const latest = useRef(0);   // ignore pages of an older filter / search
+
+  // Search on the server once typing pauses
+  useEffect(() => {
+    const t = setTimeout(() => setQuery(search.trim()), 300);
+    return () => clearTimeout(t);
+  }, [search]);
+
+  // Filters and search are applied server-side; pages follow the cursor
+  const filters = useMemo(() => ({
+    fields: 'mobile',
+    work_item_type: typeFilter,
+    state: stateFilter,
+    search: query,
+    limit: PAGE_SIZE,
+  }), [typeFilter, stateFilter, query]);
 
   const load = useCallback(async (isRefresh = false) => {
-    if (isRefresh) setRefreshing(true); else setLoading(true);
+    if (isRefresh) setRefreshing(true);
+    const req = ++latest.current;
     try {
-      const data = await getWorkItems();
-      setItems(Array.isArray(data) ? data : []);
+      const page = await getWorkItemsPage(filters);
+      if (req !== latest.current) return;
+      setItems(page.items);
+      setNextCursor(page.nextCursor);
     } catch (e) { console.error(e); }
     finally { setLoading(false); setRefreshing(false); }
-  }, []);
+  }, [filters]);
 
   useFocusEffect(useCallback(() => { load(); }, [load]));
 
-  const filtered = useMemo(() => {
-    const q = search.toLowerCase();
-    return items.filter(i => {
-      if (typeFilter  && i.work_item_type !== typeFilter)  return false;
-      if (stateFilter && i.state          !== stateFilter) return false;
-      if (q && !(i.title?.toLowerCase().includes(q) || i.task_id?.toLowerCase().includes(q))) return false;
-      return true;
-    });
-  }, [items, typeFilter, stateFilter, search]);
+  async function loadMore() {
+    if (!nextCursor || loadingMore) return;
+    const req = latest.current;
+    setLoadingMore(true);
+    try {
+      const page = await getWorkItemsPage({ ...filters, cursor: nextCursor });
+      if (req !== latest.current) return;
+      setItems(prev => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (e) { console.error(e); }
+    finally { setLoadingMore(false); }
+  }
 
   function handleDelete(item) {
     Alert.alert('Delete', `Delete "${item.title}"?`, [
@@ -152,14 +179,16 @@ export default function WorkItemsScreen() {
       />
 
       {/* Results count */}
-      <Text style={styles.countText}>{filtered.length} item{filtered.length !== 1 ? 's' : ''}</Text>
+      <Text style={styles.countText}>
+        {items.length}{nextCursor ? '+' : ''} item{items.length !== 1 || nextCursor ? 's' : ''}
+      </Text>
 
       {/* List */}
-      {filtered.length === 0
+      {items.length === 0
         ? <EmptyState icon="🔍" message="No matching work items." />
         : (
           <FlatList
-            data={filtered}
+            data={items}
             keyExtractor={i => String(i.id)}
             renderItem={({ item }) => (
               <WorkItemRow
@@ -169,6 +198,9 @@ export default function WorkItemsScreen() {
               />
             )}
             ItemSeparatorComponent={() => <View style={styles.sep} />}
+            onEndReached={loadMore}
+            onEndReachedThreshold={0.5}
+            ListFooterComponent={loadingMore ? <Spinner style={styles.moreSpinner} /> : null}
             refreshControl={<RefreshControl refreshing={refreshing} onRefresh={() => load(true)} tintColor={COLORS.accent} />}
           />
         )
@@ -212,6 +244,7 @@ const styles = StyleSheet.create({
   chipTextActive:{ color: COLORS.accent, fontWeight: TYPOGRAPHY.weightSemibold },
 
   countText: { color: COLORS.textMuted, fontSize: TYPOGRAPHY.sizeXs, padding: SPACING.sm, paddingLeft: SPACING.md },
+  moreSpinner: { paddingVertical: SPACING.md },
 
   // Row
   row: {
@@ -45,7 +45,8 @@ async function request(method, path, body, isFormData = false) {
 
 // ── Work Items ────────────────────────────────────────────────────────────────
 /**
- * @param {{ type?, state?, assigned_to?, sprint?, search? }} filters
+ * @param {{ type?, state?, assigned_to?, sprint?, search?, fields? }} filters
+ *   fields: "mobile" (or "board" / "backlog", or a comma-separated field list)
  */
 export function getWorkItems(filters = {}) {
   const qs = new URLSearchParams(
@@ -54,6 +55,30 @@ export function getWorkItems(filters = {}) {
   return request('GET', `/workitems${qs ? '?' + qs : ''}`);
 }
 
+/**
+ * One page of work items, sorted server-side.
+ * @param {{ work_item_type?, state?, assigned_to?, sprint?, search?, fields?, sort?, limit?, cursor? }} options
+ * @returns {Promise<{ items: object[], nextCursor: string|null }>}
+ */
+export async function getWorkItemsPage({ limit = 100, ...options } = {}) {
+  const qs = new URLSearchParams(
+    Object.fromEntries(
+      Object.entries({ ...options, limit }).filter(([, v]) => v != null && v !== '')
+    )
+  ).toString();
+  const resp = await fetch(`${BASE_URL}/workitems?${qs}`);
+  const data = await resp.json().catch(() => null);
+  if (!resp.ok) {
+    throw new Error(data?.detail || data?.error || `HTTP ${resp.status}`);
+  }
+  return { items: data, nextCursor: resp.headers.get('X-Next-Cursor') };
+}
+
+/** Every field of one work item (the list presets return only a few). */
+export function getWorkItem(taskId) {
+  return request('GET', `/workitems/${taskId}`);
+}
+
 export function createWorkItem(payload) {
   return request('POST', '/workitems', payload);
 }
@@ -77,8 +102,9 @@ export function getTaskUpdates(taskId) {
 
 // ── Reports ───────────────────────────────────────────────────────────────────
 export function getDailyReport()   { return request('GET', '/reports/daily');   }
-export function getWeeklyReport()  { return request('GET', '/reports/weekly');  }
+export function getWeeklyReport()  { return request('GET', '/reports/weekly?include_summaries=false');  }
 export function getMonthlyReport() { return request('GET', '/reports/monthly'); }
+export function getCumulativeFlow(bucket = 'week') { return request('GET', `/reports/cfd?bucket=${bucket}`); }
 
 // ── Import (file upload) ──────────────────────────────────────────────────────
 /**
@@ -91,5 +117,16 @@ export async function uploadAdoDump(file) {
     name: file.name,
     type: file.mimeType || 'application/octet-stream',
   });
-  return request('POST', '/import', formData, true);
+  // The backend answers with a background job; poll it until it finishes
+  let job = await request('POST', '/import', formData, true);
+  while (job.state === 'queued' || job.state === 'running') {
+    await new Promise(resolve => setTimeout(resolve, 1000));
+    job = await getImportJob(job.job_id);
+  }
+  if (job.state === 'failed') throw new Error(job.errors?.[0] || 'Import failed');
+  return job;
+}
+
+export function getImportJob(jobId) {
+  return request('GET', `/import/jobs/${jobId}`);
 }